@@ -16,13 +16,88 @@ Notes:
 """
 
 from abc import ABC, abstractmethod
+import hashlib
+import multiprocessing
 import os
-from typing import Dict, Optional, List
+import queue
+import shlex
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from itertools import chain
+from typing import Dict, Optional, List, Iterator
 from dotenv import load_dotenv
 import pandas as pd
+from tqdm import tqdm
+
+from src.database.csv_dataset import CsvDataset, file_fingerprint
+from src.database.load_phases import LoadPhases
+from src.database.table_schema import TableSchema
+from src.database.result_fingerprint import ResultFingerprint
+from src.database.query_template import BoundQuery
 
 load_dotenv()
 
+
+def _parallel_load_worker(loader_cls, connector_cls, index: int, nom_table: str,
+                          mode: str, batch_size: int, tasks, reports, decision) -> None:
+    """
+    Processus d'écriture du chargement parallèle.
+
+    Le processus ouvre sa propre connexion (nouvelle instance du connecteur),
+    écrit les plages de lignes reçues sur ``tasks`` dans une transaction unique,
+    signale ``ready`` puis attend la décision du coordinateur (``commit`` ou
+    ``rollback``) avant de valider ou d'annuler sa transaction. Le compte rendu
+    final transmet les durées de ses phases (voir LoadPhases).
+
+    Args:
+        loader_cls (type): Classe concrète de DatabaseLoader
+        connector_cls (type): Classe concrète de DatabaseConnector
+        index (int): Numéro du processus
+        nom_table (str): Table de destination
+        mode (str): Mode de chargement
+        batch_size (int): Nombre de lignes par lot
+        tasks: File des plages ``(première ligne, morceau)``, None pour terminer
+        reports: File des comptes rendus envoyés au coordinateur
+        decision: File de la décision de validation propre à ce processus
+    """
+    loader = loader_cls(connector_cls())
+    session = None
+    rows, chunks, write_time = 0, 0, 0.0
+    try:
+        session = loader._open_session()
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            _, chunk = task
+            start = time.perf_counter()
+            loader._write_chunk(session, nom_table, chunk, mode, batch_size)
+            write_time += time.perf_counter() - start
+            rows += len(chunk)
+            chunks += 1
+    except Exception as e:
+        if session is not None:
+            loader._rollback(session)
+            loader._close_session(session)
+        reports.put(('error', index, f"{type(e).__name__}: {e}"))
+        return
+
+    reports.put(('ready', index, rows, chunks, write_time))
+    try:
+        if decision.get() == 'commit':
+            with loader.phases.span('commit'):
+                loader._commit(session)
+        else:
+            loader._rollback(session)
+        reports.put(('done', index, None, loader.phases.raw()))
+    except Exception as e:
+        reports.put(('done', index, f"{type(e).__name__}: {e}", loader.phases.raw()))
+    finally:
+        loader._close_session(session)
+
+
 class DatabaseConnector(ABC):
     """
     Classe abstraite définissant l'interface pour les connecteurs de bases de données.
@@ -30,6 +105,15 @@ class DatabaseConnector(ABC):
     Cette classe fournit la structure de base pour gérer les connexions aux différentes
     bases de données (PostgreSQL, MonetDB, etc.).
 
+    En plus de la connexion principale (``get_connection``), utilisée par les
+    chargeurs et les opérations d'administration, le connecteur gère un pool
+    borné de sessions pour l'exécution des requêtes (``session``) : les
+    sessions inactives sont réutilisées, vérifiées avant emprunt (pre-ping)
+    et renouvelées au-delà de ``recycle`` secondes. Avec ``pinned``, chaque
+    thread garde la même session d'un emprunt à l'autre. Le temps d'attente
+    d'une session libre et le temps d'ouverture d'une nouvelle connexion sont
+    mesurés à chaque emprunt.
+
     Attributes:
         user (str): Nom d'utilisateur pour la connexion
         password (str): Mot de passe pour la connexion
@@ -37,17 +121,34 @@ class DatabaseConnector(ABC):
         database (str): Nom de la base de données
         port (int): Port de connexion
         connection: Objet de connexion à la base de données
+        pool_size (int): Nombre maximal de sessions ouvertes simultanément
+        pre_ping (bool): Vérifie une session inactive avant de la prêter
+        pinned (bool): Attache durablement une session à chaque thread
+        recycle (float): Âge maximal d'une session en secondes (None : illimité)
+        POOL_SIZE (int): Taille du pool par défaut
+        POOL_TIMEOUT (float): Attente maximale d'une session libre (s)
 
     Methods:
         _load_env_vars(): Charge les variables d'environnement
         connect(): Établit la connexion à la base de données
         get_connection(): Retourne la connexion active
+        session(): Emprunte une session au pool
     """
 
-    def __init__(self):
+    POOL_SIZE = 8
+    POOL_TIMEOUT = 30.0
+
+    def __init__(self, pool_size: Optional[int] = None, pre_ping: bool = True,
+                 pinned: bool = False, recycle: Optional[float] = None):
         """
         Initialise les attributs de connexion à None et charge les variables
         d'environnement.
+
+        Args:
+            pool_size (int, optional): Sessions ouvertes au plus (défaut : POOL_SIZE)
+            pre_ping (bool, optional): Vérifie une session inactive avant de la prêter
+            pinned (bool, optional): Attache durablement une session à chaque thread
+            recycle (float, optional): Âge maximal d'une session en secondes
         """
         self.user: Optional[str] = None
         self.password: Optional[str] = None
@@ -55,7 +156,172 @@ class DatabaseConnector(ABC):
         self.database: Optional[str] = None
         self.port: Optional[int] = None
         self.connection = None
+        self.pool_size = pool_size or self.POOL_SIZE
+        self.pre_ping = pre_ping
+        self.pinned = pinned
+        self.recycle = recycle
+        self._pool_lock = threading.Lock()
+        self._pool_slots = threading.BoundedSemaphore(self.pool_size)
+        self._pool_idle = []  # (session, instant d'ouverture)
+        self._pinned = threading.local()
         self._load_env_vars()
+
+    @contextmanager
+    def session(self) -> Iterator[tuple]:
+        """
+        Emprunte une session au pool pour la durée du bloc.
+
+        La session est remise à zéro (``_pool_reset``) à la restitution ; si
+        le bloc lève une exception, elle est fermée plutôt que réutilisée.
+        Une session attachée à un thread (``pinned``) reste hors du pool
+        jusqu'à ``reset_pool`` ou jusqu'à une erreur.
+
+        Yields:
+            tuple: Session et mesures de l'emprunt
+                (session, {'pool_wait_time': float,  # Attente d'une place en ms
+                           'connect_time': float})   # Ouverture ou vérification en ms
+
+        Raises:
+            TimeoutError: Si aucune session ne se libère en POOL_TIMEOUT secondes
+        """
+        entry = getattr(self._pinned, 'entry', None) if self.pinned else None
+        if entry is not None:
+            stats = {'pool_wait_time': 0.0, 'connect_time': 0.0}
+        else:
+            start_ns = time.perf_counter_ns()
+            if not self._pool_slots.acquire(timeout=self.POOL_TIMEOUT):
+                raise TimeoutError(f"Aucune session libre après {self.POOL_TIMEOUT} s "
+                                   f"(pool de {self.pool_size})")
+            acquired_ns = time.perf_counter_ns()
+            try:
+                entry = self._checkout()
+            except Exception:
+                self._pool_slots.release()
+                raise
+            stats = {'pool_wait_time': (acquired_ns - start_ns) / 1e6,
+                     'connect_time': (time.perf_counter_ns() - acquired_ns) / 1e6}
+            if self.pinned:
+                self._pinned.entry = entry
+
+        broken = True
+        try:
+            yield entry[0], stats
+            broken = False
+        finally:
+            if not self.pinned:
+                self._checkin(entry, broken)
+            else:
+                if not broken:
+                    try:
+                        self._pool_reset(entry[0])
+                    except Exception:
+                        broken = True
+                if broken:
+                    # Une session attachée en erreur est fermée et sa place libérée
+                    self._pinned.entry = None
+                    self._discard(entry[0])
+                    self._pool_slots.release()
+
+    def _checkout(self) -> tuple:
+        """
+        Retourne une session inactive valide, ou en ouvre une nouvelle.
+
+        Returns:
+            tuple: (session, instant d'ouverture)
+        """
+        while True:
+            with self._pool_lock:
+                entry = self._pool_idle.pop() if self._pool_idle else None
+            if entry is None:
+                return self._pool_connect(), time.monotonic()
+            expired = self.recycle is not None and time.monotonic() - entry[1] > self.recycle
+            if not expired and (not self.pre_ping or self._ping(entry[0])):
+                return entry
+            self._discard(entry[0])
+
+    def _checkin(self, entry: tuple, broken: bool) -> None:
+        """
+        Restitue une session au pool et libère sa place.
+
+        Args:
+            entry (tuple): (session, instant d'ouverture)
+            broken (bool): True si la session doit être fermée
+        """
+        try:
+            if not broken:
+                try:
+                    self._pool_reset(entry[0])
+                except Exception:
+                    broken = True
+            if broken:
+                self._discard(entry[0])
+            else:
+                with self._pool_lock:
+                    self._pool_idle.append(entry)
+        finally:
+            self._pool_slots.release()
+
+    def _ping(self, session) -> bool:
+        try:
+            self._pool_ping(session)
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, session) -> None:
+        try:
+            self._pool_close(session)
+        except Exception:
+            pass
+
+    def reset_pool(self) -> None:
+        """
+        Ferme toutes les sessions inactives (après un redémarrage du serveur).
+
+        Les sessions attachées à un thread (``pinned``) sont elles aussi
+        abandonnées ; celles en cours d'emprunt seront vérifiées à leur
+        prochaine utilisation par le pre-ping.
+        """
+        with self._pool_lock:
+            idle, self._pool_idle = self._pool_idle, []
+        for session, _ in idle:
+            self._discard(session)
+        entry = getattr(self._pinned, 'entry', None)
+        if entry is not None:
+            self._discard(entry[0])
+            self._pinned.entry = None
+            self._pool_slots.release()
+
+    @abstractmethod
+    def _pool_connect(self):
+        """
+        Ouvre une nouvelle session du pool.
+
+        Returns:
+            Session propre au SGBD
+        """
+        pass
+
+    @abstractmethod
+    def _pool_ping(self, session) -> None:
+        """
+        Vérifie qu'une session répond (lève une exception sinon).
+        """
+        pass
+
+    @abstractmethod
+    def _pool_reset(self, session) -> None:
+        """
+        Annule la transaction éventuellement ouverte avant de remettre la session au pool.
+        """
+        pass
+
+    @abstractmethod
+    def _pool_close(self, session) -> None:
+        """
+        Ferme une session.
+        """
+        pass
     
     @abstractmethod
     def _load_env_vars(self) -> None:
@@ -98,16 +364,53 @@ class DatabaseLoader(ABC):
     Classe abstraite définissant l'interface pour les chargeurs de données.
     
     Cette classe fournit la structure de base pour charger des données dans
-    différentes bases de données.
+    différentes bases de données. Le chargement est réalisé en flux : le CSV
+    est lu par morceaux de ``CHUNK_SIZE`` lignes dans un thread dédié, chaque
+    morceau est nettoyé puis transmis à l'écrivain du SGBD dès qu'il est prêt.
+    La mémoire consommée reste ainsi bornée quelle que soit la taille du
+    fichier, et la lecture du morceau suivant se fait pendant l'insertion.
+    Les morceaux peuvent aussi être répartis entre plusieurs processus
+    d'écriture, chacun avec sa propre connexion.
 
     Attributes:
         connector (DatabaseConnector): Connecteur à la base de données
+        phases (LoadPhases): Durées par phase du dernier chargement
+        LABEL (str): Libellé affiché pendant le chargement
+        LOAD_MODES (tuple): Modes de chargement supportés (le premier est le mode par défaut)
+        SQL_TYPES (dict): Type SQL de chaque type logique de TableSchema
+        CHUNK_SIZE (int): Nombre de lignes lues par morceau
+        PREFETCH (int): Nombre de morceaux lus à l'avance
+        WORKERS (int): Nombre de processus d'écriture par défaut
+        FINGERPRINT_TABLE (str): Table des empreintes des chargements incrémentaux
 
     Methods:
         clean_column_names(df): Nettoie les noms des colonnes d'un DataFrame
+        normalize_chunk(chunk, reference): Harmonise les types et valeurs manquantes
+        read_csv_chunks(): Lit et nettoie un CSV morceau par morceau
+        stream_csv(): Lit les morceaux en arrière-plan avec une file bornée
+        create_table_sql(nom_table, schema): Traduit un schéma déduit en CREATE TABLE
         load_csv(): Charge un fichier CSV dans la base de données
+        apply_physical_design(): Collecte les statistiques et construit les index déclarés
     """
 
+    LABEL = 'Base de données'
+    LOAD_MODES = ()
+    SQL_TYPES = {
+        'boolean': 'BOOLEAN',
+        'smallint': 'SMALLINT',
+        'integer': 'INTEGER',
+        'bigint': 'BIGINT',
+        'double': 'DOUBLE PRECISION',
+        'date': 'DATE',
+        'timestamp': 'TIMESTAMP',
+        'varchar': 'VARCHAR({length})',
+        'text': 'TEXT',
+    }
+    CHUNK_SIZE = 100000
+    PREFETCH = 2
+    WORKERS = 1
+    FINGERPRINT_TABLE = 'load_fingerprints'
+
     def __init__(self, connector: DatabaseConnector):
         """
         Initialise le chargeur avec un connecteur de base de données.
@@ -116,6 +419,7 @@ class DatabaseLoader(ABC):
             connector (DatabaseConnector): Instance d'un connecteur de base de données
         """
         self.connector = connector
+        self.phases = LoadPhases()
     
     def clean_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -143,38 +447,905 @@ class DatabaseLoader(ABC):
         df.columns = [col.strip().replace(' ', '_').replace('-', '_').lower() 
                      for col in df.columns]
         return df
-    
+
+    def normalize_chunk(self, chunk: pd.DataFrame,
+                        reference: Optional[pd.Series] = None,
+                        date_formats: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """
+        Harmonise les types et les valeurs manquantes d'un morceau de CSV.
+
+        pandas infère les types morceau par morceau : une colonne entière sans
+        valeur manquante dans le premier morceau peut devenir flottante dans un
+        morceau suivant. Le premier morceau fixe donc les types de référence
+        (entiers et booléens convertis en types nullables, colonnes entièrement
+        vides traitées comme du texte) et les morceaux suivants y sont convertis.
+        Les colonnes de dates reconnues sur le premier morceau (voir
+        ``TableSchema.date_formats``) sont converties en horodatages dans
+        chaque morceau. Les valeurs manquantes des colonnes texte sont
+        remplacées par None.
+
+        Args:
+            chunk (pd.DataFrame): Morceau dont les noms de colonnes sont nettoyés
+            reference (pd.Series, optional): Types de référence (``dtypes`` du
+                premier morceau normalisé). None pour le premier morceau.
+            date_formats (Dict[str, str], optional): Format de chaque colonne de dates
+
+        Returns:
+            pd.DataFrame: Morceau normalisé
+
+        Raises:
+            ValueError: Si une colonne n'est pas convertible vers son type de
+                référence ou si une date ne respecte pas le format reconnu
+        """
+        date_formats = date_formats or {}
+        for col in chunk.columns:
+            series = chunk[col]
+            if col in date_formats:
+                try:
+                    series = pd.to_datetime(series, format=date_formats[col])
+                except (TypeError, ValueError) as e:
+                    raise ValueError(
+                        f"Colonne {col} : date ne respectant pas le format "
+                        f"{date_formats[col]} reconnu sur le premier morceau ({e})"
+                    ) from e
+            elif reference is None:
+                if pd.api.types.is_bool_dtype(series.dtype):
+                    series = series.astype('boolean')
+                elif pd.api.types.is_integer_dtype(series.dtype):
+                    series = series.astype('Int64')
+                elif series.isna().all():
+                    series = series.astype(object)
+            elif series.dtype != reference[col]:
+                try:
+                    series = series.astype(reference[col])
+                except (TypeError, ValueError) as e:
+                    raise ValueError(
+                        f"Colonne {col} : type {series.dtype} incompatible avec le type "
+                        f"{reference[col]} déduit du premier morceau ({e})"
+                    ) from e
+            if series.dtype == object:
+                series = series.where(series.notna(), None)
+            chunk[col] = series
+        return chunk
+
+    def read_csv_chunks(self, chemin_csv: str, separateur: str = ',',
+                        chunksize: Optional[int] = None,
+                        phases: Optional[LoadPhases] = None) -> Iterator[pd.DataFrame]:
+        """
+        Lit un fichier CSV morceau par morceau et nettoie chaque morceau.
+
+        Args:
+            chemin_csv (str): Chemin vers le fichier CSV
+            separateur (str, optional): Séparateur utilisé dans le fichier CSV
+            chunksize (int, optional): Lignes par morceau (défaut : CHUNK_SIZE)
+            phases (LoadPhases, optional): Mesures des phases 'parse' et 'clean'
+                (défaut : celles du chargement en cours)
+
+        Yields:
+            pd.DataFrame: Morceaux nettoyés et normalisés
+        """
+        phases = phases or self.phases
+        reference, date_formats = None, None
+        with pd.read_csv(chemin_csv, sep=separateur,
+                         chunksize=chunksize or self.CHUNK_SIZE) as reader:
+            while True:
+                start = time.perf_counter_ns()
+                chunk = next(reader, None)
+                if chunk is None:
+                    break
+                phases.add('parse', time.perf_counter_ns() - start, len(chunk))
+                with phases.span('clean', len(chunk), LoadPhases.nbytes(chunk)):
+                    chunk = self.clean_column_names(chunk)
+                    if date_formats is None:
+                        date_formats = TableSchema.date_formats(chunk)
+                    chunk = self.normalize_chunk(chunk, reference, date_formats)
+                if reference is None:
+                    reference = chunk.dtypes
+                yield chunk
+        phases.add('parse', 0, nbytes=os.path.getsize(chemin_csv))
+
+    def stream_csv(self, chemin_csv: str, separateur: str = ',',
+                   chunksize: Optional[int] = None,
+                   prefetch: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Lit le CSV dans un thread producteur et restitue les morceaux au fil de l'eau.
+
+        La file entre le producteur et le consommateur est bornée à ``prefetch``
+        morceaux : au plus ``prefetch + 2`` morceaux sont en mémoire (en file,
+        en cours de lecture et en cours d'insertion). Les erreurs du producteur
+        sont relancées côté consommateur.
+
+        Args:
+            chemin_csv (str): Chemin vers le fichier CSV
+            separateur (str, optional): Séparateur utilisé dans le fichier CSV
+            chunksize (int, optional): Lignes par morceau (défaut : CHUNK_SIZE)
+            prefetch (int, optional): Morceaux lus à l'avance (défaut : PREFETCH)
+
+        Yields:
+            pd.DataFrame: Morceaux nettoyés et normalisés, dans l'ordre du fichier
+        """
+        chunks = queue.Queue(maxsize=prefetch or self.PREFETCH)
+        end = object()
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for chunk in self.read_csv_chunks(chemin_csv, separateur, chunksize):
+                    if not put(chunk):
+                        return
+                put(end)
+            except BaseException as e:
+                put(e)
+
+        producer = threading.Thread(target=produce, name='csv-reader', daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = chunks.get()
+                if item is end:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+
+    @abstractmethod
+    def _drop_table(self, nom_table: str) -> None:
+        """
+        Supprime la table si elle existe.
+
+        Args:
+            nom_table (str): Nom de la table à supprimer
+        """
+        pass
+
+    def create_table_sql(self, nom_table: str, schema: TableSchema) -> str:
+        """
+        Construit l'instruction CREATE TABLE correspondant au schéma déduit.
+
+        Args:
+            nom_table (str): Nom de la table à créer
+            schema (TableSchema): Schéma déduit des données
+
+        Returns:
+            str: Instruction CREATE TABLE dans le dialecte du SGBD (SQL_TYPES)
+        """
+        columns = ', '.join(
+            f'"{column.name}" ' + self.SQL_TYPES[column.kind].format(length=column.length)
+            for column in schema.columns
+        )
+        return f'CREATE TABLE "{nom_table}" ({columns})'
+
+    @abstractmethod
+    def _create_table(self, nom_table: str, schema: TableSchema) -> None:
+        """
+        Crée la table à partir du schéma déduit des données.
+
+        Args:
+            nom_table (str): Nom de la table à créer
+            schema (TableSchema): Schéma déduit des données
+        """
+        pass
+
+    @abstractmethod
+    def _open_session(self):
+        """
+        Ouvre une session d'écriture transactionnelle.
+
+        Returns:
+            Objet de session spécifique au SGBD, passé à ``_write_chunk``,
+            ``_commit``, ``_rollback`` et ``_close_session``
+        """
+        pass
+
+    @abstractmethod
+    def _write_chunk(self, session, nom_table: str, chunk: pd.DataFrame,
+                     mode: str, batch_size: int) -> None:
+        """
+        Écrit un morceau dans la table avec le mode de chargement demandé.
+
+        Args:
+            session: Session ouverte par ``_open_session``
+            nom_table (str): Table de destination
+            chunk (pd.DataFrame): Morceau normalisé
+            mode (str): Mode de chargement (voir LOAD_MODES)
+            batch_size (int): Nombre de lignes par lot
+        """
+        pass
+
+    def _commit(self, session) -> None:
+        """Valide la transaction de la session."""
+        session.commit()
+
+    def _rollback(self, session) -> None:
+        """Annule la transaction de la session."""
+        session.rollback()
+
+    def _close_session(self, session) -> None:
+        """Libère les ressources de la session (aucune par défaut)."""
+        pass
+
+    def _check_mode(self, mode: Optional[str]) -> str:
+        """
+        Valide le mode de chargement demandé.
+
+        Args:
+            mode (str, optional): Mode demandé, None pour le mode par défaut
+
+        Returns:
+            str: Mode de chargement validé
+
+        Raises:
+            ValueError: Si le mode de chargement n'est pas supporté
+        """
+        if mode is None:
+            return self.LOAD_MODES[0]
+        if mode not in self.LOAD_MODES:
+            raise ValueError(f"Mode de chargement inconnu pour {self.LABEL} : {mode} "
+                             f"(attendu : {', '.join(self.LOAD_MODES)})")
+        return mode
+
+    def _check_workers(self, workers: Optional[int]) -> int:
+        """
+        Valide le nombre de processus d'écriture demandé.
+
+        Args:
+            workers (int, optional): Nombre demandé, None pour WORKERS
+
+        Returns:
+            int: Nombre de processus validé
+
+        Raises:
+            ValueError: Si le nombre de processus est inférieur à 1
+        """
+        workers = self.WORKERS if workers is None else workers
+        if workers < 1:
+            raise ValueError(f"Le nombre de processus d'écriture doit être positif : {workers}")
+        return workers
+
+    def _load_sequential(self, nom_table: str, chunks: Iterator[pd.DataFrame],
+                         mode: str, batch_size: int, pbar: tqdm) -> List[Dict]:
+        """
+        Écrit tous les morceaux sur la connexion du chargeur, dans une transaction.
+
+        Args:
+            nom_table (str): Table de destination
+            chunks (Iterator[pd.DataFrame]): Morceaux normalisés
+            mode (str): Mode de chargement
+            batch_size (int): Nombre de lignes par lot
+            pbar (tqdm): Barre de progression à mettre à jour
+
+        Returns:
+            List[Dict]: Statistiques de l'unique écrivain (voir ``load_csv``)
+        """
+        rows, count, write_time = 0, 0, 0.0
+        session = self._open_session()
+        try:
+            for chunk in chunks:
+                start = time.perf_counter()
+                self._write_chunk(session, nom_table, chunk, mode, batch_size)
+                write_time += time.perf_counter() - start
+                rows += len(chunk)
+                count += 1
+                pbar.update(len(chunk))
+            with self.phases.span('commit'):
+                self._commit(session)
+        except Exception:
+            self._rollback(session)
+            raise
+        finally:
+            self._close_session(session)
+        return [self._worker_stats(0, rows, count, write_time)]
+
+    def _load_parallel(self, nom_table: str, chunks: Iterator[pd.DataFrame],
+                       mode: str, batch_size: int, workers: int, pbar: tqdm) -> List[Dict]:
+        """
+        Répartit les morceaux entre ``workers`` processus ayant chacun leur connexion.
+
+        Chaque morceau est une plage de lignes contiguës du fichier ; les plages
+        sont distribuées par une file bornée partagée, si bien qu'un processus
+        plus rapide prend davantage de plages. La validation est coordonnée :
+        aucun processus ne valide sa transaction avant que tous aient écrit leurs
+        plages sans erreur ; sinon toutes les transactions sont annulées.
+
+        Args:
+            nom_table (str): Table de destination (déjà créée)
+            chunks (Iterator[pd.DataFrame]): Morceaux normalisés
+            mode (str): Mode de chargement
+            batch_size (int): Nombre de lignes par lot
+            workers (int): Nombre de processus d'écriture
+            pbar (tqdm): Barre de progression à mettre à jour
+
+        Returns:
+            List[Dict]: Statistiques par processus (voir ``load_csv``)
+
+        Raises:
+            RuntimeError: Si un processus échoue à écrire ou à valider
+        """
+        context = multiprocessing.get_context()
+        tasks = context.Queue(maxsize=workers * self.PREFETCH)
+        reports = context.Queue()
+        decisions = [context.Queue() for _ in range(workers)]
+        processes = [
+            context.Process(
+                target=_parallel_load_worker,
+                args=(type(self), type(self.connector), index, nom_table, mode,
+                      batch_size, tasks, reports, decisions[index]),
+                name=f'loader-{index}', daemon=True)
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        ready, errors = {}, {}
+
+        def collect(block: bool) -> None:
+            try:
+                report = reports.get(timeout=0.1 if block else 0)
+            except queue.Empty:
+                for index, process in enumerate(processes):
+                    if (not process.is_alive() and index not in ready
+                            and index not in errors):
+                        errors[index] = f"processus terminé (code {process.exitcode})"
+                return
+            if report[0] == 'ready':
+                ready[report[1]] = report[2:]
+            else:
+                errors[report[1]] = report[2]
+
+        def dispatch(item) -> bool:
+            while not errors:
+                try:
+                    tasks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    collect(block=False)
+            return False
+
+        try:
+            first_row = 0
+            for chunk in chunks:
+                if not dispatch((first_row, chunk)):
+                    break
+                first_row += len(chunk)
+                pbar.update(len(chunk))
+            for _ in processes:
+                while any(process.is_alive() for process in processes):
+                    try:
+                        tasks.put(None, timeout=0.1)
+                        break
+                    except queue.Full:
+                        collect(block=False)
+            while len(ready) + len(errors) < workers:
+                collect(block=True)
+
+            decision = 'rollback' if errors else 'commit'
+            for index in ready:
+                decisions[index].put(decision)
+            pending = set(ready)
+            while pending:
+                try:
+                    _, index, error, phases = reports.get(timeout=0.1)
+                except queue.Empty:
+                    for index in [i for i in pending if not processes[i].is_alive()]:
+                        pending.discard(index)
+                        errors[index] = f"processus terminé (code {processes[index].exitcode})"
+                    continue
+                pending.discard(index)
+                self.phases.merge(phases)
+                if error:
+                    errors[index] = error
+        finally:
+            tasks.cancel_join_thread()
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+        if errors:
+            details = '; '.join(f"processus {index} : {error}"
+                                for index, error in sorted(errors.items()))
+            raise RuntimeError(f"Échec du chargement parallèle de {nom_table} ({details})")
+
+        return [self._worker_stats(index, *ready[index]) for index in sorted(ready)]
+
+    @staticmethod
+    def _worker_stats(index: int, rows: int, chunks: int, write_time: float) -> Dict:
+        """
+        Met en forme les statistiques d'un écrivain.
+
+        Args:
+            index (int): Numéro de l'écrivain
+            rows (int): Lignes écrites
+            chunks (int): Plages de lignes (morceaux) écrites
+            write_time (float): Temps passé à écrire, en secondes
+
+        Returns:
+            Dict: Statistiques de l'écrivain (voir ``load_csv``)
+        """
+        return {
+            'worker': index,
+            'rows': rows,
+            'chunks': chunks,
+            'write_time': write_time,
+            'rows_per_second': rows / write_time if write_time else 0.0
+        }
+
     @abstractmethod
+    def _execute_sql(self, sql: str, params: tuple = ()) -> Optional[list]:
+        """
+        Exécute une instruction paramétrée (style ``%s``) dans sa propre transaction.
+
+        Args:
+            sql (str): Instruction SQL
+            params (tuple, optional): Paramètres de l'instruction
+
+        Returns:
+            list: Lignes du résultat, None si l'instruction n'en renvoie pas
+        """
+        pass
+
+    def _ensure_fingerprint_table(self) -> None:
+        """Crée la table des empreintes de chargement si elle n'existe pas."""
+        self._execute_sql(
+            f"CREATE TABLE IF NOT EXISTS {self.FINGERPRINT_TABLE} ("
+            "table_name VARCHAR(128) PRIMARY KEY, content_hash VARCHAR(32), "
+            "content_size BIGINT, schema_hash VARCHAR(32), load_mode VARCHAR(32), "
+            "total_rows BIGINT)"
+        )
+
+    def _read_fingerprint(self, nom_table: str) -> Optional[Dict]:
+        """
+        Lit l'empreinte enregistrée au dernier chargement de la table.
+
+        Args:
+            nom_table (str): Nom de la table
+
+        Returns:
+            Dict: Empreinte (content_hash, content_size, schema_hash, load_mode,
+                total_rows), None si la table n'a pas d'empreinte
+        """
+        rows = self._execute_sql(
+            "SELECT content_hash, content_size, schema_hash, load_mode, total_rows "
+            f"FROM {self.FINGERPRINT_TABLE} WHERE table_name = %s", (nom_table,))
+        if not rows:
+            return None
+        keys = ('content_hash', 'content_size', 'schema_hash', 'load_mode', 'total_rows')
+        return dict(zip(keys, rows[0]))
+
+    def _delete_fingerprint(self, nom_table: str) -> None:
+        """
+        Invalide l'empreinte de la table avant de modifier son contenu.
+
+        Args:
+            nom_table (str): Nom de la table
+        """
+        self._execute_sql(f"DELETE FROM {self.FINGERPRINT_TABLE} WHERE table_name = %s",
+                          (nom_table,))
+
+    def _save_fingerprint(self, nom_table: str, fingerprint: Dict) -> None:
+        """
+        Enregistre l'empreinte de la table après un chargement réussi.
+
+        Args:
+            nom_table (str): Nom de la table
+            fingerprint (Dict): Empreinte (voir ``_read_fingerprint``)
+        """
+        self._delete_fingerprint(nom_table)
+        self._execute_sql(
+            f"INSERT INTO {self.FINGERPRINT_TABLE} (table_name, content_hash, content_size, "
+            "schema_hash, load_mode, total_rows) VALUES (%s, %s, %s, %s, %s, %s)",
+            (nom_table, fingerprint['content_hash'], fingerprint['content_size'],
+             fingerprint['schema_hash'], fingerprint['load_mode'], fingerprint['total_rows']))
+
+    @staticmethod
+    def _ends_with_newline(chemin_csv: str, size: int) -> bool:
+        """
+        Vérifie que les ``size`` premiers octets du fichier se terminent par une fin de ligne.
+
+        Un fichier complété n'est chargé en ajout que si l'ancien contenu se
+        terminait par une ligne complète : sinon la dernière ligne a changé.
+
+        Args:
+            chemin_csv (str): Chemin vers le fichier CSV
+            size (int): Taille de l'ancien contenu en octets
+
+        Returns:
+            bool: True si l'octet ``size - 1`` est un retour à la ligne
+        """
+        with open(chemin_csv, 'rb') as f:
+            f.seek(size - 1)
+            return f.read(1) == b'\n'
+
+    @staticmethod
+    def _skip_rows(chunks: Iterator[pd.DataFrame], count: int) -> Iterator[pd.DataFrame]:
+        """
+        Ignore les ``count`` premières lignes d'une suite de morceaux.
+
+        Args:
+            chunks (Iterator[pd.DataFrame]): Morceaux dans l'ordre du fichier
+            count (int): Nombre de lignes à ignorer
+
+        Yields:
+            pd.DataFrame: Morceaux restants (le premier éventuellement tronqué)
+        """
+        for chunk in chunks:
+            if count >= len(chunk):
+                count -= len(chunk)
+                continue
+            yield chunk.iloc[count:]
+            count = 0
+
+    def _print_phases(self) -> None:
+        """Affiche la durée et le débit des phases mesurées du dernier chargement."""
+        for phase, stats in self.phases.to_dict().items():
+            if stats['time']:
+                print(f"        · {phase:<8}: {stats['time']:.2f} s "
+                      f"({stats['rows_per_second']:,.0f} lignes/s, "
+                      f"{stats['bytes_per_second'] / 1e6:,.1f} Mo/s)")
+
     def load_csv(self, chemin_csv: str, nom_table: str, separateur: str = ',', 
-                 batch_size: int = 1000) -> Dict:
+                 batch_size: int = 1000, mode: Optional[str] = None,
+                 chunksize: Optional[int] = None,
+                 workers: Optional[int] = None,
+                 dataset: Optional[CsvDataset] = None,
+                 incremental: bool = False) -> Dict:
         """
         Charge un fichier CSV dans la base de données.
+
+        La table est recréée à partir du schéma déduit (celui du jeu de données
+        partagé, ou à défaut celui du premier morceau lu), puis chaque morceau
+        est écrit dès sa lecture. Avec un seul écrivain, l'écriture se fait sur la
+        connexion du chargeur dans une transaction unique, validée à la fin. Avec
+        plusieurs, chaque morceau (plage de lignes) est confié à l'un des
+        ``workers`` processus, chacun disposant de sa propre connexion et de sa
+        propre transaction, validées ensemble (voir ``_load_parallel``).
+
+        Si un jeu de données déjà analysé est fourni (voir CsvDataset), ses
+        morceaux sont écrits directement sans relire le fichier : ``load_time``
+        ne mesure alors que l'ingestion dans le SGBD.
+
+        En mode incrémental, une empreinte de la table (contenu du CSV, schéma
+        et mode de chargement) est conservée dans la table FINGERPRINT_TABLE du
+        SGBD. Le chargement est ignoré si l'empreinte est inchangée ; si le
+        fichier ne fait que compléter celui déjà chargé (même début, lignes
+        ajoutées à la fin), seules les nouvelles lignes sont ajoutées sans
+        recréer la table. Dans les autres cas, la table est rechargée.
         
         Args:
             chemin_csv (str): Chemin vers le fichier CSV à charger
             nom_table (str): Nom de la table à créer
             separateur (str, optional): Séparateur utilisé dans le fichier CSV
             batch_size (int, optional): Nombre de lignes à insérer par lot
+            mode (str, optional): Mode de chargement (défaut : premier de LOAD_MODES)
+            chunksize (int, optional): Lignes lues par morceau (défaut : CHUNK_SIZE)
+            workers (int, optional): Processus d'écriture (défaut : WORKERS)
+            dataset (CsvDataset, optional): Jeu de données partagé (ou jeu
+                synthétique, voir SyntheticDataset) à charger à la place du
+                fichier ; ``separateur`` et ``chunksize`` sont alors ignorés
+            incremental (bool, optional): Ignore ou complète le chargement selon
+                l'empreinte enregistrée au chargement précédent
 
         Returns:
             Dict: Métriques du chargement
                 {
                     'table_name': str,      # Nom de la table créée
                     'load_time': float,     # Temps de chargement en secondes
-                    'total_rows': int       # Nombre de lignes chargées
+                    'total_rows': int,      # Nombre de lignes de la table
+                    'loaded_rows': int,     # Nombre de lignes écrites par ce chargement
+                    'load_action': str,     # 'full', 'append' ou 'skip'
+                    'mode': str,            # Mode de chargement utilisé
+                    'phases': Dict,         # Mesures par phase (voir LoadPhases.to_dict)
+                    'workers': int,         # Nombre de processus d'écriture
+                    'worker_stats': [       # Statistiques par écrivain
+                        {
+                            'worker': int,             # Numéro de l'écrivain
+                            'rows': int,               # Lignes écrites
+                            'chunks': int,             # Plages de lignes écrites
+                            'write_time': float,       # Temps d'écriture en secondes
+                            'rows_per_second': float   # Débit de l'écrivain
+                        }
+                    ]
                 }
+
+        Raises:
+            ValueError: Si le mode ou le nombre de processus n'est pas valide,
+                ou si le fichier est vide
+            RuntimeError: Si un processus du chargement parallèle échoue
+        """
+        mode = self._check_mode(mode)
+        workers = self._check_workers(workers)
+        print(f"\n{self.LABEL}: Chargement de {nom_table} (mode {mode}, "
+              f"{workers} processus)")
+
+        start_time = time.time()
+        self.phases = LoadPhases()
+
+        print("   ├─ Vérification de la table existante...")
+        with self.phases.span('ddl'):
+            self._ensure_fingerprint_table()
+            stored = self._read_fingerprint(nom_table) if incremental else None
+        if incremental:
+            content_hash, content_size, prefix_hash = file_fingerprint(
+                chemin_csv, stored['content_size'] if stored else None)
+
+        if dataset is not None:
+            print(f"   ├─ Lecture du jeu de données partagé ({dataset.chunk_count} morceaux)...")
+            chunks = dataset.iter_chunks(self.phases)
+        else:
+            print(f"   ├─ Lecture du fichier CSV (morceaux de {chunksize or self.CHUNK_SIZE:,} lignes)...")
+            chunks = self.stream_csv(chemin_csv, separateur, chunksize)
+        try:
+            first = next(chunks, None)
+            if first is None:
+                raise ValueError(f"Le fichier {chemin_csv} ne contient aucune ligne")
+
+            if dataset is not None:
+                schema = dataset.schema
+            else:
+                schema = TableSchema.infer([first], exact=False)
+            schema_hash = hashlib.blake2b(self.create_table_sql(nom_table, schema).encode(),
+                                          digest_size=16).hexdigest()
+
+            action = 'full'
+            if stored and stored['schema_hash'] == schema_hash and stored['load_mode'] == mode:
+                if stored['content_hash'] == content_hash:
+                    action = 'skip'
+                elif (stored['content_hash'] == prefix_hash
+                      and self._ends_with_newline(chemin_csv, stored['content_size'])):
+                    action = 'append'
+
+            if action == 'skip':
+                print(f"   └─ Empreinte inchangée : {stored['total_rows']:,} lignes déjà chargées")
+                return {
+                    'table_name': nom_table,
+                    'load_time': time.time() - start_time,
+                    'total_rows': stored['total_rows'],
+                    'mode': mode,
+                    'workers': workers,
+                    'worker_stats': [],
+                    'load_action': action,
+                    'loaded_rows': 0,
+                    'phases': self.phases.to_dict()
+                }
+
+            with self.phases.span('ddl'):
+                self._delete_fingerprint(nom_table)
+            rows = chain([first], chunks)
+            if action == 'append':
+                print(f"   ├─ Fichier complété : ajout après les {stored['total_rows']:,} "
+                      f"lignes déjà chargées")
+                rows = self._skip_rows(rows, stored['total_rows'])
+            else:
+                print(f"   ├─ Création de la table ({len(schema.columns)} colonnes, "
+                      f"schéma {'déduit des données' if schema.exact else 'échantillonné'})")
+                categorical = [column for column in schema.columns if column.categorical]
+                if categorical:
+                    print("   ├─ Colonnes catégorielles : " + ', '.join(
+                        f"{column.name} ({column.distinct} valeurs)" for column in categorical))
+                with self.phases.span('ddl'):
+                    self._drop_table(nom_table)
+                    self._create_table(nom_table, schema)
+
+            print("   └─ Insertion des données", end='\r')
+            with tqdm(unit='lignes', ncols=80) as pbar:
+                if workers > 1:
+                    try:
+                        worker_stats = self._load_parallel(nom_table, rows, mode, batch_size,
+                                                           workers, pbar)
+                    except Exception:
+                        if action == 'full':
+                            self._drop_table(nom_table)
+                        raise
+                else:
+                    worker_stats = self._load_sequential(nom_table, rows, mode, batch_size,
+                                                         pbar)
+        finally:
+            chunks.close()
+
+        loaded_rows = sum(stats['rows'] for stats in worker_stats)
+        total_rows = loaded_rows + (stored['total_rows'] if action == 'append' else 0)
+        print(f"\r      ✓ {loaded_rows:,} lignes insérées")
+        if workers > 1:
+            for stats in worker_stats:
+                print(f"        ├─ processus {stats['worker']} : {stats['rows']:,} lignes "
+                      f"({stats['rows_per_second']:,.0f} lignes/s)")
+
+        if incremental:
+            with self.phases.span('ddl'):
+                self._save_fingerprint(nom_table, {
+                    'content_hash': content_hash,
+                    'content_size': content_size,
+                    'schema_hash': schema_hash,
+                    'load_mode': mode,
+                    'total_rows': total_rows
+                })
+        self._print_phases()
+
+        return {
+            'table_name': nom_table,
+            'load_time': time.time() - start_time,
+            'total_rows': total_rows,
+            'mode': mode,
+            'workers': workers,
+            'worker_stats': worker_stats,
+            'load_action': action,
+            'loaded_rows': loaded_rows,
+            'phases': self.phases.to_dict()
+        }
+
+    @abstractmethod
+    def _analyze_table(self, nom_table: str) -> None:
+        """
+        Collecte les statistiques de l'optimiseur sur la table.
+
+        Args:
+            nom_table (str): Nom de la table
         """
         pass
 
+    @abstractmethod
+    def _create_index(self, nom_table: str, nom_index: str, column: str, kind: str) -> None:
+        """
+        Crée (ou recrée) un index sur une colonne.
+
+        Args:
+            nom_table (str): Nom de la table
+            nom_index (str): Nom de l'index
+            column (str): Colonne indexée
+            kind (str): Type d'index déclaré ('ordered' ou 'imprints'), traduit
+                par le SGBD en sa structure la plus proche
+        """
+        pass
+
+    @abstractmethod
+    def _index_size(self, nom_table: str, nom_index: str, column: str, kind: str) -> int:
+        """
+        Retourne la taille d'un index.
+
+        Args:
+            nom_table (str): Nom de la table
+            nom_index (str): Nom de l'index
+            column (str): Colonne indexée
+            kind (str): Type d'index déclaré
+
+        Returns:
+            int: Taille de l'index en octets
+        """
+        pass
+
+    def apply_physical_design(self, nom_table: str, design: Dict) -> Dict:
+        """
+        Applique la conception physique déclarée après le chargement d'une table.
+
+        Les statistiques de l'optimiseur sont collectées puis chaque index
+        déclaré est construit ; chaque étape est chronométrée et la taille des
+        index est relevée, afin que le coût de construction soit compté avec
+        celui du chargement.
+
+        Args:
+            nom_table (str): Nom de la table chargée
+            design (Dict): Conception physique (voir config.PHYSICAL_DESIGN)
+                {
+                    'analyze': bool,                 # Collecte des statistiques
+                    'indexes': [
+                        {
+                            'column': str,           # Colonne indexée
+                            'kind': str              # 'ordered' (défaut) ou 'imprints'
+                        }
+                    ]
+                }
+
+        Returns:
+            Dict: Métriques de la conception physique
+                {
+                    'analyze_time': float,   # Collecte des statistiques en secondes
+                    'indexes': [
+                        {
+                            'name': str,         # Nom de l'index
+                            'column': str,       # Colonne indexée
+                            'kind': str,         # Type d'index déclaré
+                            'build_time': float, # Construction en secondes
+                            'size': int          # Taille en octets
+                        }
+                    ],
+                    'total_time': float      # Durée totale en secondes
+                }
+        """
+        print(f"\n{self.LABEL}: Conception physique de {nom_table}")
+        start_time = time.perf_counter()
+        analyze_time = 0.0
+        if design.get('analyze', True):
+            self._analyze_table(nom_table)
+            analyze_time = time.perf_counter() - start_time
+            print(f"   ├─ Statistiques : {analyze_time:.2f} s")
+
+        indexes = []
+        for index in design.get('indexes', []):
+            column, kind = index['column'], index.get('kind', 'ordered')
+            nom_index = f"idx_{nom_table}_{column}"
+            build_start = time.perf_counter()
+            self._create_index(nom_table, nom_index, column, kind)
+            build_time = time.perf_counter() - build_start
+            size = self._index_size(nom_table, nom_index, column, kind)
+            indexes.append({'name': nom_index, 'column': column, 'kind': kind,
+                            'build_time': build_time, 'size': size})
+            print(f"   ├─ Index {nom_index} ({kind}) : {build_time:.2f} s, "
+                  f"{size / 1e6:,.1f} Mo")
+
+        total_time = time.perf_counter() - start_time
+        print(f"   └─ Total : {total_time:.2f} s")
+        return {
+            'analyze_time': analyze_time,
+            'indexes': indexes,
+            'total_time': total_time
+        }
+
 class QueryAnalyzer(ABC):
     """
     Classe abstraite définissant l'interface pour les analyseurs de requêtes.
     
     Cette classe fournit la structure de base pour analyser les performances
-    des requêtes SQL sur différentes bases de données.
+    des requêtes SQL sur différentes bases de données. En plus du temps mesuré
+    côté client, chaque analyseur peut relever les métriques d'exécution
+    du serveur (temps moteur, accès aux blocs, lignes traitées), ce qui permet
+    de séparer le temps du moteur de celui du pilote et du réseau.
+
+    Le temps client est lui-même découpé (horloge monotone ``perf_counter_ns``)
+    en temps d'exécution (retour de ``execute``), délai jusqu'à la première
+    ligne et temps de récupération du résultat. Deux modes de consommation
+    sont proposés :
+        - 'fetchall' : le résultat est matérialisé d'un bloc côté client
+        - 'stream' : le résultat est parcouru par lots de ``fetch_size``
+          lignes (curseur côté serveur), comptées et éventuellement hachées
+          sans être conservées en mémoire
+
+    En mode préparé (``prepared``), chaque requête est préparée une seule fois
+    par connexion puis exécutée par son nom, comme dans une application
+    utilisant des requêtes préparées. Les liaisons d'un même modèle
+    (BoundQuery) partagent une seule requête préparée, à emplacements de
+    paramètres, et seules leurs constantes sont envoyées à chaque exécution.
+    La durée de préparation est conservée à part (``prepare_times``) ; ce
+    n'est pas un temps de planification : PostgreSQL ne fait qu'analyser la
+    requête au ``PREPARE`` et la planifie à l'exécution (voir le
+    'planning_time' des métriques du serveur).
+
+    L'état des caches avant chaque mesure est contrôlé par le mode de mesure
+    (voir CACHE_MODES) : 'cold' vide les caches avant chaque itération
+    (``evict_cache``), 'warm' exécute des itérations de chauffe non mesurées
+    et 'hot' charge en plus la table en mémoire au préalable (``prewarm``).
 
     Attributes:
         connector (DatabaseConnector): Connecteur à la base de données
+        server_metrics (bool): Relève les métriques du serveur à chaque exécution
+        fetch_mode (str): Mode de consommation du résultat (voir FETCH_MODES)
+        fetch_size (int): Lignes récupérées par lot en mode 'stream'
+        hash_rows (bool): Calcule une empreinte des lignes reçues, indépendante
+            de leur ordre ('row_hash', voir ResultFingerprint)
+        restart_command (str): Commande redémarrant le serveur de test pour
+            vider ses caches en mode 'cold' (None pour lire une table tampon)
+        prepared (bool): Exécute les requêtes préparées une fois par connexion
+        prepare_times (Dict[str, float]): Dernière durée de préparation (ms) par
+            requête ou modèle préparé (voir ``statement_template``)
+        SERVER_METRICS (tuple): Métriques serveur présentes dans les résultats
+        LATENCY_METRICS (tuple): Découpage du temps client présent dans les résultats
+        FETCH_MODES (tuple): Modes de consommation supportés
+        FETCH_SIZE (int): Taille de lot par défaut en mode 'stream'
+        CACHE_MODES (tuple): Modes de mesure selon l'état des caches
+        SCRATCH_TABLE (str): Table tampon lue pour évincer les caches du serveur
+        RESTART_TIMEOUT (int): Délai maximal de reconnexion après redémarrage (s)
+        DROP_CACHES_PATH (str): Fichier du noyau vidant le cache de pages du système
 
     Methods:
         analyze_query(query): Analyse une requête SQL unique
@@ -182,14 +1353,167 @@ class QueryAnalyzer(ABC):
         format_metrics(metrics): Formate les métriques de manière uniforme
     """
 
-    def __init__(self, connector: DatabaseConnector):
+    SERVER_METRICS = (
+        'server_time',
+        'planning_time',
+        'shared_hit_blocks',
+        'shared_read_blocks',
+        'local_hit_blocks',
+        'local_read_blocks',
+        'rows_processed'
+    )
+    LATENCY_METRICS = ('execute_time', 'first_row_time', 'fetch_time',
+                       'pool_wait_time', 'connect_time')
+    FETCH_MODES = ('fetchall', 'stream')
+    FETCH_SIZE = 10000
+    CACHE_MODES = ('warm', 'cold', 'hot')
+    SCRATCH_TABLE = 'cache_scratch'
+    RESTART_TIMEOUT = 60
+    DROP_CACHES_PATH = '/proc/sys/vm/drop_caches'
+
+    def __init__(self, connector: DatabaseConnector, server_metrics: bool = True,
+                 fetch_mode: Optional[str] = None, fetch_size: Optional[int] = None,
+                 hash_rows: bool = False, restart_command: Optional[str] = None,
+                 prepared: bool = False):
         """
         Initialise l'analyseur avec un connecteur de base de données.
 
         Args:
             connector (DatabaseConnector): Instance d'un connecteur de base de données
+            server_metrics (bool, optional): Relève les métriques du serveur
+            fetch_mode (str, optional): Mode de consommation du résultat
+                (défaut : premier de FETCH_MODES)
+            fetch_size (int, optional): Lignes par lot en mode 'stream'
+                (défaut : FETCH_SIZE)
+            hash_rows (bool, optional): Calcule une empreinte des lignes reçues
+            restart_command (str, optional): Commande redémarrant le serveur
+                de test en mode 'cold' (ex. ``docker restart postgres``)
+            prepared (bool, optional): Prépare chaque requête une fois par
+                connexion et ne mesure que son exécution
+
+        Raises:
+            ValueError: Si le mode de consommation n'est pas supporté
         """
+        if fetch_mode is None:
+            fetch_mode = self.FETCH_MODES[0]
+        if fetch_mode not in self.FETCH_MODES:
+            raise ValueError(f"Mode de consommation inconnu : {fetch_mode} "
+                             f"(attendu : {', '.join(self.FETCH_MODES)})")
         self.connector = connector
+        self.server_metrics = server_metrics
+        self.fetch_mode = fetch_mode
+        self.fetch_size = fetch_size or self.FETCH_SIZE
+        self.hash_rows = hash_rows
+        self.restart_command = restart_command
+        self.prepared = prepared
+        self.prepare_times = {}
+
+    @staticmethod
+    def statement_name(query: str) -> str:
+        """
+        Nom stable de la requête préparée correspondant à une requête.
+
+        Args:
+            query (str): Requête SQL
+
+        Returns:
+            str: Nom dérivé de l'empreinte de la requête
+        """
+        return 'q_' + hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+
+    @staticmethod
+    def statement_template(query: str) -> str:
+        """
+        Requête préparée dont relève une requête.
+
+        Args:
+            query (str): Requête SQL ou liaison d'un modèle (BoundQuery)
+
+        Returns:
+            str: Texte du modèle pour une liaison, la requête elle-même sinon
+        """
+        return query.template if isinstance(query, BoundQuery) else query
+
+    @staticmethod
+    def parameterized(query: str, numbered: bool = True) -> tuple:
+        """
+        Texte à préparer et constantes à transmettre à chaque exécution.
+
+        Args:
+            query (str): Requête SQL ou liaison d'un modèle (BoundQuery)
+            numbered (bool, optional): Emplacements ``$n`` plutôt que ``?``
+                (voir BoundQuery.placeholders)
+
+        Returns:
+            tuple: Texte à préparer, constantes SQL et leurs types SQL (listes
+                vides pour une requête sans paramètre)
+        """
+        if isinstance(query, BoundQuery):
+            return query.placeholders(numbered)
+        return query, [], []
+
+    @property
+    def streaming(self) -> bool:
+        """True si le résultat est consommé par lots sans être conservé."""
+        return self.fetch_mode == 'stream'
+
+    def _consume(self, result, start_ns: int, executed_ns: int) -> Dict:
+        """
+        Parcourt le résultat d'une requête en mesurant sa récupération.
+
+        La première ligne est lue seule pour mesurer le délai jusqu'à la
+        première ligne ; le reste est lu d'un bloc (``fetchall``) ou par lots
+        de ``fetch_size`` lignes (``fetchmany``) selon le mode de consommation.
+        Les lignes ne sont conservées que le temps d'un lot. Avec ``hash_rows``,
+        chaque lot est ajouté à l'empreinte du résultat (ResultFingerprint,
+        indépendante de l'ordre des lignes) ; la durée de ce calcul est
+        retranchée des temps mesurés.
+
+        Args:
+            result: Résultat ou curseur exposant ``fetchone``, ``fetchmany``
+                et ``fetchall``, None si la requête ne renvoie pas de lignes
+            start_ns (int): Instant d'envoi de la requête (``perf_counter_ns``)
+            executed_ns (int): Instant de retour de ``execute``
+
+        Returns:
+            Dict: Temps client et lignes reçues
+                {
+                    'execution_time': float,  # Temps total en ms
+                    'execute_time': float,    # Temps jusqu'au retour d'execute en ms
+                    'first_row_time': float,  # Temps jusqu'à la première ligne en ms
+                    'fetch_time': float,      # Temps de récupération après execute en ms
+                    'row_count': int,         # Nombre de lignes reçues
+                    'row_hash': str,          # Empreinte '<lignes>:<somme>' (si hash_rows)
+                    'hash_time': float        # Calcul de l'empreinte en ms (si hash_rows)
+                }
+        """
+        fingerprint = ResultFingerprint() if self.hash_rows else None
+        hash_ns = 0
+        row_count = 0
+        first = result.fetchone() if result is not None else None
+        first_row_ns = time.perf_counter_ns()
+        batch = [first] if first is not None else []
+        while batch:
+            row_count += len(batch)
+            if fingerprint is not None:
+                hash_start_ns = time.perf_counter_ns()
+                fingerprint.update(batch)
+                hash_ns += time.perf_counter_ns() - hash_start_ns
+            batch = result.fetchmany(self.fetch_size) if self.streaming else result.fetchall()
+        # Le calcul de l'empreinte est exclu du temps de récupération
+        end_ns = time.perf_counter_ns() - hash_ns
+
+        metrics = {
+            'execution_time': (end_ns - start_ns) / 1e6,
+            'execute_time': (executed_ns - start_ns) / 1e6,
+            'first_row_time': (first_row_ns - start_ns) / 1e6,
+            'fetch_time': (end_ns - executed_ns) / 1e6,
+            'row_count': row_count
+        }
+        if fingerprint is not None:
+            metrics['row_hash'] = fingerprint.hexdigest()
+            metrics['hash_time'] = hash_ns / 1e6
+        return metrics
     
     @abstractmethod
     def analyze_query(self, query: str) -> Dict:
@@ -204,12 +1528,119 @@ class QueryAnalyzer(ABC):
                 {
                     'execution_time': float,  # Temps d'exécution en ms
                     'row_count': int,         # Nombre de lignes retournées
-                    'physical_reads': int,     # Lectures physiques
-                    'physical_writes': int     # Écritures physiques
+                    'execute_time': float,    # Temps jusqu'au retour d'execute en ms
+                    'first_row_time': float,  # Temps jusqu'à la première ligne en ms
+                    'fetch_time': float,      # Temps de récupération du résultat en ms
+                    'pool_wait_time': float,  # Attente d'une session du pool en ms
+                    'connect_time': float,    # Ouverture ou vérification de la session en ms
+                    'physical_reads': int,     # Lectures physiques (blocs)
+                    'physical_writes': int,    # Écritures physiques (blocs)
+                    'server_time': float,      # Temps d'exécution serveur en ms
+                    'planning_time': float,    # Temps de planification en ms
+                    'shared_hit_blocks': int,  # Blocs partagés trouvés en cache
+                    'shared_read_blocks': int, # Blocs partagés lus
+                    'local_hit_blocks': int,   # Blocs locaux trouvés en cache
+                    'local_read_blocks': int,  # Blocs locaux lus
+                    'rows_processed': int      # Lignes produites par les opérateurs
                 }
+
+            Les métriques serveur valent 0 lorsqu'elles sont désactivées ou
+            que le SGBD ne les fournit pas.
         """
         pass
     
+    def evict_cache(self, drop_os_cache: bool = True) -> str:
+        """
+        Vide les caches avant une mesure à froid.
+
+        Le serveur est redémarré si une commande de redémarrage est configurée ;
+        sinon, ses caches sont évincés par la lecture d'une table tampon
+        (``_evict_buffers``). Le cache de pages du système est ensuite vidé
+        lorsque les droits le permettent (conteneur privilégié ou hôte local).
+
+        Args:
+            drop_os_cache (bool, optional): Tente de vider le cache de pages du système
+
+        Returns:
+            str: Méthodes appliquées, séparées par '+' ('restart' ou 'scratch',
+                suivi de 'os' si le cache du système a été vidé)
+        """
+        if self.restart_command:
+            self._restart_server()
+            methods = ['restart']
+        else:
+            self._evict_buffers()
+            methods = ['scratch']
+        if drop_os_cache and self._drop_os_cache():
+            methods.append('os')
+        return '+'.join(methods)
+
+    def _restart_server(self) -> None:
+        """
+        Redémarre le serveur de test puis attend qu'il accepte les connexions.
+
+        Raises:
+            subprocess.CalledProcessError: Si la commande de redémarrage échoue
+            RuntimeError: Si le serveur ne répond pas dans RESTART_TIMEOUT secondes
+        """
+        subprocess.run(shlex.split(self.restart_command), check=True, capture_output=True)
+        deadline = time.monotonic() + self.RESTART_TIMEOUT
+        while True:
+            try:
+                self._reconnect()
+                return
+            except Exception as e:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Le serveur ne répond pas après redémarrage : {str(e)}")
+                time.sleep(0.5)
+
+    @classmethod
+    def _drop_os_cache(cls) -> bool:
+        """
+        Vide le cache de pages du système (nécessite les droits d'administration).
+
+        Returns:
+            bool: True si le cache a été vidé
+        """
+        try:
+            os.sync()
+            with open(cls.DROP_CACHES_PATH, 'w') as f:
+                f.write('3')
+            return True
+        except OSError:
+            return False
+
+    @abstractmethod
+    def _reconnect(self) -> None:
+        """
+        Rétablit la connexion après un redémarrage du serveur.
+
+        Raises:
+            Exception: Si le serveur n'accepte pas encore les connexions
+        """
+        pass
+
+    @abstractmethod
+    def _evict_buffers(self) -> None:
+        """
+        Évince les données mesurées des caches du serveur sans le redémarrer,
+        en lisant la table tampon SCRATCH_TABLE (créée au premier appel).
+        """
+        pass
+
+    @abstractmethod
+    def prewarm(self, table_name: str) -> int:
+        """
+        Charge une table (et ses index) dans les caches du serveur.
+
+        Args:
+            table_name (str): Nom de la table
+
+        Returns:
+            int: Volume chargé (blocs ou colonnes selon le SGBD)
+        """
+        pass
+
     def analyze_multiple_queries(self, queries: List[str]) -> List[Dict]:
         """
         Analyse plusieurs requêtes SQL et collecte leurs métriques.
@@ -241,13 +1672,23 @@ class QueryAnalyzer(ABC):
                     'execution_time': float,    # Temps en ms
                     'row_count': int,          # Nombre de lignes
                     'physical_reads': int,      # Lectures
-                    'physical_writes': int      # Écritures
+                    'physical_writes': int,     # Écritures
+                    ...                         # LATENCY_METRICS, SERVER_METRICS
+                                                # et 'row_hash' s'il est calculé
                 }
         """
-        return {
+        formatted = {
             'query': metrics['query'],
             'execution_time': float(metrics['execution_time']),
             'row_count': int(metrics['row_count']),
             'physical_reads': int(metrics.get('physical_reads', 0)),
             'physical_writes': int(metrics.get('physical_writes', 0))
-        }
\ No newline at end of file
+        }
+        for key in self.LATENCY_METRICS:
+            formatted[key] = float(metrics.get(key, 0.0))
+        for key in self.SERVER_METRICS:
+            value = metrics.get(key, 0)
+            formatted[key] = float(value) if key.endswith('_time') else int(value)
+        if 'row_hash' in metrics:
+            formatted['row_hash'] = metrics['row_hash']
+        return formatted
\ No newline at end of file
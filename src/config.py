@@ -8,9 +8,10 @@ Ce module contient les configurations nécessaires pour :
 
 Structure:
 ---------
-Le fichier est organisé en deux parties principales :
+Le fichier est organisé en trois parties principales :
 1. Configuration des chemins des données
-2. Configuration des graphiques et métriques
+2. Configuration des modes de chargement et du parallélisme
+3. Configuration des graphiques et métriques
 """
 
 # Configuration des chemins des données
@@ -19,6 +20,224 @@ CSV_PATHS = [
     ("data/crimes.csv", "crimes")
 ]
 
+# Dossier du cache Parquet des CSV nettoyés (None pour relire les CSV à chaque exécution)
+DATASET_CACHE_DIR = "data/cache"
+
+# Taille maximale (en octets) d'un CSV lu une seule fois et conservé en
+# mémoire, nettoyé et typé, pour tous les chargements. Au-delà, chaque
+# chargement relit le fichier en flux à mémoire bornée, avec le schéma déduit
+# du premier morceau (types plus larges) et sans cache Parquet. None pour
+# toujours conserver les CSV en mémoire.
+DATASET_MEMORY_LIMIT = 2 * 1024 ** 3
+
+# Modes de chargement mesurés pour chaque SGBD
+# Le premier mode de chaque liste sert de référence dans les comparaisons.
+# Chaque mode supplémentaire recharge toute la table : la comparaison des
+# modes est donc facultative, par exemple
+# {'postgres': ['copy', 'insert'], 'monetdb': ['copy', 'executemany']}
+LOAD_MODES = {
+    'postgres': ['copy'],
+    'monetdb': ['copy']
+}
+
+# Nombres de processus d'écriture mesurés pour chaque mode de chargement
+# 1 correspond au chargement sur une seule connexion ; au-delà, les morceaux
+# du CSV sont répartis entre autant de processus ayant chacun leur connexion.
+# Chaque nombre supplémentaire recharge la table pour chaque mode : la mesure
+# du passage à plusieurs processus est facultative, par exemple [1, 4]
+LOAD_WORKERS = [1]
+
+# Chargement incrémental : ignore le chargement d'une table dont l'empreinte
+# (contenu du CSV, schéma, mode) est inchangée et n'ajoute que les nouvelles
+# lignes d'un CSV complété. Seul le premier mode et le premier nombre de
+# processus sont alors chargés, les mesures comparatives étant désactivées.
+INCREMENTAL_LOAD = False
+
+# Conception physique appliquée après le chargement de chaque table :
+# collecte des statistiques puis index sur les colonnes filtrées et groupées
+# par les requêtes. 'ordered' : B-tree PostgreSQL / ORDERED INDEX MonetDB ;
+# 'imprints' (colonnes numériques) : BRIN PostgreSQL / IMPRINTS MonetDB.
+PHYSICAL_DESIGN = {
+    'air_quality': {
+        'analyze': True,
+        'indexes': [
+            {'column': 'geo_place_name'},
+            {'column': 'measure_info'},
+            {'column': 'data_value', 'kind': 'imprints'}
+        ]
+    },
+    'crimes': {
+        'analyze': True,
+        'indexes': [
+            {'column': 'area_name'},
+            {'column': 'crm_cd_desc'},
+            {'column': 'vict_age', 'kind': 'imprints'},
+            {'column': 'time_occ', 'kind': 'imprints'}
+        ]
+    }
+}
+
+# Données synthétiques : avec un facteur d'échelle supérieur à 1, chaque
+# table reçoit scale_factor fois plus de lignes que son CSV, générées pendant
+# le chargement à partir des distributions, cardinalités et corrélations
+# apprises sur le CSV (graine 'seed'), sans fichier intermédiaire. Inférieur
+# à 1, la table reçoit un échantillon aléatoire des lignes du CSV.
+SYNTHETIC_DATA = {
+    'scale_factor': 1,
+    'seed': 0
+}
+
+# Passage à l'échelle : chaque table est rechargée à chacun des facteurs
+# d'échelle de 'scale_factors' ([] pour désactiver) et les requêtes rejouées
+# avec 'iterations' itérations ; une loi temps = a * lignes^b est ajustée
+# par requête et par SGBD (et pour le chargement), les exposants supérieurs
+# à 'superlinear_exponent' étant signalés. Le croisement des courbes des deux
+# SGBD indique la taille à partir de laquelle changer de SGBD.
+SCALING = {
+    'scale_factors': [],
+    'iterations': 10,
+    'superlinear_exponent': 1.1
+}
+
+# Métriques serveur relevées à chaque itération des requêtes : temps
+# d'exécution moteur, blocs en cache et lus, lignes renvoyées (PostgreSQL via
+# les compteurs de pg_stat_statements avant et après l'exécution mesurée,
+# chargé par docker-compose.yml ; MonetDB via sys.queue()). Permet de séparer
+# le temps du moteur de celui du pilote et du réseau, sans réexécuter la requête.
+SERVER_METRICS = True
+
+# Consommation des résultats des requêtes : 'fetchall' matérialise tout le
+# résultat côté client, 'stream' le parcourt par lots de FETCH_SIZE lignes
+# (curseur côté serveur PostgreSQL, arraysize pymonetdb) sans le conserver.
+# HASH_ROWS calcule en plus, lot par lot, une empreinte des lignes reçues
+# indépendante de leur ordre (durée exclue des mesures) : les itérations au
+# résultat divergent sont écartées, et une différence de résultat entre les
+# deux SGBD est signalée et annule le verdict de la requête.
+FETCH_MODE = 'fetchall'
+FETCH_SIZE = 10000
+HASH_ROWS = True
+
+# Requêtes préparées : chaque requête est préparée une fois par connexion
+# (PREPARE/EXECUTE PostgreSQL, PREPARE/EXEC MonetDB) et seule son exécution
+# est mesurée, la durée de préparation étant relevée à part. Un modèle
+# paramétré est préparé une seule fois avec des emplacements de paramètres,
+# chaque liaison ne transmettant que ses constantes. PostgreSQL planifie
+# toujours à l'exécution : le temps de planification est relevé par
+# pg_stat_statements (métriques serveur).
+PREPARED_STATEMENTS = False
+
+# Pool de sessions utilisé pour l'exécution des requêtes : taille maximale,
+# vérification d'une session inactive avant emprunt (pre-ping), session
+# attachée durablement à chaque thread ('pinned') et âge maximal d'une
+# session en secondes ('recycle', None pour illimité).
+CONNECTION_POOL = {
+    'pool_size': 8,
+    'pre_ping': True,
+    'pinned': False,
+    'recycle': 1800
+}
+
+# État des caches lors de la mesure des requêtes :
+#   - 'cold' : caches vidés avant chaque itération, en redémarrant le serveur
+#     si une commande est fournie (ex. 'docker restart postgres'), sinon en
+#     lisant une table tampon ; le cache de pages du système est aussi vidé
+#     lorsque les droits le permettent (conteneur privilégié)
+#   - 'warm' : WARMUP_ITERATIONS itérations de chauffe non mesurées par requête
+#   - 'hot' : tables chargées en mémoire (pg_prewarm, parcours des colonnes
+#     MonetDB) puis itérations de chauffe
+CACHE_MODE = {
+    'mode': 'warm',
+    'warmup_iterations': 5,
+    'restart_commands': {
+        'postgres': None,
+        'monetdb': None
+    },
+    'drop_os_cache': True
+}
+
+# Statistiques des itérations : médiane, percentiles, écart type et intervalle
+# de confiance de la moyenne par bootstrap, après rejet des valeurs aberrantes.
+# En mode adaptatif, les itérations d'une requête s'arrêtent dès que la
+# largeur relative de l'intervalle des deux SGBD passe sous 'target_ci_width'
+# (au plus 'iterations', au moins 'min_iterations'), ou lorsque le budget en
+# secondes par requête est épuisé.
+ITERATION_STATS = {
+    'iterations': 50,
+    'adaptive': True,
+    'min_iterations': 10,
+    'target_ci_width': 0.05,
+    'time_budget': 120,
+    'confidence': 0.95,
+    'bootstrap_resamples': 2000
+}
+
+# Charge de requêtes : avec 'templates', les modèles paramétrés
+# (CRIMES_TEMPLATES, AIR_QUALITY_TEMPLATES) remplacent les requêtes figées ;
+# chaque itération exécute une liaison différente, tirée dans la distribution
+# réelle des colonnes chargées avec la graine 'seed', et les temps sont aussi
+# résumés par classe de sélectivité.
+# Les requêtes sont prises dans le registre (src/queries/registry.py) : suites
+# retenues ('core' : sélection, agrégation, jointure ; 'analytical' : suite
+# étendue sur crimes) et catégories retenues (None pour toutes, sinon parmi
+# 'selection', 'aggregation', 'join', 'window', 'top_k', 'time_bucket',
+# 'projection').
+QUERY_WORKLOAD = {
+    'templates': True,
+    'seed': 42,
+    'suites': ['core', 'analytical'],
+    'categories': None
+}
+
+# Ordonnancement des mesures de requêtes entre les deux SGBD :
+#   - 'interleaved' : PostgreSQL et MonetDB alternés à chaque itération
+#   - 'parallel' : un processus par SGBD, exécutés simultanément
+#   - 'isolated' : un processus par SGBD, l'un après l'autre, chacun
+#     disposant seul de la machine
+# 'cpu_sets' réserve des processeurs au processus client de chaque SGBD
+# (ex. {'postgres': [0, 1], 'monetdb': [2, 3]}, None pour ne pas restreindre).
+ENGINE_SCHEDULE = {
+    'mode': 'interleaved',
+    'cpu_sets': None
+}
+
+# Mesure du débit en boucle fermée : chaque client (un processus, une
+# connexion) rejoue le mélange de requêtes sans pause pendant 'duration'
+# secondes, pour chaque nombre de clients de 'clients' (ex. [1, 2, 4, 8] ;
+# [] pour désactiver, la mesure allongeant notablement l'exécution).
+CONCURRENCY = {
+    'clients': [],
+    'duration': 10
+}
+
+# Mesure en boucle ouverte : les requêtes partent selon un calendrier
+# d'arrivées ('poisson' ou 'fixed') indépendant des réponses, pour chaque
+# débit offert de 'rates' (requêtes/s, ex. [5, 10, 20, 40, 80] ; [] pour
+# désactiver). La latence inclut l'attente en file, et le premier débit non
+# tenu marque la saturation.
+OPEN_LOOP = {
+    'rates': [],
+    'duration': 10,
+    'arrival': 'poisson',
+    'max_in_flight': 16
+}
+
+# Charge mixte (HTAP) : pendant 'duration' secondes, 'writers' processus
+# ajoutent des lots de 'batch_rows' lignes aux tables de 'tables' (une
+# transaction par lot, premier mode de LOAD_MODES) au débit visé, pour chaque
+# débit de 'ingest_rates' (lignes/s, ex. [1000, 5000, 20000] ; [] pour
+# désactiver), pendant que 'readers' lecteurs rejouent les requêtes. Une
+# mesure sans écriture sert de référence à la dégradation de la latence. La
+# table est restaurée (et ses statistiques recalculées) après chaque débit,
+# pour que toutes les mesures portent sur la même table.
+MIXED_WORKLOAD = {
+    'tables': ['crimes'],
+    'ingest_rates': [],
+    'duration': 10,
+    'readers': 4,
+    'writers': 1,
+    'batch_rows': 1000
+}
+
 # Configuration des graphiques et métriques de performance
 GRAPH_CONFIG = {
     'air_quality': {
@@ -0,0 +1,236 @@
+"""
+Mesure du débit sous charge concurrente (boucle fermée).
+
+Ce module rejoue le mélange de requêtes d'une analyse avec plusieurs clients
+simultanés. Chaque client est un processus disposant de sa propre connexion
+(nouvelle instance du connecteur), comme les processus d'écriture du
+chargement parallèle ; il enchaîne les requêtes sans pause, la suivante
+partant dès la réception du résultat de la précédente. Pour chaque nombre de
+clients, le débit (requêtes par seconde) et la distribution des latences
+sont relevés, ce qui donne la courbe débit / concurrence de chaque SGBD.
+"""
+
+import multiprocessing
+import queue
+import time
+from typing import Dict, List, Optional
+import numpy as np
+
+
+def _client_worker(analyzer_cls, connector_cls, client: int, queries: List[str],
+                   duration: float, analyzer_options: Dict, start, reports) -> None:
+    """
+    Processus client de la mesure en boucle fermée.
+
+    Le client ouvre sa connexion, signale ``ready``, attend le départ commun
+    puis exécute les requêtes à tour de rôle (en commençant par la requête
+    ``client`` pour que les clients ne soient pas synchronisés) jusqu'à la
+    fin de la durée. Le compte rendu transmet la latence et le numéro de
+    chaque requête terminée ainsi que le nombre d'erreurs.
+
+    Args:
+        analyzer_cls (type): Classe concrète de QueryAnalyzer
+        connector_cls (type): Classe concrète de DatabaseConnector
+        client (int): Numéro du client
+        queries (List[str]): Mélange de requêtes rejoué
+        duration (float): Durée de la mesure en secondes
+        analyzer_options (Dict): Options de l'analyseur (mode de consommation, ...)
+        start: Événement de départ commun à tous les clients
+        reports: File des comptes rendus envoyés au coordinateur
+    """
+    try:
+        analyzer = analyzer_cls(connector_cls(), server_metrics=False, **analyzer_options)
+        analyzer.connector.connect()
+        with analyzer.connector.session():
+            pass
+    except Exception as e:
+        reports.put(('error', client, f"{type(e).__name__}: {e}"))
+        return
+    reports.put(('ready', client))
+    start.wait()
+
+    latencies, query_ids, errors = [], [], 0
+    deadline = time.perf_counter() + duration
+    position = client
+    while time.perf_counter() < deadline:
+        query_id = position % len(queries)
+        position += 1
+        try:
+            metrics = analyzer.analyze_query(queries[query_id])
+        except Exception:
+            metrics = {'error': True}
+        if 'error' in metrics:
+            errors += 1
+            continue
+        latencies.append(metrics['execution_time'])
+        query_ids.append(query_id)
+    reports.put(('done', client, latencies, query_ids, errors))
+
+
+class ConcurrencyBenchmark:
+    """
+    Débit et latences d'un SGBD pour plusieurs nombres de clients concurrents.
+
+    Attributes:
+        analyzer_cls (type): Classe concrète de QueryAnalyzer
+        connector_cls (type): Classe concrète de DatabaseConnector
+        duration (float): Durée de la mesure pour chaque nombre de clients (s)
+        analyzer_options (Dict): Options transmises aux analyseurs des clients
+        HISTOGRAM_EDGES (np.ndarray): Bornes des classes de latence en ms,
+            logarithmiques (dix classes par décade de 0,1 ms à 100 s), communes
+            à toutes les mesures pour qu'elles restent comparables
+        CONNECT_TIMEOUT (int): Délai maximal de connexion des clients (s)
+
+    Example:
+        >>> benchmark = ConcurrencyBenchmark(PostgresAnalyzer, PostgresConnector, 10)
+        >>> results = benchmark.run(CRIMES_QUERIES, [1, 2, 4, 8])
+        >>> results[8]['qps']
+    """
+
+    HISTOGRAM_EDGES = np.logspace(-1, 5, 61)
+    CONNECT_TIMEOUT = 60
+
+    def __init__(self, analyzer_cls, connector_cls, duration: float = 10.0,
+                 analyzer_options: Optional[Dict] = None):
+        self.analyzer_cls = analyzer_cls
+        self.connector_cls = connector_cls
+        self.duration = duration
+        self.analyzer_options = analyzer_options or {}
+
+    def run(self, queries: List[str], clients: List[int]) -> Dict[int, Dict]:
+        """
+        Mesure le débit pour chaque nombre de clients.
+
+        Args:
+            queries (List[str]): Mélange de requêtes rejoué par les clients
+            clients (List[int]): Nombres de clients simultanés à mesurer
+
+        Returns:
+            Dict[int, Dict]: Résultats par nombre de clients (voir ``measure``)
+        """
+        return {count: self.measure(queries, count) for count in clients}
+
+    def measure(self, queries: List[str], clients: int) -> Dict:
+        """
+        Lance ``clients`` clients simultanés pendant ``duration`` secondes.
+
+        Args:
+            queries (List[str]): Mélange de requêtes rejoué
+            clients (int): Nombre de clients simultanés
+
+        Returns:
+            Dict: Débit et latences
+                {
+                    'clients': int,            # Nombre de clients
+                    'duration': float,         # Durée effective en s
+                    'queries': int,            # Requêtes terminées
+                    'errors': int,             # Requêtes en erreur
+                    'qps': float,              # Débit total en requêtes/s
+                    'client_qps': List[float], # Débit de chaque client
+                    'latency': Dict,           # mean, median, p90, p95, p99, max (ms)
+                    'histogram': List[int],    # Effectifs par classe de HISTOGRAM_EDGES
+                    'by_query': Dict[int, Dict] # Nombre, moyenne et p95 par requête
+                                                # (numérotées à partir de 1)
+                }
+
+        Raises:
+            ValueError: Si le nombre de clients n'est pas positif
+            RuntimeError: Si un client ne parvient pas à se connecter
+        """
+        if clients < 1:
+            raise ValueError(f"Le nombre de clients doit être positif : {clients}")
+        context = multiprocessing.get_context()
+        start = context.Event()
+        reports = context.Queue()
+        processes = [
+            context.Process(
+                target=_client_worker,
+                args=(self.analyzer_cls, self.connector_cls, client, queries,
+                      self.duration, self.analyzer_options, start, reports),
+                name=f'client-{client}', daemon=True)
+            for client in range(clients)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            self._wait_ready(reports, processes)
+            begin = time.perf_counter()
+            start.set()
+            done = self._collect(reports, processes)
+            elapsed = time.perf_counter() - begin
+        finally:
+            for process in processes:
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+        return self._summarize(done, clients, elapsed)
+
+    def _wait_ready(self, reports, processes: list) -> None:
+        """
+        Attend que tous les clients soient connectés.
+
+        Raises:
+            RuntimeError: Si un client échoue ou dépasse CONNECT_TIMEOUT
+        """
+        ready = 0
+        deadline = time.monotonic() + self.CONNECT_TIMEOUT
+        while ready < len(processes):
+            try:
+                report = reports.get(timeout=0.1)
+            except queue.Empty:
+                if time.monotonic() > deadline or not all(p.is_alive() for p in processes):
+                    raise RuntimeError("Un client n'a pas pu se connecter")
+                continue
+            if report[0] == 'error':
+                raise RuntimeError(f"Client {report[1]} : {report[2]}")
+            ready += 1
+
+    def _collect(self, reports, processes: list) -> list:
+        """
+        Reçoit le compte rendu final de chaque client.
+
+        Returns:
+            list: Comptes rendus ``('done', client, latences, requêtes, erreurs)``
+
+        Raises:
+            RuntimeError: Si un client se termine sans compte rendu
+        """
+        done = []
+        while len(done) < len(processes):
+            try:
+                done.append(reports.get(timeout=0.1))
+            except queue.Empty:
+                finished = {report[1] for report in done}
+                for client, process in enumerate(processes):
+                    if not process.is_alive() and client not in finished:
+                        raise RuntimeError(f"Client {client} terminé (code {process.exitcode})")
+        return sorted(done, key=lambda report: report[1])
+
+    def _summarize(self, done: list, clients: int, elapsed: float) -> Dict:
+        latencies = np.concatenate([np.asarray(report[2], dtype=float) for report in done])
+        query_ids = np.concatenate([np.asarray(report[3], dtype=int) for report in done])
+        if len(latencies):
+            p50, p90, p95, p99 = np.percentile(latencies, [50, 90, 95, 99])
+            latency = {'mean': float(latencies.mean()), 'median': float(p50),
+                       'p90': float(p90), 'p95': float(p95), 'p99': float(p99),
+                       'max': float(latencies.max())}
+        else:
+            latency = dict.fromkeys(('mean', 'median', 'p90', 'p95', 'p99', 'max'), 0.0)
+        by_query = {}
+        for query_id in np.unique(query_ids):
+            values = latencies[query_ids == query_id]
+            by_query[int(query_id) + 1] = {'count': int(len(values)),
+                                       'mean': float(values.mean()),
+                                       'p95': float(np.percentile(values, 95))}
+        return {
+            'clients': clients,
+            'duration': elapsed,
+            'queries': int(len(latencies)),
+            'errors': int(sum(report[4] for report in done)),
+            'qps': len(latencies) / elapsed if elapsed else 0.0,
+            'client_qps': [len(report[2]) / elapsed if elapsed else 0.0 for report in done],
+            'latency': latency,
+            'histogram': np.histogram(latencies, bins=self.HISTOGRAM_EDGES)[0].tolist(),
+            'by_query': by_query
+        }
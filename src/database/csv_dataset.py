@@ -0,0 +1,185 @@
+"""
+Jeu de données CSV analysé une seule fois et partagé entre les chargeurs.
+
+Ce module fournit l'étape d'ingestion commune : le fichier CSV est lu, nettoyé
+et normalisé une seule fois, puis les morceaux obtenus sont réutilisés par
+tous les chargeurs (PostgreSQL, MonetDB) et pour tous les modes mesurés, au
+lieu d'être relus depuis le disque à chaque chargement.
+"""
+
+import hashlib
+import time
+from typing import Iterator, List, Optional, Tuple
+import pandas as pd
+
+from src.database.load_phases import LoadPhases
+from src.database.table_schema import TableSchema
+
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_fingerprint(chemin_csv: str,
+                     prefix_size: Optional[int] = None) -> Tuple[str, int, Optional[str]]:
+    """
+    Calcule l'empreinte BLAKE2b du contenu d'un fichier en une seule lecture.
+
+    Args:
+        chemin_csv (str): Chemin vers le fichier
+        prefix_size (int, optional): Taille en octets d'un préfixe dont
+            l'empreinte est aussi calculée (fichier précédemment chargé)
+
+    Returns:
+        Tuple[str, int, Optional[str]]: Empreinte du fichier, taille en octets
+            et empreinte des ``prefix_size`` premiers octets (None si le fichier
+            est plus court ou si aucun préfixe n'est demandé)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    prefix_digest = None
+    size = 0
+    with open(chemin_csv, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            if prefix_size is not None and size < prefix_size <= size + len(block):
+                digest.update(block[:prefix_size - size])
+                prefix_digest = digest.copy().hexdigest()
+                digest.update(block[prefix_size - size:])
+            else:
+                digest.update(block)
+            size += len(block)
+    return digest.hexdigest(), size, prefix_digest
+
+
+class CsvDataset:
+    """
+    Morceaux nettoyés et normalisés d'un fichier CSV, conservés en mémoire.
+
+    Les morceaux ont le même découpage que le chargement en flux de
+    DatabaseLoader : chaque écrivain les reçoit donc exactement comme s'il
+    lisait le fichier lui-même. Le schéma est déduit de l'ensemble des
+    morceaux (voir TableSchema), qui sont convertis en conséquence, et
+    partagé par tous les chargeurs.
+
+    Tous les morceaux restent en mémoire pendant la durée de vie du jeu de
+    données : contrairement au chargement en flux (``stream_csv``), dont la
+    mémoire est bornée à quelques morceaux, l'empreinte mémoire est celle du
+    fichier entier une fois typé. Au-delà de DATASET_MEMORY_LIMIT (voir
+    config), analyze_database_performance renonce au jeu partagé et chaque
+    chargement relit le fichier en flux.
+
+    Attributes:
+        chemin_csv (str): Chemin du fichier CSV d'origine
+        chunks (List[pd.DataFrame]): Morceaux nettoyés, dans l'ordre du fichier
+        parse_time (float): Temps de lecture, de nettoyage et d'inférence en secondes
+        from_cache (bool): True si les morceaux proviennent du cache disque
+            (voir DatasetCache) plutôt que du fichier CSV
+        phases (LoadPhases): Durées des phases 'parse', 'clean' et 'convert'
+            (inférence du schéma) de l'étape d'ingestion commune
+        schema (TableSchema): Schéma déduit de l'ensemble des morceaux, ou
+            schéma imposé (échantillon d'un jeu déjà analysé, voir ``sample``)
+
+    Example:
+        >>> dataset = CsvDataset.from_csv("data/crimes.csv", pg_loader)
+        >>> pg_loader.load_csv(dataset.chemin_csv, "crimes", dataset=dataset)
+        >>> monet_loader.load_csv(dataset.chemin_csv, "crimes", dataset=dataset)
+    """
+
+    def __init__(self, chemin_csv: str, chunks: List[pd.DataFrame], parse_time: float,
+                 from_cache: bool = False, phases: Optional[LoadPhases] = None,
+                 schema: Optional[TableSchema] = None):
+        self.chemin_csv = chemin_csv
+        self.chunks = chunks
+        self.phases = phases or LoadPhases()
+        if schema is None:
+            with self.phases.span('convert', self.total_rows,
+                                  sum(LoadPhases.nbytes(chunk) for chunk in chunks)):
+                schema = TableSchema.infer(chunks, exact=True)
+        self.schema = schema
+        self.parse_time = parse_time
+        self.from_cache = from_cache
+
+    @classmethod
+    def from_csv(cls, chemin_csv: str, loader, separateur: str = ',',
+                 chunksize: Optional[int] = None) -> 'CsvDataset':
+        """
+        Lit et nettoie un fichier CSV une seule fois.
+
+        Le nettoyage est délégué à ``loader.read_csv_chunks`` afin que les règles
+        (noms de colonnes, types de référence) restent celles des chargeurs ;
+        l'inférence du schéma est comprise dans ``parse_time``.
+
+        Args:
+            chemin_csv (str): Chemin vers le fichier CSV
+            loader (DatabaseLoader): Chargeur fournissant les règles de nettoyage
+            separateur (str, optional): Séparateur utilisé dans le fichier CSV
+            chunksize (int, optional): Lignes par morceau (défaut : CHUNK_SIZE du chargeur)
+
+        Returns:
+            CsvDataset: Jeu de données prêt à être chargé
+
+        Raises:
+            ValueError: Si le fichier ne contient aucune ligne
+        """
+        print(f"\n📄 Lecture de {chemin_csv}...")
+        start_time = time.perf_counter()
+        phases = LoadPhases()
+        chunks = list(loader.read_csv_chunks(chemin_csv, separateur, chunksize, phases))
+        if not chunks:
+            raise ValueError(f"Le fichier {chemin_csv} ne contient aucune ligne")
+        dataset = cls(chemin_csv, chunks, 0.0, phases=phases)
+        dataset.parse_time = time.perf_counter() - start_time
+        print(f"   └─ {dataset.total_rows:,} lignes lues en {dataset.parse_time:.2f} s")
+        return dataset
+
+    def sample(self, fraction: float, seed: int = 0) -> 'CsvDataset':
+        """
+        Tire un échantillon aléatoire des lignes, dans l'ordre du fichier.
+
+        Le schéma est conservé : l'échantillon est chargé avec les mêmes
+        types que le jeu complet.
+
+        Args:
+            fraction (float): Part des lignes conservées (entre 0 et 1)
+            seed (int, optional): Graine du tirage
+
+        Returns:
+            CsvDataset: Jeu de données échantillonné (morceaux vides omis)
+
+        Raises:
+            ValueError: Si la part n'est pas comprise entre 0 et 1
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError(f"Part d'échantillonnage invalide : {fraction} (attendu entre 0 et 1)")
+        start_time = time.perf_counter()
+        chunks = [chunk.sample(frac=fraction, random_state=seed + i).sort_index()
+                  for i, chunk in enumerate(self.chunks)]
+        chunks = [chunk.reset_index(drop=True) for chunk in chunks if len(chunk)]
+        return CsvDataset(self.chemin_csv, chunks,
+                          self.parse_time + time.perf_counter() - start_time,
+                          from_cache=self.from_cache, phases=self.phases, schema=self.schema)
+
+    @property
+    def total_rows(self) -> int:
+        """Nombre total de lignes du jeu de données."""
+        return sum(len(chunk) for chunk in self.chunks)
+
+    @property
+    def columns(self) -> List[str]:
+        """Noms des colonnes nettoyés."""
+        return list(self.chunks[0].columns)
+
+    @property
+    def chunk_count(self) -> int:
+        """Nombre de morceaux du jeu de données."""
+        return len(self.chunks)
+
+    def iter_chunks(self, phases: Optional[LoadPhases] = None) -> Iterator[pd.DataFrame]:
+        """
+        Parcourt les morceaux dans l'ordre du fichier.
+
+        Args:
+            phases (LoadPhases, optional): Phases du chargement consommateur
+                (inutilisé : les morceaux sont déjà en mémoire)
+
+        Yields:
+            pd.DataFrame: Morceaux nettoyés et normalisés
+        """
+        yield from self.chunks
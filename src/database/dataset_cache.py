@@ -0,0 +1,202 @@
+"""
+Cache disque des jeux de données CSV au format colonne (Parquet).
+
+Ce module conserve entre deux exécutions le résultat de l'étape d'ingestion
+commune (CsvDataset) : une fois lu et nettoyé, chaque CSV est écrit en Parquet,
+un groupe de lignes par morceau. Les exécutions suivantes relisent ce fichier
+par projection mémoire au lieu d'analyser à nouveau le CSV.
+
+La clé de cache couvre le contenu du fichier (empreinte BLAKE2), le séparateur,
+la taille des morceaux et la version du format de nettoyage : toute
+modification du fichier ou des règles de nettoyage invalide l'entrée, et les
+entrées périmées d'un même fichier sont supprimées lors de la reconstruction.
+Le nom des entrées comprend une empreinte du chemin absolu du CSV, pour que
+deux fichiers de même nom dans des dossiers différents aient leurs propres
+entrées.
+"""
+
+import glob
+import hashlib
+import os
+import time
+from typing import Optional
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.database.csv_dataset import CsvDataset, file_fingerprint
+from src.database.load_phases import LoadPhases
+
+
+class DatasetCache:
+    """
+    Cache Parquet des jeux de données CSV nettoyés.
+
+    Attributes:
+        cache_dir (str): Dossier contenant les fichiers de cache
+        FORMAT_VERSION (int): Version des règles de nettoyage, à incrémenter
+            lorsque le résultat de ``read_csv_chunks`` change pour un même fichier
+        ARROW_TYPES (dict): Type Arrow de chaque type logique de TableSchema
+
+    Example:
+        >>> cache = DatasetCache("data/cache")
+        >>> dataset = cache.load("data/crimes.csv", pg_loader)
+    """
+
+    FORMAT_VERSION = 4
+    ARROW_TYPES = {
+        'boolean': pa.bool_(),
+        'smallint': pa.int64(),
+        'integer': pa.int64(),
+        'bigint': pa.int64(),
+        'double': pa.float64(),
+        'date': pa.date32(),
+        'timestamp': pa.timestamp('ns'),
+        'varchar': pa.string(),
+        'text': pa.string()
+    }
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def fingerprint(self, chemin_csv: str) -> str:
+        """
+        Calcule l'empreinte du contenu d'un fichier.
+
+        Args:
+            chemin_csv (str): Chemin vers le fichier CSV
+
+        Returns:
+            str: Empreinte hexadécimale BLAKE2b du contenu
+        """
+        return file_fingerprint(chemin_csv)[0]
+
+    def key(self, chemin_csv: str, separateur: str, chunksize: int) -> str:
+        """
+        Calcule la clé de cache d'un fichier et de ses paramètres de lecture.
+
+        Args:
+            chemin_csv (str): Chemin vers le fichier CSV
+            separateur (str): Séparateur utilisé dans le fichier CSV
+            chunksize (int): Lignes par morceau
+
+        Returns:
+            str: Clé de cache
+        """
+        params = f"{self.FORMAT_VERSION}|{separateur}|{chunksize}|{self.fingerprint(chemin_csv)}"
+        return hashlib.blake2b(params.encode(), digest_size=12).hexdigest()
+
+    def _entry_path(self, chemin_csv: str, key: str) -> str:
+        stem = os.path.splitext(os.path.basename(chemin_csv))[0]
+        location = hashlib.blake2b(os.path.abspath(chemin_csv).encode(),
+                                   digest_size=4).hexdigest()
+        return os.path.join(self.cache_dir, f"{stem}-{location}-{key}.parquet")
+
+    def _evict(self, chemin_csv: str, keep: str) -> None:
+        """
+        Supprime les entrées périmées d'un fichier (toutes sauf ``keep``).
+
+        Args:
+            chemin_csv (str): Chemin vers le fichier CSV
+            keep (str): Chemin de l'entrée à conserver
+        """
+        for path in glob.glob(self._entry_path(chemin_csv, '?' * 24)):
+            if path != keep:
+                os.remove(path)
+
+    @classmethod
+    def _arrow_schema(cls, dataset: CsvDataset) -> pa.Schema:
+        """
+        Construit le schéma Arrow commun à tous les morceaux.
+
+        Les types viennent du schéma déduit de l'ensemble des morceaux (voir
+        TableSchema) et non du premier morceau, dont une colonne entièrement
+        vide ne dit rien du type des suivants.
+
+        Args:
+            dataset (CsvDataset): Jeu de données à écrire
+
+        Returns:
+            pa.Schema: Schéma Arrow, métadonnées pandas du premier morceau incluses
+        """
+        sample = pa.Schema.from_pandas(dataset.chunks[0], preserve_index=False)
+        fields = []
+        for column in dataset.schema.columns:
+            arrow_type = sample.field(column.name).type
+            if not (column.kind == 'timestamp' and pa.types.is_timestamp(arrow_type)):
+                # L'unité des horodatages (ns, us) dépend de la version de pandas
+                arrow_type = cls.ARROW_TYPES[column.kind]
+            fields.append(pa.field(column.name, arrow_type))
+        return pa.schema(fields, metadata=sample.metadata)
+
+    def _write(self, path: str, dataset: CsvDataset) -> None:
+        """
+        Écrit le jeu de données en Parquet, un groupe de lignes par morceau.
+
+        L'écriture se fait dans un fichier temporaire renommé à la fin, pour
+        qu'une exécution interrompue ne laisse pas d'entrée incomplète.
+
+        Args:
+            path (str): Chemin de l'entrée de cache
+            dataset (CsvDataset): Jeu de données à écrire
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        schema = self._arrow_schema(dataset)
+        tmp_path = f"{path}.tmp"
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for chunk in dataset.chunks:
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                writer.write_table(table, row_group_size=len(chunk))
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _read(path: str, chemin_csv: str) -> CsvDataset:
+        """
+        Relit une entrée de cache par projection mémoire.
+
+        Args:
+            path (str): Chemin de l'entrée de cache
+            chemin_csv (str): Chemin du fichier CSV d'origine
+
+        Returns:
+            CsvDataset: Jeu de données reconstruit, un morceau par groupe de lignes
+                (``parse_time`` est renseigné par l'appelant) ; la relecture est
+                comptée dans la phase 'parse'
+        """
+        phases = LoadPhases()
+        with phases.span('parse', nbytes=os.path.getsize(path)):
+            parquet = pq.ParquetFile(path, memory_map=True)
+            chunks = [parquet.read_row_group(i).to_pandas()
+                      for i in range(parquet.num_row_groups)]
+        phases.add('parse', 0, rows=sum(len(chunk) for chunk in chunks))
+        return CsvDataset(chemin_csv, chunks, 0.0, from_cache=True, phases=phases)
+
+    def load(self, chemin_csv: str, loader, separateur: str = ',',
+             chunksize: Optional[int] = None) -> CsvDataset:
+        """
+        Retourne le jeu de données depuis le cache, ou le construit et le met en cache.
+
+        Args:
+            chemin_csv (str): Chemin vers le fichier CSV
+            loader (DatabaseLoader): Chargeur fournissant les règles de nettoyage
+            separateur (str, optional): Séparateur utilisé dans le fichier CSV
+            chunksize (int, optional): Lignes par morceau (défaut : CHUNK_SIZE du chargeur)
+
+        Returns:
+            CsvDataset: Jeu de données prêt à être chargé ; en cas de succès du
+                cache, ``parse_time`` inclut le calcul de l'empreinte et la relecture
+        """
+        start_time = time.perf_counter()
+        chunksize = chunksize or loader.CHUNK_SIZE
+        path = self._entry_path(chemin_csv, self.key(chemin_csv, separateur, chunksize))
+        if os.path.exists(path):
+            dataset = self._read(path, chemin_csv)
+            dataset.parse_time = time.perf_counter() - start_time
+            print(f"\n📦 {chemin_csv} : {dataset.total_rows:,} lignes lues depuis le cache "
+                  f"en {dataset.parse_time:.2f} s")
+            return dataset
+
+        dataset = CsvDataset.from_csv(chemin_csv, loader, separateur, chunksize)
+        self._write(path, dataset)
+        self._evict(chemin_csv, keep=path)
+        print(f"   └─ Mis en cache : {path}")
+        return dataset
@@ -0,0 +1,305 @@
+"""
+Ordonnancement des mesures de requêtes entre les SGBD.
+
+Par défaut, la boucle d'itérations alterne PostgreSQL et MonetDB dans un même
+thread : la durée totale est la somme des deux, et chaque SGBD perturbe les
+caches et les processeurs de l'autre entre deux itérations. EngineScheduler
+exécute plutôt toutes les itérations d'un SGBD dans un processus qui lui est
+propre (nouvelle instance du connecteur et de l'analyseur, comme les
+processus d'écriture du chargement parallèle), éventuellement restreint à un
+ensemble de processeurs, puis rassemble les mesures des deux processus :
+
+    - 'parallel' : les deux processus s'exécutent en même temps
+    - 'isolated' : les processus s'exécutent l'un après l'autre, chacun
+      disposant seul de la machine pendant sa mesure
+
+Le mode 'interleaved' correspond à la boucle alternée de
+analyze_database_performance et n'utilise pas cet ordonnanceur.
+"""
+
+import multiprocessing
+import os
+import queue
+import time
+from typing import Dict, List, Optional
+
+from src.database.timing_stats import TimingStats
+
+
+def prepare_time(analyzer, bindings: List[Dict]) -> float:
+    """
+    Durée moyenne de préparation des liaisons d'une requête.
+
+    Les liaisons d'un même modèle partagent une requête préparée, comptée
+    une seule fois.
+
+    Args:
+        analyzer (QueryAnalyzer): Analyseur ayant exécuté la requête
+        bindings (List[Dict]): Liaisons de la requête
+
+    Returns:
+        float: Moyenne en ms sur les requêtes préparées (0 si aucune)
+    """
+    templates = {analyzer.statement_template(binding['sql']) for binding in bindings}
+    times = [analyzer.prepare_times[template] for template in templates
+             if template in analyzer.prepare_times]
+    return sum(times) / len(times) if times else 0.0
+
+
+def measure_queries(analyzer, workloads: List[List[Dict]], plan: Dict) -> List[Dict]:
+    """
+    Mesure toutes les requêtes avec un seul analyseur.
+
+    Pour chaque requête : itérations de chauffe, puis au plus
+    ``plan['iterations']`` itérations mesurées, les caches étant vidés avant
+    chacune en mode 'cold'. L'itération k (chauffe comprise) exécute la
+    liaison k de la requête. En mode adaptatif, l'arrêt ne dépend que de la
+    précision de la série de ce SGBD.
+
+    Args:
+        analyzer (QueryAnalyzer): Analyseur connecté
+        workloads (List[List[Dict]]): Liaisons de chaque requête (voir
+            QueryTemplate.bindings), parcourues en boucle si plus courtes
+        plan (Dict): Paramètres des mesures ('iterations', 'warmup_iterations',
+            'cache_mode', 'drop_os_cache', 'adaptive', 'min_iterations',
+            'target_ci_width', 'time_budget', 'confidence', 'bootstrap_resamples')
+
+    Returns:
+        List[Dict]: Mesures par requête, dans l'ordre de ``workloads``
+            {
+                'times': List[float],     # Temps d'exécution en ms
+                'samples': List[Dict],    # Métriques formatées (format_metrics),
+                                          # avec 'binding' et 'selectivity'
+                'stop_reason': str,       # 'iterations', 'converged' ou 'budget'
+                'evictions': List[str],   # Méthodes de vidage des caches utilisées
+                'prepare_time': float,    # Durée de préparation en ms
+                'errors': int             # Itérations en erreur, chauffe comprise
+            }
+    """
+    stats = TimingStats(confidence=plan['confidence'], resamples=plan['bootstrap_resamples'])
+    cold = plan['cache_mode'] == 'cold'
+    results = []
+    for bindings in workloads:
+        times, samples, evictions, errors = [], [], set(), 0
+        warmup = 0 if cold else plan['warmup_iterations']
+        for index in range(warmup):
+            try:
+                if 'error' in analyzer.analyze_query(bindings[index % len(bindings)]['sql']):
+                    errors += 1
+            except Exception:
+                errors += 1
+
+        stop_reason = 'iterations'
+        query_start = time.perf_counter()
+        for iteration in range(1, plan['iterations'] + 1):
+            if (plan['time_budget'] is not None
+                    and time.perf_counter() - query_start > plan['time_budget']):
+                stop_reason = 'budget'
+                break
+            if (plan['adaptive'] and iteration > plan['min_iterations']
+                    and iteration % TimingStats.CHECK_EVERY == 0
+                    and stats.converged(times, plan['target_ci_width'], plan['min_iterations'])):
+                stop_reason = 'converged'
+                break
+            index = warmup + iteration - 1
+            binding = bindings[index % len(bindings)]
+            try:
+                if cold:
+                    evictions.add(analyzer.evict_cache(plan['drop_os_cache']))
+                metrics = analyzer.analyze_query(binding['sql'])
+            except Exception:
+                metrics = {'error': True}
+            if 'error' in metrics:
+                errors += 1
+                continue
+            times.append(metrics['execution_time'])
+            samples.append({**analyzer.format_metrics({'query': binding['sql'], **metrics}),
+                            'binding': index, 'selectivity': binding['selectivity']})
+
+        results.append({'times': times, 'samples': samples, 'stop_reason': stop_reason,
+                        'evictions': sorted(evictions),
+                        'prepare_time': prepare_time(analyzer, bindings),
+                        'errors': errors})
+    return results
+
+
+def _engine_worker(engine: str, analyzer_cls, connector_cls, workloads: List[List[Dict]],
+                   plan: Dict,
+                   options: Dict, cpus: Optional[List[int]], reports) -> None:
+    """
+    Processus de mesure d'un SGBD.
+
+    Le processus se restreint aux processeurs ``cpus``, ouvre sa propre
+    connexion, charge les tables en mémoire en mode 'hot', puis mesure toutes
+    les requêtes (voir ``measure_queries``). Le compte rendu transmet les
+    mesures et la durée totale du processus.
+
+    Args:
+        engine (str): 'pg' ou 'monet'
+        analyzer_cls (type): Classe concrète de QueryAnalyzer
+        connector_cls (type): Classe concrète de DatabaseConnector
+        workloads (List[List[Dict]]): Liaisons de chaque requête
+        plan (Dict): Paramètres des mesures, dont 'prewarm_tables' en mode 'hot'
+        options (Dict): Options du connecteur ('connection_pool') et de
+            l'analyseur ('analyzer_options')
+        cpus (List[int], optional): Processeurs autorisés (None pour tous)
+        reports: File des comptes rendus envoyés au coordinateur
+    """
+    start = time.perf_counter()
+    try:
+        if cpus:
+            os.sched_setaffinity(0, cpus)
+        analyzer = analyzer_cls(connector_cls(**options['connection_pool']),
+                                **options['analyzer_options'])
+        analyzer.connector.connect()
+        prewarmed = {}
+        if plan['cache_mode'] == 'hot':
+            prewarmed = {name: analyzer.prewarm(name) for name in plan['prewarm_tables']}
+        results = measure_queries(analyzer, workloads, plan)
+    except Exception as e:
+        reports.put(('error', engine, f"{type(e).__name__}: {e}"))
+        return
+    reports.put(('done', engine, results, prewarmed, time.perf_counter() - start))
+
+
+class EngineScheduler:
+    """
+    Exécute les mesures de chaque SGBD dans un processus séparé.
+
+    Attributes:
+        engines (Dict[str, tuple]): Classes (analyseur, connecteur) par SGBD
+            ('pg', 'monet'), dans l'ordre d'exécution du mode 'isolated'
+        mode (str): Ordonnancement (voir MODES)
+        cpu_sets (Dict[str, List[int]]): Processeurs autorisés par SGBD
+            ({'postgres': [...], 'monetdb': [...]}, None pour ne pas restreindre)
+        options (Dict): Options transmises aux processus ('connection_pool',
+            'analyzer_options', 'restart_commands')
+        MODES (tuple): Ordonnancements supportés ('interleaved', 'parallel', 'isolated')
+        ENGINE_KEYS (Dict[str, str]): Clé de configuration de chaque SGBD
+        POLL_INTERVAL (float): Intervalle de vérification des processus (s)
+
+    Note:
+        Seul le processus client est restreint aux processeurs choisis ; les
+        processus des serveurs se restreignent au lancement des conteneurs
+        (ex. ``docker run --cpuset-cpus``).
+
+    Example:
+        >>> scheduler = EngineScheduler(engines, 'parallel', {'postgres': [0, 1],
+        ...                                                   'monetdb': [2, 3]})
+        >>> measures = scheduler.run(workloads, plan)
+        >>> measures['engines']['pg'][0]['times']
+    """
+
+    MODES = ('interleaved', 'parallel', 'isolated')
+    ENGINE_KEYS = {'pg': 'postgres', 'monet': 'monetdb'}
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, engines: Dict[str, tuple], mode: str = 'parallel',
+                 cpu_sets: Optional[Dict[str, List[int]]] = None,
+                 options: Optional[Dict] = None):
+        if mode not in self.MODES:
+            raise ValueError(f"Ordonnancement inconnu : {mode} "
+                             f"(attendu : {', '.join(self.MODES)})")
+        if mode == 'interleaved':
+            raise ValueError("Le mode 'interleaved' s'exécute dans le processus principal")
+        if cpu_sets and not hasattr(os, 'sched_setaffinity'):
+            raise ValueError("La restriction aux processeurs n'est pas disponible "
+                             "sur ce système")
+        self.engines = engines
+        self.mode = mode
+        self.cpu_sets = cpu_sets or {}
+        self.options = options or {}
+
+    def run(self, workloads: List[List[Dict]], plan: Dict) -> Dict:
+        """
+        Mesure toutes les requêtes sur chaque SGBD selon l'ordonnancement choisi.
+
+        Args:
+            workloads (List[List[Dict]]): Liaisons de chaque requête, communes
+                aux deux SGBD (voir QueryTemplate.bindings)
+            plan (Dict): Paramètres des mesures (voir ``measure_queries``)
+
+        Returns:
+            Dict: Mesures fusionnées
+                {
+                    'engines': Dict[str, List[Dict]], # Mesures par SGBD puis par requête
+                    'prewarmed': Dict[str, Dict],     # Tables chargées en mémoire ('hot')
+                    'engine_time': Dict[str, float],  # Durée de chaque processus (s)
+                    'wall_time': float                # Durée totale des mesures (s)
+                }
+
+        Raises:
+            RuntimeError: Si un processus échoue ou se termine sans compte rendu
+        """
+        context = multiprocessing.get_context()
+        reports = context.Queue()
+        processes = {
+            engine: context.Process(
+                target=_engine_worker,
+                args=(engine, analyzer_cls, connector_cls, workloads, plan,
+                      self._engine_options(engine),
+                      self.cpu_sets.get(self.ENGINE_KEYS[engine]), reports),
+                name=f'measure-{engine}', daemon=True)
+            for engine, (analyzer_cls, connector_cls) in self.engines.items()
+        }
+
+        begin = time.perf_counter()
+        done = {}
+        try:
+            if self.mode == 'parallel':
+                for process in processes.values():
+                    process.start()
+                done.update(self._collect(reports, processes))
+            else:
+                for engine, process in processes.items():
+                    process.start()
+                    done.update(self._collect(reports, {engine: process}))
+        finally:
+            for process in processes.values():
+                if process.pid is None:
+                    continue
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+        wall_time = time.perf_counter() - begin
+
+        return {
+            'engines': {engine: report[2] for engine, report in done.items()},
+            'prewarmed': {engine: report[3] for engine, report in done.items()},
+            'engine_time': {engine: report[4] for engine, report in done.items()},
+            'wall_time': wall_time
+        }
+
+    def _engine_options(self, engine: str) -> Dict:
+        analyzer_options = dict(self.options.get('analyzer_options', {}))
+        analyzer_options['restart_command'] = (self.options.get('restart_commands') or {}).get(
+            self.ENGINE_KEYS[engine])
+        return {'connection_pool': self.options.get('connection_pool') or {},
+                'analyzer_options': analyzer_options}
+
+    def _collect(self, reports, processes: Dict) -> Dict:
+        """
+        Reçoit le compte rendu final de chaque processus lancé.
+
+        Returns:
+            Dict: Comptes rendus ``('done', sgbd, mesures, tables, durée)`` par SGBD
+
+        Raises:
+            RuntimeError: Si un processus échoue ou se termine sans compte rendu
+        """
+        done = {}
+        while len(done) < len(processes):
+            stopped = [engine for engine, process in processes.items()
+                       if not process.is_alive() and engine not in done]
+            try:
+                # Un processus terminé a déjà transmis son compte rendu s'il en a un
+                report = reports.get(timeout=1 if stopped else self.POLL_INTERVAL)
+            except queue.Empty:
+                if stopped:
+                    raise RuntimeError(f"Processus {stopped[0]} terminé "
+                                       f"(code {processes[stopped[0]].exitcode})")
+                continue
+            if report[0] == 'error':
+                raise RuntimeError(f"Processus {report[1]} : {report[2]}")
+            done[report[1]] = report
+        return done
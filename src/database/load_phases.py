@@ -0,0 +1,142 @@
+"""
+Mesure du temps passé dans chaque phase d'un chargement.
+
+Ce module fournit LoadPhases, qui accumule la durée (``perf_counter_ns``),
+le nombre de lignes et le volume de données de chaque phase nommée :
+
+    - parse : lecture du CSV par pandas (ou relecture du cache)
+    - clean : nettoyage des noms de colonnes et harmonisation des types
+    - convert : conversions propres au SGBD (inférence du schéma, sérialisation
+      des lots, remplacement des valeurs manquantes)
+    - ddl : vérification, suppression et création des tables, empreintes
+    - insert : envoi des lignes au SGBD
+    - commit : validation des transactions
+
+Le volume d'une phase est la taille du fichier pour 'parse' et la taille en
+mémoire des morceaux (sans le contenu des chaînes) pour les autres phases.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+import pandas as pd
+
+
+class LoadPhases:
+    """
+    Accumulateur des durées, lignes et octets traités par phase.
+
+    Les mesures peuvent provenir de plusieurs threads (lecture en arrière-plan)
+    ou de plusieurs processus (chargement parallèle, fusionnées par ``merge``) :
+    la durée d'une phase est alors la somme des durées de ses exécutants.
+
+    Attributes:
+        PHASES (tuple): Phases mesurées, dans l'ordre d'affichage
+
+    Example:
+        >>> phases = LoadPhases()
+        >>> with phases.span('insert', rows=len(chunk), nbytes=LoadPhases.nbytes(chunk)):
+        ...     cursor.executemany(sql, data)
+        >>> phases.to_dict()['insert']['rows_per_second']
+    """
+
+    PHASES = ('parse', 'clean', 'convert', 'ddl', 'insert', 'commit')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {phase: [0, 0, 0] for phase in self.PHASES}  # ns, lignes, octets
+
+    @staticmethod
+    def nbytes(df: pd.DataFrame) -> int:
+        """
+        Estime la taille en mémoire d'un morceau sans parcourir les chaînes.
+
+        Args:
+            df (pd.DataFrame): Morceau mesuré
+
+        Returns:
+            int: Taille en octets
+        """
+        return int(df.memory_usage(index=False, deep=False).sum())
+
+    def add(self, phase: str, elapsed_ns: int, rows: int = 0, nbytes: int = 0) -> None:
+        """
+        Ajoute une mesure à une phase.
+
+        Args:
+            phase (str): Nom de la phase (voir PHASES)
+            elapsed_ns (int): Durée en nanosecondes
+            rows (int, optional): Lignes traitées
+            nbytes (int, optional): Octets traités
+        """
+        with self._lock:
+            stats = self._stats[phase]
+            stats[0] += elapsed_ns
+            stats[1] += rows
+            stats[2] += nbytes
+
+    @contextmanager
+    def span(self, phase: str, rows: int = 0, nbytes: int = 0) -> Iterator[None]:
+        """
+        Mesure la durée du bloc et l'ajoute à la phase.
+
+        Args:
+            phase (str): Nom de la phase (voir PHASES)
+            rows (int, optional): Lignes traitées par le bloc
+            nbytes (int, optional): Octets traités par le bloc
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter_ns() - start, rows, nbytes)
+
+    def merge(self, other: Dict[str, list]) -> None:
+        """
+        Fusionne les mesures brutes d'un autre accumulateur (voir ``raw``).
+
+        Args:
+            other (Dict[str, list]): Mesures brutes ``[ns, lignes, octets]`` par phase
+        """
+        for phase, (elapsed_ns, rows, nbytes) in other.items():
+            self.add(phase, elapsed_ns, rows, nbytes)
+
+    def raw(self) -> Dict[str, list]:
+        """
+        Retourne les mesures brutes, transmissibles entre processus.
+
+        Returns:
+            Dict[str, list]: ``[ns, lignes, octets]`` par phase
+        """
+        with self._lock:
+            return {phase: list(stats) for phase, stats in self._stats.items()}
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """
+        Met en forme les mesures de chaque phase.
+
+        Returns:
+            Dict[str, Dict]: Mesures par phase
+                {
+                    'parse': {
+                        'time': float,              # Durée en secondes
+                        'rows': int,                # Lignes traitées
+                        'bytes': int,               # Octets traités
+                        'rows_per_second': float,   # Débit en lignes/s
+                        'bytes_per_second': float   # Débit en octets/s
+                    },
+                    ...
+                }
+        """
+        result = {}
+        for phase, (elapsed_ns, rows, nbytes) in self.raw().items():
+            seconds = elapsed_ns / 1e9
+            result[phase] = {
+                'time': seconds,
+                'rows': rows,
+                'bytes': nbytes,
+                'rows_per_second': rows / seconds if seconds else 0.0,
+                'bytes_per_second': nbytes / seconds if seconds else 0.0
+            }
+        return result
@@ -0,0 +1,389 @@
+"""
+Charge mixte : ajouts continus et requêtes simultanées (HTAP).
+
+Les phases de chargement et de mesure des requêtes ne se recouvrent jamais,
+alors qu'en production les tables reçoivent des ajouts en continu pendant que
+les tableaux de bord les interrogent. MixedWorkloadBenchmark lance ensemble :
+
+    - des processus d'écriture, qui ajoutent des micro-lots de lignes à la
+      table (une transaction par lot, validée aussitôt) selon un calendrier
+      fixe correspondant au débit d'ingestion visé ;
+    - des processus lecteurs, qui rejouent le mélange de requêtes en boucle
+      fermée (comme les clients de ConcurrencyBenchmark).
+
+Pour chaque débit d'ingestion visé, la mesure relève le débit d'ingestion
+obtenu, la durée de validation des lots et le retard pris sur le calendrier,
+ainsi que la latence des requêtes. Une première mesure sans écriture sert de
+référence pour exprimer la dégradation de la latence (rapport des p95).
+
+Pour que chaque débit soit mesuré sur la même table, son contenu est copié
+dans une table instantané avant les mesures puis restauré après chaque
+mesure avec écritures, et ses statistiques recalculées (``ANALYZE``) : la
+dégradation ne reflète alors que la concurrence des écritures, et non la
+croissance de la table ni des statistiques périmées. L'empreinte du
+chargement incrémental est invalidée, l'ordre physique des lignes restaurées
+n'étant plus celui du chargement.
+"""
+
+import multiprocessing
+import queue
+import time
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from src.database.concurrency_benchmark import _client_worker
+
+
+def _writer_worker(loader_cls, connector_cls, writer: int, writers: int, table_name: str,
+                   rows: pd.DataFrame, rate: float, batch_rows: int, mode: str,
+                   duration: float, start, reports) -> None:
+    """
+    Processus d'écriture de la charge mixte.
+
+    Le processus ouvre sa connexion, signale ``ready``, attend le départ
+    commun puis ajoute un lot de ``batch_rows`` lignes toutes les
+    ``batch_rows / rate`` secondes, chaque lot étant écrit et validé dans sa
+    propre transaction. Un lot en retard part dès la fin du précédent ; les
+    lots dont l'heure prévue dépasse la durée de la mesure ne sont pas
+    écrits. Les lignes sont prises à tour de rôle dans ``rows``, les
+    écrivains se répartissant les lots successifs.
+
+    Args:
+        loader_cls (type): Classe concrète de DatabaseLoader
+        connector_cls (type): Classe concrète de DatabaseConnector
+        writer (int): Numéro de l'écrivain
+        writers (int): Nombre d'écrivains
+        table_name (str): Table complétée
+        rows (pd.DataFrame): Lignes normalisées à ajouter
+        rate (float): Débit d'ingestion visé pour cet écrivain (lignes/s)
+        batch_rows (int): Lignes par lot
+        mode (str): Mode de chargement (voir LOAD_MODES)
+        duration (float): Durée de la mesure en secondes
+        start: Événement de départ commun à tous les processus
+        reports: File des comptes rendus envoyés au coordinateur
+    """
+    try:
+        loader = loader_cls(connector_cls())
+        loader._close_session(loader._open_session())
+    except Exception as e:
+        reports.put(('error', writer, f"{type(e).__name__}: {e}"))
+        return
+    reports.put(('ready', writer))
+    start.wait()
+
+    interval = batch_rows / rate
+    positions = np.arange(batch_rows)
+    batches, errors = [], 0
+    begin = time.perf_counter()
+    number = 0
+    while number * interval < duration:
+        due = number * interval
+        delay = due - (time.perf_counter() - begin)
+        if delay > 0:
+            time.sleep(delay)
+        offset = (number * writers + writer) * batch_rows
+        batch = rows.iloc[(positions + offset) % len(rows)]
+        started = time.perf_counter() - begin
+        session = None
+        try:
+            session = loader._open_session()
+            loader._write_chunk(session, table_name, batch, mode, batch_rows)
+            loader._commit(session)
+            batches.append((started - due, time.perf_counter() - begin - started, len(batch)))
+        except Exception:
+            if session is not None:
+                loader._rollback(session)
+            errors += 1
+        finally:
+            if session is not None:
+                loader._close_session(session)
+        number += 1
+    reports.put(('done', writer, batches, errors, time.perf_counter() - begin))
+
+
+class MixedWorkloadBenchmark:
+    """
+    Latence des requêtes et débit d'ingestion d'un SGBD sous charge mixte.
+
+    Attributes:
+        analyzer_cls (type): Classe concrète de QueryAnalyzer
+        connector_cls (type): Classe concrète de DatabaseConnector
+        loader_cls (type): Classe concrète de DatabaseLoader
+        readers (int): Processus lecteurs simultanés
+        writers (int): Processus d'écriture (le débit visé est réparti entre eux)
+        duration (float): Durée de la mesure pour chaque débit visé (s)
+        batch_rows (int): Lignes par micro-lot
+        mode (str): Mode de chargement des lots (premier de LOAD_MODES si None)
+        analyzer_options (Dict): Options transmises aux analyseurs des lecteurs
+        SUSTAINED_RATIO (float): Part minimale du débit visé pour qu'il soit tenu
+        CONNECT_TIMEOUT (int): Délai maximal de connexion des processus (s)
+        SNAPSHOT_SUFFIX (str): Suffixe de la table instantané restaurée entre
+            deux mesures
+
+    Example:
+        >>> benchmark = MixedWorkloadBenchmark(PostgresAnalyzer, PostgresConnector,
+        ...                                    PostgresLoader, readers=4, writers=1)
+        >>> results = benchmark.run(queries, 'crimes', rows, [1000, 5000, 20000])
+        >>> results['rates'][5000]['degradation']
+    """
+
+    SUSTAINED_RATIO = 0.95
+    CONNECT_TIMEOUT = 60
+    SNAPSHOT_SUFFIX = '_mixed_snapshot'
+
+    def __init__(self, analyzer_cls, connector_cls, loader_cls, readers: int = 4,
+                 writers: int = 1, duration: float = 10.0, batch_rows: int = 1000,
+                 mode: Optional[str] = None, analyzer_options: Optional[Dict] = None):
+        if readers < 1 or writers < 1:
+            raise ValueError(f"Nombres de lecteurs et d'écrivains invalides : "
+                             f"{readers}, {writers}")
+        if batch_rows < 1:
+            raise ValueError(f"Taille de lot invalide : {batch_rows}")
+        self.analyzer_cls = analyzer_cls
+        self.connector_cls = connector_cls
+        self.loader_cls = loader_cls
+        self.readers = readers
+        self.writers = writers
+        self.duration = duration
+        self.batch_rows = batch_rows
+        self.mode = loader_cls.LOAD_MODES[0] if mode is None else mode
+        self.analyzer_options = analyzer_options or {}
+
+    def run(self, queries: List[str], table_name: str, rows: pd.DataFrame,
+            rates: List[float]) -> Dict:
+        """
+        Mesure la charge mixte pour chaque débit d'ingestion visé.
+
+        Une mesure sans écriture (débit 0) est toujours faite en premier et
+        sert de référence à la dégradation de la latence des requêtes. La
+        table est restaurée après chaque mesure avec écritures (voir
+        ``_restore``), de sorte que toutes les mesures portent sur la même table.
+
+        Args:
+            queries (List[str]): Mélange de requêtes rejoué par les lecteurs
+            table_name (str): Table complétée par les écrivains
+            rows (pd.DataFrame): Lignes normalisées à ajouter (au format des
+                morceaux du jeu de données chargé)
+            rates (List[float]): Débits d'ingestion visés en lignes/s
+
+        Returns:
+            Dict: Résultats
+                {
+                    'rates': Dict[float, Dict],   # Mesures par débit visé (voir ``measure``)
+                    'max_sustained_rate': float,  # Plus fort débit tenu (None si aucun)
+                    'rows_appended': int          # Lignes ajoutées puis retirées
+                }
+
+        Raises:
+            ValueError: Si aucune ligne n'est fournie ou si un débit est négatif
+        """
+        if rows.empty:
+            raise ValueError("Aucune ligne à ajouter pour la charge mixte")
+        if any(rate < 0 for rate in rates):
+            raise ValueError(f"Débits d'ingestion invalides : {rates}")
+        # La table va être modifiée : le chargement suivant la recharge
+        loader = self.loader_cls(self.connector_cls())
+        loader._ensure_fingerprint_table()
+        loader._delete_fingerprint(table_name)
+        snapshot = f'{table_name}{self.SNAPSHOT_SUFFIX}'
+        loader._drop_table(snapshot)
+        loader._execute_sql(f'CREATE TABLE "{snapshot}" AS SELECT * FROM "{table_name}" '
+                            f'WITH DATA')
+
+        rows = rows.reset_index(drop=True)
+        results = {}
+        try:
+            for rate in sorted({0.0, *map(float, rates)}):
+                results[rate] = self.measure(queries, table_name, rows, rate)
+                if results[rate]['rows'] or results[rate]['write_errors']:
+                    self._restore(loader, table_name, snapshot)
+        finally:
+            loader._drop_table(snapshot)
+        baseline = results[0.0]['latency']['p95']
+        max_sustained_rate = None
+        for rate, result in results.items():
+            result['degradation'] = result['latency']['p95'] / baseline if baseline else None
+            if rate and result['sustained']:
+                max_sustained_rate = rate
+        return {'rates': results, 'max_sustained_rate': max_sustained_rate,
+                'rows_appended': sum(result['rows'] for result in results.values())}
+
+    @staticmethod
+    def _restore(loader, table_name: str, snapshot: str) -> None:
+        """
+        Remet la table dans l'état de l'instantané et recalcule ses statistiques.
+
+        Args:
+            loader (DatabaseLoader): Chargeur du SGBD
+            table_name (str): Table complétée par les écrivains
+            snapshot (str): Table instantané prise avant les mesures
+        """
+        loader._execute_sql(f'TRUNCATE TABLE "{table_name}"')
+        loader._execute_sql(f'INSERT INTO "{table_name}" SELECT * FROM "{snapshot}"')
+        loader._analyze_table(table_name)
+
+    def measure(self, queries: List[str], table_name: str, rows: pd.DataFrame,
+                rate: float) -> Dict:
+        """
+        Lance ensemble lecteurs et écrivains pendant ``duration`` secondes.
+
+        Args:
+            queries (List[str]): Mélange de requêtes rejoué
+            table_name (str): Table complétée
+            rows (pd.DataFrame): Lignes normalisées à ajouter
+            rate (float): Débit d'ingestion visé en lignes/s (0 : lecteurs seuls)
+
+        Returns:
+            Dict: Ingestion et latences
+                {
+                    'ingest_rate': float,     # Débit visé (lignes/s)
+                    'achieved_rate': float,   # Débit obtenu (lignes/s)
+                    'rows': int,              # Lignes ajoutées
+                    'batches': int,           # Lots validés
+                    'write_errors': int,      # Lots en erreur
+                    'commit_latency': Dict,   # median, p95, max de l'écriture d'un lot (ms)
+                    'schedule_lag': Dict,     # median, p95, max du retard des lots (ms)
+                    'sustained': bool,        # Débit obtenu >= SUSTAINED_RATIO * visé
+                    'queries': int,           # Requêtes terminées
+                    'query_errors': int,      # Requêtes en erreur
+                    'qps': float,             # Débit de requêtes
+                    'latency': Dict,          # mean, median, p95, p99 (ms)
+                    'by_query': Dict[int, Dict] # Médiane et p95 par requête
+                                                # (numérotées à partir de 1)
+                }
+
+        Raises:
+            RuntimeError: Si un processus ne parvient pas à se connecter ou
+                se termine sans compte rendu
+        """
+        context = multiprocessing.get_context()
+        start = context.Event()
+        reader_reports = context.Queue()
+        writer_reports = context.Queue()
+        readers = [
+            context.Process(
+                target=_client_worker,
+                args=(self.analyzer_cls, self.connector_cls, reader, queries,
+                      self.duration, self.analyzer_options, start, reader_reports),
+                name=f'reader-{reader}', daemon=True)
+            for reader in range(self.readers)
+        ]
+        writers = [
+            context.Process(
+                target=_writer_worker,
+                args=(self.loader_cls, self.connector_cls, writer, self.writers, table_name,
+                      rows, rate / self.writers, self.batch_rows, self.mode,
+                      self.duration, start, writer_reports),
+                name=f'writer-{writer}', daemon=True)
+            for writer in range(self.writers)
+        ] if rate else []
+        processes = readers + writers
+        for process in processes:
+            process.start()
+
+        try:
+            deadline = time.monotonic() + self.CONNECT_TIMEOUT
+            self._wait_ready(reader_reports, readers, deadline)
+            self._wait_ready(writer_reports, writers, deadline)
+            begin = time.perf_counter()
+            start.set()
+            read_done = self._collect(reader_reports, readers)
+            write_done = self._collect(writer_reports, writers)
+            elapsed = time.perf_counter() - begin
+        finally:
+            for process in processes:
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+        return self._summarize(read_done, write_done, rate, elapsed)
+
+    @staticmethod
+    def _wait_ready(reports, processes: list, deadline: float) -> None:
+        """
+        Attend que tous les processus d'un groupe soient connectés.
+
+        Raises:
+            RuntimeError: Si un processus échoue ou dépasse le délai de connexion
+        """
+        ready = 0
+        while ready < len(processes):
+            try:
+                report = reports.get(timeout=0.1)
+            except queue.Empty:
+                if time.monotonic() > deadline or not all(p.is_alive() for p in processes):
+                    raise RuntimeError(f"Processus {processes[0].name.split('-')[0]}"
+                                       f" non connecté")
+                continue
+            if report[0] == 'error':
+                raise RuntimeError(f"Processus {report[1]} : {report[2]}")
+            ready += 1
+
+    @staticmethod
+    def _collect(reports, processes: list) -> list:
+        """
+        Reçoit le compte rendu final de chaque processus d'un groupe.
+
+        Returns:
+            list: Comptes rendus ``('done', numéro, ...)`` triés par numéro
+
+        Raises:
+            RuntimeError: Si un processus se termine sans compte rendu
+        """
+        done = []
+        while len(done) < len(processes):
+            try:
+                done.append(reports.get(timeout=0.1))
+            except queue.Empty:
+                finished = {report[1] for report in done}
+                for number, process in enumerate(processes):
+                    if not process.is_alive() and number not in finished:
+                        raise RuntimeError(f"Processus {process.name} terminé"
+                                           f" (code {process.exitcode})")
+        return sorted(done, key=lambda report: report[1])
+
+    @staticmethod
+    def _distribution(values: np.ndarray) -> Dict:
+        if not len(values):
+            return dict.fromkeys(('median', 'p95', 'max'), 0.0)
+        p50, p95 = np.percentile(values, [50, 95])
+        return {'median': float(p50), 'p95': float(p95), 'max': float(values.max())}
+
+    def _summarize(self, read_done: list, write_done: list, rate: float,
+                   elapsed: float) -> Dict:
+        latencies = np.concatenate([np.asarray(report[2], dtype=float) for report in read_done])
+        query_ids = np.concatenate([np.asarray(report[3], dtype=int) for report in read_done])
+        if len(latencies):
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            latency = {'mean': float(latencies.mean()), 'median': float(p50),
+                       'p95': float(p95), 'p99': float(p99)}
+        else:
+            latency = dict.fromkeys(('mean', 'median', 'p95', 'p99'), 0.0)
+        by_query = {}
+        for query_id in np.unique(query_ids):
+            values = latencies[query_ids == query_id]
+            by_query[int(query_id) + 1] = {'median': float(np.median(values)),
+                                           'p95': float(np.percentile(values, 95))}
+
+        batches = [batch for report in write_done for batch in report[2]]
+        lag = np.asarray([batch[0] for batch in batches], dtype=float) * 1000
+        commit = np.asarray([batch[1] for batch in batches], dtype=float) * 1000
+        appended = sum(batch[2] for batch in batches)
+        # Un écrivain à l'heure finit avant la durée prévue, un écrivain en retard après
+        write_time = max([self.duration] + [report[4] for report in write_done])
+        achieved_rate = appended / write_time if write_time else 0.0
+        return {
+            'ingest_rate': rate,
+            'achieved_rate': achieved_rate,
+            'rows': appended,
+            'batches': len(batches),
+            'write_errors': sum(report[3] for report in write_done),
+            'commit_latency': self._distribution(commit),
+            'schedule_lag': self._distribution(lag),
+            'sustained': bool(rate and achieved_rate >= self.SUSTAINED_RATIO * rate),
+            'queries': int(len(latencies)),
+            'query_errors': int(sum(report[4] for report in read_done)),
+            'qps': len(latencies) / elapsed if elapsed else 0.0,
+            'latency': latency,
+            'by_query': by_query
+        }
@@ -2,6 +2,7 @@ from src.base_classes import QueryAnalyzer
 import time
 from typing import Dict
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -16,15 +17,56 @@ class MonetDBAnalyzer(QueryAnalyzer):
 
     Attributes:
         connector: Instance de MonetDBConnector pour la connexion à la base
+        QUEUE_SQL (str): Requête relevant la dernière requête terminée de la
+            session dans ``sys.queue()``
+        SCRATCH_SIZE (int): Taille en octets de la table tampon lue pour
+            évincer les colonnes mesurées de la mémoire
 
     Notes:
         Les métriques collectées incluent :
-        - Temps d'exécution total
+        - Temps d'exécution total mesuré par le client, découpé en exécution,
+          délai jusqu'à la première ligne et récupération du résultat
         - Nombre de lignes retournées
-        - Les lectures/écritures physiques ne sont pas disponibles dans MonetDB
-          et sont donc toujours à 0 pour maintenir une uniformité avec PostgreSQL
+        - Temps d'exécution mesuré par le serveur (début et fin de la requête
+          dans ``sys.queue()``, à la milliseconde)
+        - Les lectures/écritures physiques et les compteurs de blocs ne sont
+          pas disponibles dans MonetDB (pas de cache de pages : les colonnes
+          sont projetées en mémoire par le système) et sont donc toujours à 0
+          pour maintenir une uniformité avec PostgreSQL
+
+        En mode préparé, la requête est préparée (``PREPARE``) une fois par
+        connexion et exécutée par ``EXEC <id>(...)`` ; l'identifiant est relu
+        dans ``sys.prepared_statements``. Les liaisons d'un modèle partagent
+        une requête préparée à emplacements ``?`` et ``EXEC`` ne transmet que
+        leurs constantes. MonetDB ne publie pas de temps de planification :
+        seule la durée de préparation (compilation du plan MAL) est relevée.
+
+        Chaque exécution emprunte au pool du connecteur une connexion distincte
+        de la connexion principale ; l'attente d'une session libre et son
+        ouverture sont mesurées à part.
+
+        ``execute`` reçoit déjà le premier bloc de résultats ; en mode 'stream',
+        la taille des blocs suivants (``arraysize``) est fixée à ``fetch_size``.
+
+        MonetDB n'a pas de cache de pages propre : les colonnes sont projetées
+        en mémoire et restent dans le cache du système. Sans redémarrage du
+        serveur, la lecture de la table tampon ne les évince que si elle
+        dépasse la mémoire disponible ; une commande de redémarrage
+        (``restart_command``) est donc recommandée pour les mesures à froid.
     """
 
+    QUEUE_SQL = (
+        "SELECT started, finished FROM sys.queue() "
+        "WHERE sessionid = sys.current_sessionid() AND status = 'finished' "
+        "ORDER BY started DESC LIMIT 1"
+    )
+    SCRATCH_SIZE = 1 << 30
+
+    def __init__(self, connector, **options):
+        super().__init__(connector, **options)
+        # connexion -> {texte préparé: identifiant}, oublié avec la connexion
+        self._prepared = weakref.WeakKeyDictionary()
+
     def analyze_query(self, query: str) -> Dict:
         """
         Analyse une requête SQL et mesure son temps d'exécution sur MonetDB.
@@ -40,9 +82,13 @@ class MonetDBAnalyzer(QueryAnalyzer):
             Dict: Métriques de performance
                 {
                     'execution_time': float,  # Temps total en ms
+                    'execute_time': float,    # Temps jusqu'au retour d'execute en ms
+                    'first_row_time': float,  # Temps jusqu'à la première ligne en ms
+                    'fetch_time': float,      # Temps de récupération du résultat en ms
                     'row_count': int,         # Nombre de lignes retournées
                     'physical_reads': int,     # Toujours 0 (non disponible)
-                    'physical_writes': int     # Toujours 0 (non disponible)
+                    'physical_writes': int,    # Toujours 0 (non disponible)
+                    'server_time': float       # Temps d'exécution serveur en ms
                 }
                 
                 En cas d'erreur :
@@ -50,28 +96,164 @@ class MonetDBAnalyzer(QueryAnalyzer):
                     'error': str  # Message d'erreur
                 }
         """
+        with self.connector.session() as (conn, pool_stats):
+            cursor = conn.cursor()
+            
+            try:
+                if self.streaming:
+                    cursor.arraysize = self.fetch_size
+                
+                statement = query
+                if self.prepared:
+                    statement = self._prepare(conn, cursor, query)
+                
+                # Exécution de la requête avec mesure du temps
+                start_ns = time.perf_counter_ns()
+                cursor.execute(statement)
+                executed_ns = time.perf_counter_ns()
+                metrics = self._consume(cursor if cursor.description else None,
+                                        start_ns, executed_ns)
+                conn.commit()
+                
+                metrics.update(pool_stats)
+                metrics.update({
+                    'physical_reads': 0,  # Valeurs par défaut car non disponibles
+                    'physical_writes': 0  # Valeurs par défaut car non disponibles
+                })
+                if self.server_metrics:
+                    metrics['server_time'] = self._server_time(conn, cursor)
+                return metrics
+                
+            except Exception as e:
+                logger.error(f"Erreur lors de l'exécution de la requête: {str(e)}")
+                conn.rollback()
+                return {'error': str(e)}
+
+    def _prepare(self, conn, cursor, query: str) -> str:
+        """
+        Prépare la requête sur la connexion si elle ne l'est pas encore.
+
+        Une liaison de modèle (BoundQuery) prépare le modèle, à emplacements
+        ``?``, une seule fois pour toutes ses liaisons.
+
+        Args:
+            conn: Connexion pymonetdb courante
+            cursor: Curseur de la connexion
+            query (str): Requête SQL ou liaison d'un modèle
+
+        Returns:
+            str: Instruction ``EXEC`` portant les constantes de la liaison
+        """
+        sql, literals, _ = self.parameterized(query, numbered=False)
+        prepared = self._prepared.setdefault(conn, {})
+        if sql not in prepared:
+            start_ns = time.perf_counter_ns()
+            cursor.execute(f'PREPARE {sql}')
+            cursor.fetchall()
+            cursor.execute("SELECT MAX(statementid) FROM sys.prepared_statements "
+                           "WHERE sessionid = sys.current_sessionid()")
+            statement_id = int(cursor.fetchone()[0])
+            conn.commit()
+            self.prepare_times[self.statement_template(query)] = (
+                (time.perf_counter_ns() - start_ns) / 1e6)
+            prepared[sql] = statement_id
+        return f"EXEC {prepared[sql]}({', '.join(literals)})"
+
+    def _server_time(self, conn, cursor) -> float:
+        """
+        Lit le temps d'exécution serveur de la dernière requête de la session.
+
+        Args:
+            conn: Connexion ayant exécuté la requête
+            cursor: Curseur de cette connexion
+
+        Returns:
+            float: Durée entre le début et la fin de la requête en ms,
+                0.0 si ``sys.queue()`` ne la fournit pas
+        """
+        try:
+            cursor.execute(self.QUEUE_SQL)
+            row = cursor.fetchone()
+            conn.commit()
+        except Exception as e:
+            logger.warning(f"Temps serveur indisponible : {str(e)}")
+            conn.rollback()
+            return 0.0
+        if not row or row[0] is None or row[1] is None:
+            return 0.0
+        return (row[1] - row[0]).total_seconds() * 1000
+
+    def _run(self, sql: str, params: tuple = None) -> list:
+        """
+        Exécute une instruction dans sa propre transaction.
+
+        Args:
+            sql (str): Instruction SQL
+            params (tuple, optional): Paramètres de l'instruction
+
+        Returns:
+            list: Lignes renvoyées (liste vide si aucune)
+        """
         conn = self.connector.get_connection()
         cursor = conn.cursor()
-        
         try:
-            # S'assurer qu'il n'y a pas de transaction en cours
-            conn.rollback()
-            
-            # Exécution de la requête avec mesure du temps
-            start_time = time.time()
-            cursor.execute(query)
-            result = cursor.fetchall() if cursor.description else []
-            execution_time = (time.time() - start_time) * 1000
+            cursor.execute(sql, params)
+            rows = cursor.fetchall() if cursor.description else []
             conn.commit()
-            
-            return {
-                'execution_time': execution_time,
-                'row_count': len(result),
-                'physical_reads': 0,  # Valeurs par défaut car non disponibles
-                'physical_writes': 0  # Valeurs par défaut car non disponibles
-            }
-            
-        except Exception as e:
-            logger.error(f"Erreur lors de l'exécution de la requête: {str(e)}")
+            return rows
+        except Exception:
             conn.rollback()
-            return {'error': str(e)}
\ No newline at end of file
+            raise
+
+    def _reconnect(self) -> None:
+        """
+        Remplace la connexion du connecteur, vide le pool de sessions et
+        vérifie que le serveur répond.
+        """
+        self.connector.reset_pool()
+        if self.connector.connection is not None:
+            try:
+                self.connector.connection.close()
+            except Exception:
+                pass
+            self.connector.connection = None
+        self._run('SELECT 1')
+
+    def _evict_buffers(self) -> None:
+        """
+        Lit une table tampon de SCRATCH_SIZE octets (quatre colonnes BIGINT),
+        créée au premier appel ou lorsque sa taille ne correspond plus.
+        """
+        rows = self.SCRATCH_SIZE // 32
+        exists = self._run("SELECT COUNT(*) FROM sys.tables WHERE name = %s",
+                           (self.SCRATCH_TABLE,))[0][0]
+        if not exists or self._run(f'SELECT COUNT(*) FROM "{self.SCRATCH_TABLE}"')[0][0] != rows:
+            if exists:
+                self._run(f'DROP TABLE "{self.SCRATCH_TABLE}"')
+            self._run(f'CREATE TABLE "{self.SCRATCH_TABLE}" AS '
+                      f'SELECT value AS c1, value + 1 AS c2, value + 2 AS c3, value + 3 AS c4 '
+                      f'FROM sys.generate_series(CAST(0 AS BIGINT), CAST({rows} AS BIGINT)) '
+                      f'WITH DATA')
+        self._run(f'SELECT SUM(c1), SUM(c2), SUM(c3), SUM(c4) FROM "{self.SCRATCH_TABLE}"')
+
+    def prewarm(self, table_name: str) -> int:
+        """
+        Charge toutes les colonnes de la table en mémoire en les parcourant.
+
+        MonetDB n'ayant pas d'équivalent à ``pg_prewarm``, chaque colonne est
+        lue par un ``COUNT`` qui oblige le serveur à la charger entièrement.
+
+        Args:
+            table_name (str): Nom de la table
+
+        Returns:
+            int: Nombre de colonnes chargées
+        """
+        columns = [row[0] for row in self._run(
+            "SELECT c.name FROM sys.columns c JOIN sys.tables t ON c.table_id = t.id "
+            "WHERE t.name = %s AND t.schema_id = "
+            "(SELECT id FROM sys.schemas WHERE name = CURRENT_SCHEMA)", (table_name,))]
+        if columns:
+            counts = ', '.join(f'COUNT("{column}")' for column in columns)
+            self._run(f'SELECT {counts} FROM "{table_name}"')
+        return len(columns)
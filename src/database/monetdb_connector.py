@@ -18,6 +18,11 @@ class MonetDBConnector(DatabaseConnector):
         port (int): Port MonetDB (défaut: 50000)
         connection: Objet de connexion MonetDB (initialisé à None)
 
+    La connexion principale est partagée par les chargeurs et les opérations
+    d'administration ; l'exécution des requêtes passe par le pool de sessions
+    (voir ``DatabaseConnector.session``), chaque session étant une connexion
+    pymonetdb distincte.
+
     Notes:
         Les paramètres de connexion peuvent être configurés via les variables
         d'environnement suivantes :
@@ -53,14 +58,17 @@ class MonetDBConnector(DatabaseConnector):
             Les paramètres de connexion sont chargés depuis les variables d'environnement.
         """
         if not self.connection:
-            self.connection = pymonetdb.connect(
-                username=self.user,
-                password=self.password,
-                hostname=self.host,
-                database=self.database,
-                port=self.port
-            )
+            self.connection = self._new_connection()
         return self.connection
+
+    def _new_connection(self):
+        return pymonetdb.connect(
+            username=self.user,
+            password=self.password,
+            hostname=self.host,
+            database=self.database,
+            port=self.port
+        )
     
     def get_connection(self):
         """
@@ -74,4 +82,19 @@ class MonetDBConnector(DatabaseConnector):
         """
         if not self.connection:
             self.connect()
-        return self.connection
\ No newline at end of file
+        return self.connection
+
+    def _pool_connect(self):
+        return self._new_connection()
+
+    def _pool_ping(self, session) -> None:
+        cursor = session.cursor()
+        cursor.execute('SELECT 1')
+        cursor.fetchall()
+        session.rollback()
+
+    def _pool_reset(self, session) -> None:
+        session.rollback()
+
+    def _pool_close(self, session) -> None:
+        session.close()
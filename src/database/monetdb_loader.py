@@ -1,8 +1,7 @@
 from src.base_classes import DatabaseLoader
+import logging
 import pandas as pd
-import time
-from tqdm import tqdm
-import numpy as np
+import pymonetdb
 
 """
 Chargeur de données pour MonetDB.
@@ -11,6 +10,8 @@ Ce module fournit une implémentation concrète de DatabaseLoader pour MonetDB,
 permettant le chargement et la gestion des données depuis des fichiers CSV.
 """
 
+logger = logging.getLogger(__name__)
+
 class MonetDBLoader(DatabaseLoader):
     """
     Chargeur de données pour MonetDB. Gère le chargement des fichiers CSV dans la base de données.
@@ -18,8 +19,17 @@ class MonetDBLoader(DatabaseLoader):
     Cette classe hérite de DatabaseLoader et implémente les méthodes spécifiques à MonetDB
     pour le chargement et la vérification des données.
 
+    Deux modes de chargement sont disponibles :
+        - 'executemany' : insertion par lots de tuples Python via ``cursor.executemany``
+        - 'copy' : chargement en masse via ``COPY n RECORDS INTO ... FROM STDIN``
+
+    Le chargement en flux (``load_csv``) est fourni par DatabaseLoader ; cette
+    classe implémente la création de la table et l'écriture de chaque morceau.
+
     Attributes:
         connector: Instance de MonetDBConnector pour la connexion à la base de données
+        LOAD_MODES (tuple): Modes de chargement supportés
+        COPY_BATCH_SIZE (int): Nombre de lignes envoyées par commande COPY INTO
 
     Methods:
         table_exists(nom_table: str) -> bool:
@@ -27,11 +37,12 @@ class MonetDBLoader(DatabaseLoader):
 
         get_row_count(nom_table: str) -> int:
             Retourne le nombre de lignes dans une table.
-
-        load_csv(chemin_csv: str, nom_table: str, separateur: str = ',', batch_size: int = 1000) -> dict:
-            Charge un fichier CSV dans une table MonetDB.
     """
 
+    LABEL = '📊 MonetDB'
+    LOAD_MODES = ('executemany', 'copy')
+    COPY_BATCH_SIZE = 100000
+
     def table_exists(self, nom_table: str) -> bool:
         """
         Vérifie si une table existe dans la base de données MonetDB.
@@ -77,69 +88,211 @@ class MonetDBLoader(DatabaseLoader):
         cursor.execute(f"SELECT COUNT(*) FROM {nom_table}")
         return cursor.fetchone()[0]
 
-    def load_csv(self, chemin_csv: str, nom_table: str, separateur: str = ',', batch_size: int = 1000) -> dict:
+    def _drop_table(self, nom_table: str) -> None:
         """
-        Charge un fichier CSV dans une table MonetDB.
+        Supprime la table MonetDB si elle existe.
+
+        Args:
+            nom_table (str): Nom de la table à supprimer
+        """
+        if self.table_exists(nom_table):
+            conn = self.connector.get_connection()
+            conn.cursor().execute(f"DROP TABLE IF EXISTS {nom_table}")
+            conn.commit()
+
+    def _execute_sql(self, sql: str, params: tuple = ()):
+        """
+        Exécute une instruction paramétrée sur la connexion partagée puis valide.
+
+        Args:
+            sql (str): Instruction SQL (paramètres ``%s``)
+            params (tuple, optional): Paramètres de l'instruction
+
+        Returns:
+            list: Lignes du résultat, None si l'instruction n'en renvoie pas
         """
-        print(f"\n📊 MonetDB: Chargement de {nom_table}")
-        
         conn = self.connector.get_connection()
         cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params or None)
+            rows = cursor.fetchall() if cursor.description else None
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+        return rows
+
+    def _analyze_table(self, nom_table: str) -> None:
+        """
+        Met à jour les statistiques de la table avec ``ANALYZE``.
+
+        Les versions récentes de MonetDB tiennent leurs statistiques à jour
+        sans cette instruction et la refusent : l'échec est alors journalisé
+        sans interrompre l'analyse.
+
+        Args:
+            nom_table (str): Nom de la table
+        """
+        schema = self._execute_sql("SELECT CURRENT_SCHEMA")[0][0]
+        try:
+            self._execute_sql(f'ANALYZE "{schema}"."{nom_table}"')
+        except pymonetdb.Error as e:
+            logger.warning(f"ANALYZE indisponible sur MonetDB : {e}")
+
+    def _create_index(self, nom_table: str, nom_index: str, column: str, kind: str) -> None:
+        """
+        Crée un index ordonné (``CREATE ORDERED INDEX``) ou des imprints
+        (``CREATE IMPRINTS INDEX``, colonnes numériques uniquement).
+
+        Args:
+            nom_table (str): Nom de la table
+            nom_index (str): Nom de l'index
+            column (str): Colonne indexée
+            kind (str): 'ordered' ou 'imprints'
+        """
+        if self._execute_sql("SELECT COUNT(*) FROM sys.idxs WHERE name = %s", (nom_index,))[0][0]:
+            self._execute_sql(f'DROP INDEX "{nom_index}"')
+        index_type = 'IMPRINTS' if kind == 'imprints' else 'ORDERED'
+        self._execute_sql(f'CREATE {index_type} INDEX "{nom_index}" '
+                          f'ON "{nom_table}" ("{column}")')
+
+    def _index_size(self, nom_table: str, nom_index: str, column: str, kind: str) -> int:
+        """
+        Retourne la taille de l'index d'après ``sys.storage``.
+
+        Args:
+            nom_table (str): Nom de la table
+            nom_index (str): Nom de l'index
+            column (str): Colonne indexée
+            kind (str): 'ordered' ou 'imprints'
+
+        Returns:
+            int: Taille de l'index en octets (0 s'il n'est pas encore matérialisé)
+        """
+        size_column = 'imprints' if kind == 'imprints' else 'orderidx'
+        rows = self._execute_sql(
+            f'SELECT SUM({size_column}) FROM sys.storage WHERE "table" = %s AND "column" = %s',
+            (nom_table, column))
+        return int(rows[0][0] or 0)
+
+    def _create_table(self, nom_table: str, schema) -> None:
+        """
+        Crée la table avec les types compacts du schéma déduit.
+
+        Args:
+            nom_table (str): Nom de la table à créer
+            schema (TableSchema): Schéma déduit des données
+        """
+        conn = self.connector.get_connection()
+        conn.cursor().execute(self.create_table_sql(nom_table, schema))
+        conn.commit()
+
+    def _open_session(self):
+        """
+        Retourne la connexion pymonetdb partagée du connecteur.
+
+        Returns:
+            pymonetdb.Connection: Connexion utilisée pour l'écriture
+        """
+        return self.connector.get_connection()
+
+    def _write_chunk(self, session, nom_table: str, chunk: pd.DataFrame,
+                     mode: str, batch_size: int) -> None:
+        """
+        Écrit un morceau par ``executemany`` (mode 'executemany') ou par
+        ``COPY INTO ... FROM STDIN`` (mode 'copy').
+
+        Args:
+            session: Connexion ouverte par ``_open_session``
+            nom_table (str): Table de destination
+            chunk (pd.DataFrame): Morceau normalisé
+            mode (str): 'executemany' ou 'copy'
+            batch_size (int): Nombre de lignes par lot (mode 'executemany')
+        """
+        cursor = session.cursor()
+        if mode == 'copy':
+            self._copy_batches(cursor, chunk, nom_table)
+        else:
+            self._insert_batches(cursor, chunk, nom_table, batch_size)
+
+    def _insert_batches(self, cursor, df: pd.DataFrame, nom_table: str, batch_size: int) -> None:
+        """
+        Insère le DataFrame par lots de tuples avec ``executemany`` (mode 'executemany').
+
+        Args:
+            cursor: Curseur pymonetdb ouvert
+            df (pd.DataFrame): Données à insérer
+            nom_table (str): Table de destination
+            batch_size (int): Nombre de lignes par lot
+        """
+        placeholders = ','.join(['%s' for _ in range(len(df.columns))])
+        column_names = '","'.join(df.columns)
+        insert_sql = f'INSERT INTO "{nom_table}" ("{column_names}") VALUES ({placeholders})'
         
-        start_time = time.time()
-        
-        print("   ├─ Vérification de la table existante...")
-        if self.table_exists(nom_table):
-            cursor.execute(f"DROP TABLE IF EXISTS {nom_table}")
-        
-        print("   ├─ Lecture du fichier CSV...")
-        df = pd.read_csv(chemin_csv, sep=separateur)
-        df = self.clean_column_names(df)
-        df = df.replace({pd.NA: None, np.nan: None})
-        total_rows = len(df)
-        
-        print(f"   ├─ Création de la table ({len(df.columns)} colonnes)")
-        
-        # Création de la table avec les types appropriés
-        columns = []
-        for col in df.columns:
-            dtype = df[col].dtype
-            if dtype == 'int64':
-                sql_type = 'BIGINT'
-            elif dtype == 'float64':
-                sql_type = 'DOUBLE PRECISION'
-            else:
-                sql_type = 'VARCHAR(1024)'
-            columns.append(f'"{col}" {sql_type}')
-        
-        create_table_sql = f'CREATE TABLE "{nom_table}" ({", ".join(columns)})'
-        cursor.execute(create_table_sql)
-        
-        print(f"   └─ Insertion des données ({total_rows:,} lignes)", end='\r')
-        with tqdm(total=total_rows, unit='lignes', ncols=80) as pbar:
-            for i in range(0, len(df), batch_size):
-                batch = df.iloc[i:i + batch_size]
-                
-                # Préparation des valeurs pour l'insertion
-                placeholders = ','.join(['%s' for _ in range(len(df.columns))])
-                column_names = '","'.join(df.columns)
-                insert_sql = f'INSERT INTO "{nom_table}" ("{column_names}") VALUES ({placeholders})'
-                
-                # Conversion des données en liste de tuples
+        for i in range(0, len(df), batch_size):
+            batch = df.iloc[i:i + batch_size]
+            nbytes = self.phases.nbytes(batch)
+            
+            # Conversion des données en liste de tuples
+            with self.phases.span('convert', len(batch), nbytes):
+                batch = batch.astype(object).where(batch.notna(), None)
                 data = [tuple(x) for x in batch.values]
-                
-                # Exécution de l'insertion
+            
+            # Exécution de l'insertion
+            with self.phases.span('insert', len(batch), nbytes):
                 cursor.executemany(insert_sql, data)
-                pbar.update(len(batch))
-        
-        print(f"\r      ✓ {total_rows:,} lignes insérées")
-        
-        conn.commit()
-        end_time = time.time()
-        total_time = end_time - start_time
-        
-        return {
-            'table_name': nom_table,
-            'load_time': total_time,
-            'total_rows': total_rows
-        }
\ No newline at end of file
+
+    @staticmethod
+    def _to_copy_records(batch: pd.DataFrame) -> str:
+        """
+        Sérialise un lot au format attendu par ``COPY INTO ... FROM STDIN``.
+
+        Les colonnes sont converties en texte de manière vectorisée : les
+        booléens sont écrits ``true``/``false``, les autres valeurs non
+        numériques (chaînes, dates) sont entourées de guillemets (``\\`` et
+        ``"`` échappés par un antislash) et les valeurs manquantes deviennent
+        des champs vides, interprétés comme NULL grâce à ``NULL AS ''``.
+
+        Args:
+            batch (pd.DataFrame): Lot de lignes à sérialiser
+
+        Returns:
+            str: Enregistrements séparés par des retours à la ligne
+        """
+        line = None
+        for col in batch.columns:
+            series = batch[col]
+            if pd.api.types.is_bool_dtype(series):
+                field = series.map({True: 'true', False: 'false'})
+            elif pd.api.types.is_numeric_dtype(series):
+                field = series.astype(str)
+            else:
+                field = ('"' + series.astype(str)
+                         .str.replace('\\', '\\\\', regex=False)
+                         .str.replace('"', '\\"', regex=False) + '"')
+            field = field.mask(series.isna(), '')
+            line = field if line is None else line + ',' + field
+        return '\n'.join(line) + '\n'
+
+    def _copy_batches(self, cursor, df: pd.DataFrame, nom_table: str) -> None:
+        """
+        Charge le DataFrame avec ``COPY n RECORDS INTO ... FROM STDIN`` (mode 'copy').
+
+        Les données suivent directement la commande dans le même message MAPI.
+        Le nombre d'enregistrements est précisé pour que le serveur s'arrête à
+        la fin du lot, avant le terminateur ajouté par pymonetdb.
+
+        Args:
+            cursor: Curseur pymonetdb ouvert
+            df (pd.DataFrame): Données à charger
+            nom_table (str): Table de destination
+        """
+        for i in range(0, len(df), self.COPY_BATCH_SIZE):
+            batch = df.iloc[i:i + self.COPY_BATCH_SIZE]
+            nbytes = self.phases.nbytes(batch)
+            copy_sql = (f'COPY {len(batch)} RECORDS INTO "{nom_table}" FROM STDIN '
+                        f"USING DELIMITERS ',', E'\\n', '\"' NULL AS ''")
+            with self.phases.span('convert', len(batch), nbytes):
+                records = self._to_copy_records(batch)
+            with self.phases.span('insert', len(batch), nbytes):
+                cursor.execute(f"{copy_sql};\n{records}")
@@ -0,0 +1,237 @@
+"""
+Générateur de charge en boucle ouverte (asyncio) à débit d'arrivée contrôlé.
+
+Contrairement à la mesure en boucle fermée (ConcurrencyBenchmark), où chaque
+client attend la réponse avant d'envoyer la requête suivante, les requêtes
+partent ici selon un calendrier fixé à l'avance (arrivées de Poisson ou à
+intervalle fixe), indépendamment des réponses. Quand le SGBD ne suit plus,
+les requêtes s'accumulent en file d'attente : la latence mesurée depuis
+l'instant d'arrivée prévu inclut cette attente, et le débit obtenu décroche
+du débit offert. En balayant plusieurs débits, on repère le point de
+saturation de chaque SGBD.
+
+Les pilotes utilisés (psycopg2, pymonetdb) étant synchrones, chaque requête
+est exécutée par un analyseur existant (PostgresAnalyzer, MonetDBAnalyzer)
+dans un groupe de threads, chaque thread disposant de sa propre connexion.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import numpy as np
+
+
+class OpenLoopBenchmark:
+    """
+    Latence et débit obtenu d'un SGBD pour plusieurs débits d'arrivée offerts.
+
+    Attributes:
+        analyzer_cls (type): Classe concrète de QueryAnalyzer
+        connector_cls (type): Classe concrète de DatabaseConnector
+        duration (float): Durée d'émission des requêtes pour chaque débit (s)
+        max_in_flight (int): Requêtes exécutées simultanément (threads et connexions)
+        arrival (str): Loi des arrivées (voir ARRIVALS)
+        analyzer_options (Dict): Options transmises aux analyseurs
+        ARRIVALS (tuple): Lois d'arrivée supportées ('poisson', 'fixed')
+        DRAIN_TIMEOUT (float): Attente maximale des requêtes en cours après la
+            dernière arrivée (s) ; les requêtes non terminées sont abandonnées
+        SATURATION_RATIO (float): Part minimale du débit offert à atteindre
+        SATURATION_LATENCY (float): Facteur maximal de la latence p95 par
+            rapport à celle du débit le plus faible
+        SEED (int): Graine du calendrier d'arrivées (mesures reproductibles)
+
+    Example:
+        >>> benchmark = OpenLoopBenchmark(PostgresAnalyzer, PostgresConnector, 10)
+        >>> results = benchmark.run(CRIMES_QUERIES, [5, 10, 20, 40])
+        >>> results['saturation_rate']
+    """
+
+    ARRIVALS = ('poisson', 'fixed')
+    DRAIN_TIMEOUT = 30.0
+    SATURATION_RATIO = 0.95
+    SATURATION_LATENCY = 10.0
+    SEED = 0
+
+    def __init__(self, analyzer_cls, connector_cls, duration: float = 10.0,
+                 max_in_flight: int = 16, arrival: str = 'poisson',
+                 analyzer_options: Optional[Dict] = None):
+        if arrival not in self.ARRIVALS:
+            raise ValueError(f"Loi d'arrivée inconnue : {arrival} "
+                             f"(attendu : {', '.join(self.ARRIVALS)})")
+        self.analyzer_cls = analyzer_cls
+        self.connector_cls = connector_cls
+        self.duration = duration
+        self.max_in_flight = max_in_flight
+        self.arrival = arrival
+        self.analyzer_options = analyzer_options or {}
+
+    def schedule(self, rate: float) -> np.ndarray:
+        """
+        Calcule les instants d'arrivée des requêtes sur la durée de la mesure.
+
+        Args:
+            rate (float): Débit offert en requêtes/s
+
+        Returns:
+            np.ndarray: Instants d'arrivée en secondes depuis le début
+
+        Raises:
+            ValueError: Si le débit n'est pas positif
+        """
+        if rate <= 0:
+            raise ValueError(f"Le débit offert doit être positif : {rate}")
+        count = int(rate * self.duration)
+        if self.arrival == 'fixed':
+            return np.arange(count) / rate
+        gaps = np.random.default_rng(self.SEED).exponential(1 / rate, size=count * 2 + 10)
+        arrivals = np.cumsum(gaps) - gaps[0]
+        return arrivals[arrivals < self.duration]
+
+    def run(self, queries: List[str], rates: List[float]) -> Dict:
+        """
+        Mesure chaque débit offert, du plus faible au plus élevé, et repère la saturation.
+
+        Le SGBD est considéré saturé à un débit donné lorsque le débit obtenu
+        reste sous SATURATION_RATIO fois le débit offert, que des requêtes
+        sont abandonnées, ou que la latence p95 dépasse SATURATION_LATENCY
+        fois celle du débit le plus faible.
+
+        Args:
+            queries (List[str]): Mélange de requêtes rejoué
+            rates (List[float]): Débits offerts en requêtes/s
+
+        Returns:
+            Dict: Résultats
+                {
+                    'rates': Dict[float, Dict],   # Mesures par débit (voir ``measure``)
+                    'saturation_rate': float,     # Premier débit saturé (None si aucun)
+                    'max_sustained_rate': float   # Dernier débit tenu (None si aucun)
+                }
+        """
+        results = {rate: self.measure(queries, rate) for rate in sorted(rates)}
+        baseline = None
+        saturation_rate, max_sustained_rate = None, None
+        for rate, result in results.items():
+            if baseline is None:
+                baseline = result['latency']['p95']
+            saturated = (result['achieved_rate'] < self.SATURATION_RATIO * rate
+                         or result['dropped'] > 0
+                         or (baseline and result['latency']['p95'] > self.SATURATION_LATENCY * baseline))
+            result['saturated'] = bool(saturated)
+            if saturated and saturation_rate is None:
+                saturation_rate = rate
+            if not saturated and saturation_rate is None:
+                max_sustained_rate = rate
+        return {'rates': results, 'saturation_rate': saturation_rate,
+                'max_sustained_rate': max_sustained_rate}
+
+    def measure(self, queries: List[str], rate: float) -> Dict:
+        """
+        Envoie les requêtes au débit offert et mesure leurs latences.
+
+        Args:
+            queries (List[str]): Mélange de requêtes rejoué (à tour de rôle)
+            rate (float): Débit offert en requêtes/s
+
+        Returns:
+            Dict: Débit et latences
+                {
+                    'offered_rate': float,   # Débit offert en requêtes/s
+                    'achieved_rate': float,  # Requêtes terminées par seconde
+                    'sent': int,             # Requêtes émises
+                    'completed': int,        # Requêtes terminées
+                    'errors': int,           # Requêtes en erreur
+                    'dropped': int,          # Requêtes abandonnées (DRAIN_TIMEOUT)
+                    'latency': Dict,         # Arrivée prévue -> réponse (ms) :
+                                             # mean, median, p90, p95, p99, max
+                    'service_time': Dict,    # Temps d'exécution par l'analyseur (ms)
+                    'queue_time': Dict       # Attente avant exécution (ms)
+                }
+        """
+        return asyncio.run(self._drive(queries, rate))
+
+    async def _drive(self, queries: List[str], rate: float) -> Dict:
+        arrivals = self.schedule(rate)
+        local = threading.local()
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight,
+                                      thread_name_prefix='open-loop')
+
+        ready = threading.Barrier(self.max_in_flight)
+
+        def connect() -> None:
+            # Chaque thread ouvre sa connexion avant la mesure ; la barrière
+            # empêche un thread déjà connecté de reprendre une autre connexion
+            try:
+                local.analyzer = self.analyzer_cls(self.connector_cls(), server_metrics=False,
+                                                   **self.analyzer_options)
+                local.analyzer.connector.connect()
+                with local.analyzer.connector.session():
+                    pass
+            except Exception:
+                ready.abort()
+                raise
+            ready.wait()
+
+        def execute(query: str) -> tuple:
+            started = time.perf_counter()
+            try:
+                metrics = local.analyzer.analyze_query(query)
+            except Exception as e:
+                metrics = {'error': str(e)}
+            return started, metrics
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(executor, connect)
+                               for _ in range(self.max_in_flight)))
+        begin = time.perf_counter()
+
+        async def request(index: int, scheduled: float) -> tuple:
+            started, metrics = await loop.run_in_executor(
+                executor, execute, queries[index % len(queries)])
+            return scheduled, started, time.perf_counter(), metrics
+
+        tasks = []
+        for index, offset in enumerate(arrivals):
+            delay = begin + offset - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(request(index, begin + offset)))
+
+        done, pending = set(), set()
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=self.DRAIN_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        return self._summarize([task.result() for task in done], len(tasks), len(pending),
+                               rate, begin)
+
+    @staticmethod
+    def _distribution(values: np.ndarray) -> Dict:
+        if not len(values):
+            return dict.fromkeys(('mean', 'median', 'p90', 'p95', 'p99', 'max'), 0.0)
+        p50, p90, p95, p99 = np.percentile(values, [50, 90, 95, 99])
+        return {'mean': float(values.mean()), 'median': float(p50), 'p90': float(p90),
+                'p95': float(p95), 'p99': float(p99), 'max': float(values.max())}
+
+    def _summarize(self, finished: list, sent: int, dropped: int, rate: float,
+                   begin: float) -> Dict:
+        completed = [item for item in finished if 'error' not in item[3]]
+        scheduled = np.array([item[0] for item in completed])
+        started = np.array([item[1] for item in completed])
+        ended = np.array([item[2] for item in completed])
+        service = np.array([item[3]['execution_time'] for item in completed])
+        elapsed = (ended.max() - begin) if len(ended) else 0.0
+        return {
+            'offered_rate': float(rate),
+            'achieved_rate': len(completed) / elapsed if elapsed else 0.0,
+            'sent': sent,
+            'completed': len(completed),
+            'errors': len(finished) - len(completed),
+            'dropped': dropped,
+            'latency': self._distribution((ended - scheduled) * 1000),
+            'service_time': self._distribution(service),
+            'queue_time': self._distribution((started - scheduled) * 1000)
+        }
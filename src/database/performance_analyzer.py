@@ -6,33 +6,529 @@ from src.database.postgres_analyzer import PostgresAnalyzer
 from src.database.monetdb_analyzer import MonetDBAnalyzer
 from src.database.postgres_loader import PostgresLoader
 from src.database.monetdb_loader import MonetDBLoader
+from src.database.csv_dataset import CsvDataset
+from src.database.load_phases import LoadPhases
+from src.database.dataset_cache import DatasetCache
+from src.database.synthetic_dataset import SyntheticDataset
+from src.database.timing_stats import TimingStats
+from src.database.concurrency_benchmark import ConcurrencyBenchmark
+from src.database.open_loop_benchmark import OpenLoopBenchmark
+from src.database.mixed_workload_benchmark import MixedWorkloadBenchmark
+from src.database.engine_scheduler import EngineScheduler, prepare_time
+from src.database.result_fingerprint import ResultFingerprint
+from src.database.query_template import QueryTemplate, bucket_summary
+from src.database.query_registry import QueryDefinition
 import logging
+import os
+import time
+import warnings
 
 logger = logging.getLogger(__name__)
 
+# Options par défaut des groupes de paramètres d'analyze_database_performance
+# (voir sa documentation) ; les options fournies les complètent
+LOAD_OPTIONS = {
+    'pg_load_modes': None,
+    'monet_load_modes': None,
+    'load_workers': None,
+    'cache_dir': None,
+    'dataset_memory_limit': None,
+    'incremental': False,
+    'physical_design': None,
+    'scale_factor': 1.0,
+    'synthetic_seed': 0
+}
+EXECUTION_OPTIONS = {
+    'iterations': 50,
+    'server_metrics': True,
+    'fetch_mode': None,
+    'fetch_size': None,
+    'hash_rows': False,
+    'cache_mode': 'warm',
+    'warmup_iterations': 0,
+    'restart_commands': None,
+    'drop_os_cache': True,
+    'adaptive': False,
+    'min_iterations': 10,
+    'target_ci_width': 0.05,
+    'time_budget': None,
+    'confidence': 0.95,
+    'bootstrap_resamples': 2000,
+    'prepared': False,
+    'workload_seed': 0,
+    'connection_pool': None,
+    'schedule': 'interleaved',
+    'cpu_sets': None
+}
+THROUGHPUT_OPTIONS = {
+    'concurrency_clients': None,
+    'concurrency_duration': 10.0,
+    'open_loop_rates': None,
+    'open_loop_duration': 10.0,
+    'open_loop_arrival': 'poisson',
+    'open_loop_max_in_flight': 16,
+    'mixed_ingest_rates': None,
+    'mixed_duration': 10.0,
+    'mixed_readers': 4,
+    'mixed_writers': 1,
+    'mixed_batch_rows': 1000
+}
+
+def _options(group: str, defaults: dict, options: dict = None) -> dict:
+    """
+    Complète les options d'un groupe par ses valeurs par défaut.
+
+    Args:
+        group: Nom du groupe (pour le message d'erreur)
+        defaults: Options par défaut du groupe
+        options: Options fournies (None pour les valeurs par défaut)
+
+    Returns:
+        Options complètes, dans l'ordre de ``defaults``
+
+    Raises:
+        ValueError: Si une option n'appartient pas au groupe
+    """
+    unknown = set(options or {}) - set(defaults)
+    if unknown:
+        raise ValueError(f"Options inconnues pour {group} : {', '.join(sorted(unknown))}")
+    return {**defaults, **(options or {})}
+
+def _load_runs(loader, chemin_csv: str, dataset: CsvDataset, table_name: str,
+               modes: list[str], workers: list[int],
+               incremental: bool = False) -> dict[str, dict]:
+    """
+    Charge la table avec chaque combinaison de mode et de nombre de processus.
+
+    Args:
+        loader: Chargeur du SGBD (PostgresLoader ou MonetDBLoader)
+        chemin_csv: Chemin du fichier CSV
+        dataset: Jeu de données analysé une seule fois, partagé entre les
+            chargements (None pour relire le fichier en flux à chaque chargement)
+        table_name: Nom de la table à charger
+        modes: Modes de chargement à mesurer
+        workers: Nombres de processus d'écriture à mesurer
+        incremental: Chargement incrémental selon l'empreinte de la table
+
+    Returns:
+        Métriques de chargement par libellé ('<mode>' pour le premier nombre de
+        processus, '<mode> x<processus>' pour les suivants), dans l'ordre des mesures
+    """
+    runs = {}
+    for count in workers:
+        for mode in modes:
+            label = mode if count == workers[0] else f"{mode} x{count}"
+            runs[label] = loader.load_csv(chemin_csv, table_name, mode=mode,
+                                          workers=count, dataset=dataset,
+                                          incremental=incremental)
+    return runs
+
+def _throughput(worker_stats: list[dict]) -> str:
+    """
+    Formate le débit par processus d'un chargement parallèle.
+
+    Args:
+        worker_stats: Statistiques par processus ('worker_stats' de load_csv)
+
+    Returns:
+        Débits en lignes/s séparés par des '/', chaîne vide pour un seul processus
+    """
+    if len(worker_stats) < 2:
+        return ''
+    rates = ' / '.join(f"{stats['rows_per_second']:,.0f}" for stats in worker_stats)
+    return f" [{rates} lignes/s par processus]"
+
+def _action(result: dict, engine: str) -> str:
+    """
+    Signale un chargement de référence ignoré ou incrémental.
+
+    Args:
+        result: Métriques de chargement d'une table (results_loader)
+        engine: 'pg' ou 'monet'
+
+    Returns:
+        Mention à afficher, chaîne vide pour un chargement complet
+    """
+    action = next(iter(result['load_actions'][engine].values()))
+    return {'skip': ' (inchangé, non rechargé)',
+            'append': ' (ajout des nouvelles lignes)'}.get(action, '')
+
+def _server_summary(samples: list[dict]) -> dict:
+    """
+    Agrège les métriques serveur des itérations d'une requête.
+
+    Args:
+        samples: Métriques formatées de chaque itération (format_metrics)
+
+    Returns:
+        Temps serveur (moyenne, min, max) et surcoût client moyen en ms
+        (pilote, réseau, transfert du résultat), moyennes des autres compteurs
+    """
+    server_times = [sample['server_time'] for sample in samples]
+    summary = {
+        'server_time': {
+            'mean': float(np.mean(server_times)),
+            'min': float(np.min(server_times)),
+            'max': float(np.max(server_times))
+        },
+        'client_overhead': float(np.mean([sample['execution_time'] - sample['server_time']
+                                          for sample in samples]))
+    }
+    for key in ('planning_time', 'physical_reads', 'physical_writes',
+                'shared_hit_blocks', 'shared_read_blocks', 'local_hit_blocks',
+                'local_read_blocks', 'rows_processed'):
+        summary[key] = float(np.mean([sample[key] for sample in samples]))
+    return summary
+
+def _latency_summary(samples: list[dict]) -> dict:
+    """
+    Agrège le découpage du temps client des itérations d'une requête.
+
+    Args:
+        samples: Métriques formatées de chaque itération (format_metrics)
+
+    Returns:
+        Moyennes en ms du temps d'exécution, du délai jusqu'à la première
+        ligne, du temps de récupération du résultat, de l'attente d'une
+        session du pool et de l'ouverture des sessions
+    """
+    return {key: float(np.mean([sample[key] for sample in samples]))
+            for key in PostgresAnalyzer.LATENCY_METRICS}
+
+def _interleaved_iterations(pg_analyzer, monet_analyzer, bindings: list[dict],
+                            stats: TimingStats, iterations: int, warmup_iterations: int, cache_mode: str,
+                            drop_os_cache: bool, adaptive: bool, min_iterations: int,
+                            target_ci_width: float, time_budget: float) -> tuple:
+    """
+    Mesure une requête en alternant PostgreSQL et MonetDB à chaque itération.
+
+    Args:
+        pg_analyzer: Analyseur PostgreSQL
+        monet_analyzer: Analyseur MonetDB
+        bindings: Liaisons de la requête (voir QueryTemplate.bindings), les
+            itérations de chauffe puis les itérations mesurées ; une liste plus
+            courte est parcourue en boucle
+        stats: Statistiques utilisées pour l'arrêt adaptatif
+        iterations: Nombre maximal d'itérations
+        warmup_iterations: Itérations de chauffe non mesurées
+        cache_mode: État des caches ('cold', 'warm' ou 'hot')
+        drop_os_cache: Vide aussi le cache de pages du système en mode 'cold'
+        adaptive: Arrêt dès que les intervalles des deux SGBD sont assez étroits
+        min_iterations: Itérations minimales avant un arrêt adaptatif
+        target_ci_width: Largeur relative visée de l'intervalle de confiance
+        time_budget: Durée maximale des itérations en secondes (None sans limite)
+
+    Returns:
+        Temps et métriques formatées de chaque SGBD, méthodes de vidage des
+        caches par SGBD, raison de l'arrêt des itérations et nombre
+        d'exécutions en erreur par SGBD (chauffe comprise)
+    """
+    pg_times = []
+    monet_times = []
+    pg_samples = []
+    monet_samples = []
+    evictions = {'pg': set(), 'monet': set()}
+    errors = {'pg': 0, 'monet': 0}
+    
+    if warmup_iterations:
+        print(f"├─ {warmup_iterations} itérations de chauffe")
+        for index in range(warmup_iterations):
+            query = bindings[index % len(bindings)]['sql']
+            for engine, analyzer in (('pg', pg_analyzer), ('monet', monet_analyzer)):
+                try:
+                    if 'error' in analyzer.analyze_query(query):
+                        errors[engine] += 1
+                except Exception as e:
+                    print(f"\nErreur lors de la chauffe: {str(e)}")
+                    errors[engine] += 1
+    print(f"└─ Exécution de {iterations} itérations"
+          f"{' au plus (arrêt adaptatif)' if adaptive else ''}")
+    
+    stop_reason = 'iterations'
+    query_start = time.perf_counter()
+    with tqdm(total=iterations, unit='iter', ncols=80) as pbar:
+        for iteration in range(1, iterations + 1):
+            if time_budget is not None and time.perf_counter() - query_start > time_budget:
+                stop_reason = 'budget'
+                break
+            if (adaptive and iteration > min_iterations
+                    and iteration % TimingStats.CHECK_EVERY == 0
+                    and stats.converged(pg_times, target_ci_width, min_iterations)
+                    and stats.converged(monet_times, target_ci_width, min_iterations)):
+                stop_reason = 'converged'
+                break
+            index = warmup_iterations + iteration - 1
+            binding = bindings[index % len(bindings)]
+            query = binding['sql']
+            tags = {'binding': index, 'selectivity': binding['selectivity']}
+            engine = 'pg'
+            try:
+                # Exécution PostgreSQL
+                if cache_mode == 'cold':
+                    evictions['pg'].add(pg_analyzer.evict_cache(drop_os_cache))
+                pg_metrics = pg_analyzer.analyze_query(query)
+                if 'error' not in pg_metrics:
+                    pg_times.append(pg_metrics['execution_time'])
+                    pg_samples.append({**pg_analyzer.format_metrics(
+                        {'query': query, **pg_metrics}), **tags})
+                else:
+                    errors['pg'] += 1
+                
+                # Exécution MonetDB
+                engine = 'monet'
+                if cache_mode == 'cold':
+                    evictions['monet'].add(monet_analyzer.evict_cache(drop_os_cache))
+                monet_metrics = monet_analyzer.analyze_query(query)
+                if 'error' not in monet_metrics:
+                    monet_times.append(monet_metrics['execution_time'])
+                    monet_samples.append({**monet_analyzer.format_metrics(
+                        {'query': query, **monet_metrics}), **tags})
+                else:
+                    errors['monet'] += 1
+                    
+            except Exception as e:
+                print(f"\nErreur lors de l'exécution: {str(e)}")
+                errors[engine] += 1
+                continue
+                
+            pbar.update(1)
+    return pg_times, monet_times, pg_samples, monet_samples, evictions, stop_reason, errors
+
+def _fetch_rows(connector, sql: str) -> list:
+    """
+    Exécute une requête de lecture sur une session du pool.
+
+    Args:
+        connector: Connecteur PostgreSQL
+        sql: Requête SQL
+
+    Returns:
+        Lignes renvoyées
+    """
+    with connector.session() as (conn, _):
+        return conn.exec_driver_sql(sql).fetchall()
+
+def _check_results(pg_samples: list[dict], monet_samples: list[dict]) -> tuple:
+    """
+    Vérifie que les deux SGBD renvoient le même résultat.
+
+    Les itérations sont regroupées par liaison (mêmes constantes). Pour chaque
+    liaison, l'empreinte de référence d'un SGBD est la plus fréquente parmi
+    ses itérations ; les itérations dont le résultat en diffère sont écartées
+    des mesures. Les SGBD concordent si leurs références sont égales pour
+    toutes les liaisons mesurées par les deux.
+
+    Args:
+        pg_samples: Métriques formatées des itérations PostgreSQL ('row_hash')
+        monet_samples: Métriques formatées des itérations MonetDB ('row_hash')
+
+    Returns:
+        Itérations PostgreSQL et MonetDB conservées, et vérification
+        {'pg': empreinte, 'monet': empreinte, 'match': bool,
+         'pg_diverging': int, 'monet_diverging': int, 'mismatched_bindings': int}
+        (empreintes de la première liaison différente, ou de la première liaison)
+    """
+    check = {}
+    kept = {}
+    references = {}
+    for engine, samples in (('pg', pg_samples), ('monet', monet_samples)):
+        groups = {}
+        for sample in samples:
+            groups.setdefault(sample.get('binding'), []).append(sample)
+        references[engine] = {
+            binding: ResultFingerprint.majority(sample.get('row_hash') for sample in group)
+            for binding, group in groups.items()}
+        kept[engine] = [sample for sample in samples
+                        if sample.get('row_hash') == references[engine][sample.get('binding')]]
+        check[f'{engine}_diverging'] = len(samples) - len(kept[engine])
+    common = [binding for binding in references['pg'] if binding in references['monet']]
+    mismatched = [binding for binding in common
+                  if references['pg'][binding] is None
+                  or references['pg'][binding] != references['monet'][binding]]
+    shown = mismatched[0] if mismatched else (common[0] if common else None)
+    check['pg'] = references['pg'].get(shown)
+    check['monet'] = references['monet'].get(shown)
+    check['match'] = bool(common) and not mismatched
+    check['mismatched_bindings'] = len(mismatched)
+    return kept['pg'], kept['monet'], check
+
 def analyze_database_performance(
-    queries: list[str], 
+    queries: list, 
     csv_paths: list[tuple[str, str]] = None, 
-    iterations: int = 50,
+    iterations: int = None,
     table_name: str = None,
-    config: dict = None
+    config: dict = None,
+    load: dict = None,
+    execution: dict = None,
+    throughput: dict = None
 ) -> tuple[list[dict], list[dict]]:
     """
     Analyse les performances des requêtes sur PostgreSQL et MonetDB
     
     Args:
-        queries: Liste des requêtes à analyser
+        queries: Liste des requêtes à analyser : textes SQL rejoués à l'identique
+            ou modèles paramétrés (QueryTemplate), dont chaque itération utilise
+            une liaison différente tirée dans les données chargées, éventuellement
+            enregistrés (QueryDefinition) : nom et catégorie sont alors reportés
+            dans les résultats et les propriétés attendues du résultat vérifiées
         csv_paths: Liste des chemins CSV et noms de tables associés
-        iterations: Nombre d'itérations pour chaque requête
+        iterations: Obsolète, remplacé par execution['iterations'] ; une valeur
+            fournie est reportée dans les options d'exécution
         table_name: Nom de la table pour l'analyse
         config: Configuration pour les graphiques
-        
+        load: Options du chargement, complétées par LOAD_OPTIONS :
+            pg_load_modes: Modes de chargement PostgreSQL à mesurer ('insert', 'copy').
+                Le premier mode sert de référence pour 'pg_load_time'.
+            monet_load_modes: Modes de chargement MonetDB à mesurer ('executemany', 'copy').
+                Le premier mode sert de référence pour 'monet_load_time'.
+            load_workers: Nombres de processus d'écriture à mesurer pour chaque mode.
+                Le premier nombre sert de référence ; les autres apparaissent comme
+                des modes supplémentaires nommés '<mode> x<processus>'.
+            cache_dir: Dossier du cache Parquet des CSV nettoyés (None pour relire
+                et analyser les CSV à chaque appel)
+            dataset_memory_limit: Taille en octets au-delà de laquelle un CSV n'est
+                pas conservé en mémoire (voir CsvDataset) : chaque chargement le
+                relit alors en flux, à mémoire bornée, avec le schéma déduit du
+                premier morceau ; sans effet avec un facteur d'échelle différent
+                de 1 (None pour toujours conserver les CSV en mémoire)
+            incremental: Chargement incrémental selon l'empreinte des tables ; seuls le
+                premier mode et le premier nombre de processus sont alors chargés
+            physical_design: Conception physique (statistiques, index) par table,
+                appliquée après le chargement (voir config.PHYSICAL_DESIGN)
+            scale_factor: Facteur d'échelle des données chargées ; inférieur à 1,
+                les tables reçoivent un échantillon aléatoire des lignes du CSV ;
+                supérieur à 1, des lignes synthétiques apprises sur les CSV et
+                générées pendant le chargement (voir SyntheticDataset) ; sans
+                chargement incrémental dans les deux cas
+            synthetic_seed: Graine de l'échantillonnage ou de la génération des lignes
+        execution: Options de l'exécution des requêtes, complétées par
+            EXECUTION_OPTIONS :
+            iterations: Nombre d'itérations pour chaque requête (maximum en mode adaptatif)
+            server_metrics: Relève à chaque itération les métriques du serveur
+                (temps moteur, blocs lus, lignes traitées) en plus du temps client
+            fetch_mode: Consommation des résultats ('fetchall' pour les matérialiser,
+                'stream' pour les parcourir par lots sans les conserver)
+            fetch_size: Lignes par lot en mode 'stream'
+            hash_rows: Calcule une empreinte des lignes reçues à chaque itération et
+                vérifie que les deux SGBD renvoient le même résultat ; les itérations
+                au résultat divergent sont écartées, et une différence entre SGBD est
+                signalée ('results_match') et annule le verdict
+            cache_mode: État des caches lors des mesures : 'cold' (caches vidés
+                avant chaque itération), 'warm' (itérations de chauffe non mesurées)
+                ou 'hot' (tables chargées en mémoire puis itérations de chauffe)
+            warmup_iterations: Itérations de chauffe non mesurées par requête
+                (modes 'warm' et 'hot')
+            restart_commands: Commandes redémarrant chaque serveur de test en mode
+                'cold' ({'postgres': ..., 'monetdb': ...}, None pour lire une table tampon)
+            drop_os_cache: Vide aussi le cache de pages du système en mode 'cold'
+                lorsque les droits le permettent
+            adaptive: Arrête les itérations d'une requête dès que l'intervalle de
+                confiance des deux SGBD est assez étroit ou que le budget est épuisé
+            min_iterations: Itérations minimales avant un arrêt adaptatif
+            target_ci_width: Largeur visée de l'intervalle de confiance, rapportée
+                à la moyenne (0.05 pour ±2,5 %)
+            time_budget: Durée maximale des itérations d'une requête en secondes
+                (None pour aucune limite)
+            confidence: Niveau de confiance des intervalles (bootstrap)
+            bootstrap_resamples: Nombre de rééchantillonnages du bootstrap
+            prepared: Prépare chaque requête (une fois par modèle paramétré)
+                par connexion et ne mesure que son exécution (durée de
+                préparation relevée à part, planification PostgreSQL dans
+                les métriques serveur)
+            workload_seed: Graine des liaisons tirées pour les modèles paramétrés
+                (la requête i utilise la graine workload_seed + i)
+            connection_pool: Options du pool de sessions des connecteurs
+                ('pool_size', 'pre_ping', 'pinned', 'recycle', voir DatabaseConnector)
+            schedule: Ordonnancement des mesures : 'interleaved' (SGBD alternés à
+                chaque itération), 'parallel' (un processus par SGBD, simultanés)
+                ou 'isolated' (un processus par SGBD, l'un après l'autre) ; la
+                durée des mesures est ajoutée à config['schedule']
+            cpu_sets: Processeurs réservés au processus de chaque SGBD en mode
+                'parallel' ou 'isolated' ({'postgres': [...], 'monetdb': [...]})
+        throughput: Options des mesures de débit, complétées par
+            THROUGHPUT_OPTIONS (toutes désactivées par défaut) :
+            concurrency_clients: Nombres de clients simultanés de la mesure de débit
+                en boucle fermée (None pour ne pas la lancer) ; les résultats sont
+                ajoutés à config['concurrency']
+            concurrency_duration: Durée de la mesure de débit pour chaque nombre
+                de clients, en secondes
+            open_loop_rates: Débits d'arrivée offerts (requêtes/s) de la mesure en
+                boucle ouverte (None pour ne pas la lancer) ; les résultats sont
+                ajoutés à config['open_loop']
+            open_loop_duration: Durée d'émission pour chaque débit, en secondes
+            open_loop_arrival: Loi des arrivées ('poisson' ou 'fixed')
+            open_loop_max_in_flight: Requêtes exécutées simultanément (connexions)
+            mixed_ingest_rates: Débits d'ingestion visés (lignes/s) de la charge mixte
+                (None pour ne pas la lancer) : des processus d'écriture ajoutent des
+                micro-lots à la table analysée pendant que des lecteurs rejouent les
+                requêtes ; les résultats sont ajoutés à config['mixed_workload'] et
+                la table est restaurée après chaque débit
+            mixed_duration: Durée de la charge mixte pour chaque débit, en secondes
+            mixed_readers: Processus lecteurs de la charge mixte
+            mixed_writers: Processus d'écriture de la charge mixte
+            mixed_batch_rows: Lignes par micro-lot ajouté
+
     Returns:
         Tuple contenant les résultats d'analyse et les métriques de chargement
     """
     if config is None:
         config = {}  # Initialisation d'un dictionnaire vide si config est None
     
+    load = _options('load', LOAD_OPTIONS, load)
+    pg_load_modes = load['pg_load_modes'] or ['insert']
+    monet_load_modes = load['monet_load_modes'] or ['executemany']
+    load_workers = load['load_workers'] or [1]
+    cache_dir = load['cache_dir']
+    dataset_memory_limit = load['dataset_memory_limit']
+    incremental = load['incremental']
+    physical_design = load['physical_design']
+    scale_factor = load['scale_factor']
+    synthetic_seed = load['synthetic_seed']
+    
+    if iterations is not None:
+        warnings.warn("Le paramètre iterations est obsolète, utiliser execution['iterations']",
+                      DeprecationWarning, stacklevel=2)
+        execution = {**(execution or {}), 'iterations': iterations}
+    execution = _options('execution', EXECUTION_OPTIONS, execution)
+    iterations = execution['iterations']
+    server_metrics = execution['server_metrics']
+    fetch_mode = execution['fetch_mode']
+    fetch_size = execution['fetch_size']
+    hash_rows = execution['hash_rows']
+    cache_mode = execution['cache_mode']
+    warmup_iterations = execution['warmup_iterations']
+    restart_commands = execution['restart_commands']
+    drop_os_cache = execution['drop_os_cache']
+    adaptive = execution['adaptive']
+    min_iterations = execution['min_iterations']
+    target_ci_width = execution['target_ci_width']
+    time_budget = execution['time_budget']
+    confidence = execution['confidence']
+    bootstrap_resamples = execution['bootstrap_resamples']
+    prepared = execution['prepared']
+    workload_seed = execution['workload_seed']
+    connection_pool = execution['connection_pool']
+    schedule = execution['schedule']
+    cpu_sets = execution['cpu_sets']
+    
+    throughput = _options('throughput', THROUGHPUT_OPTIONS, throughput)
+    concurrency_clients = throughput['concurrency_clients']
+    concurrency_duration = throughput['concurrency_duration']
+    open_loop_rates = throughput['open_loop_rates']
+    open_loop_duration = throughput['open_loop_duration']
+    open_loop_arrival = throughput['open_loop_arrival']
+    open_loop_max_in_flight = throughput['open_loop_max_in_flight']
+    mixed_ingest_rates = throughput['mixed_ingest_rates']
+    mixed_duration = throughput['mixed_duration']
+    mixed_readers = throughput['mixed_readers']
+    mixed_writers = throughput['mixed_writers']
+    mixed_batch_rows = throughput['mixed_batch_rows']
+    
+    if incremental:
+        # Un autre mode invaliderait l'empreinte à chaque chargement
+        pg_load_modes, monet_load_modes = pg_load_modes[:1], monet_load_modes[:1]
+        load_workers = load_workers[:1]
+    
     logger.info(f"Démarrage de l'analyse pour la table {table_name}")
     
     # Validation des paramètres
@@ -42,6 +538,14 @@ def analyze_database_performance(
     if iterations < 1:
         raise ValueError("Le nombre d'itérations doit être positif")
     
+    if cache_mode not in PostgresAnalyzer.CACHE_MODES:
+        raise ValueError(f"Mode de mesure inconnu : {cache_mode} "
+                         f"(attendu : {', '.join(PostgresAnalyzer.CACHE_MODES)})")
+    restart_commands = restart_commands or {}
+    if schedule not in EngineScheduler.MODES:
+        raise ValueError(f"Ordonnancement inconnu : {schedule} "
+                         f"(attendu : {', '.join(EngineScheduler.MODES)})")
+    
     # Filtrer les CSV paths pour ne charger que la table demandée
     if table_name and csv_paths:
         csv_paths = [(path, name) for path, name in csv_paths if name == table_name]
@@ -50,19 +554,25 @@ def analyze_database_performance(
     
     try:
         # Initialisation des connecteurs avec gestion d'erreur
-        pg_connector = PostgresConnector()
-        monet_connector = MonetDBConnector()
+        pg_connector = PostgresConnector(**(connection_pool or {}))
+        monet_connector = MonetDBConnector(**(connection_pool or {}))
         
         # Tentative de connexion
         pg_connector.connect()
         monet_connector.connect()
         
         # Initialisation des analyzers
-        pg_analyzer = PostgresAnalyzer(pg_connector)
-        monet_analyzer = MonetDBAnalyzer(monet_connector)
+        analyzer_options = {'server_metrics': server_metrics, 'fetch_mode': fetch_mode,
+                            'fetch_size': fetch_size, 'hash_rows': hash_rows,
+                            'prepared': prepared}
+        pg_analyzer = PostgresAnalyzer(pg_connector, **analyzer_options,
+                                       restart_command=restart_commands.get('postgres'))
+        monet_analyzer = MonetDBAnalyzer(monet_connector, **analyzer_options,
+                                         restart_command=restart_commands.get('monetdb'))
         
         # Initialiser results_loader comme une liste vide par défaut
         results_loader = []
+        append_rows = {}
         
         # Si un fichier CSV est fourni, chargement des données
         if csv_paths:
@@ -72,29 +582,127 @@ def analyze_database_performance(
             
             pg_loader = PostgresLoader(pg_connector)
             monet_loader = MonetDBLoader(monet_connector)
+            cache = DatasetCache(cache_dir) if cache_dir else None
+            # L'empreinte du CSV ne décrit pas un jeu synthétique
+            table_incremental = incremental and scale_factor == 1
             
             
             for path, table_name in csv_paths:
-                pg_metrics = pg_loader.load_csv(path, table_name)
-                monet_metrics = monet_loader.load_csv(path, table_name)
+                # Lecture et nettoyage uniques du CSV, partagés par tous les chargements
+                streamed = (scale_factor == 1 and dataset_memory_limit is not None
+                            and os.path.getsize(path) > dataset_memory_limit)
+                if streamed:
+                    # Trop volumineux pour être conservé : chaque chargement relit le CSV
+                    print(f"\n📄 {path} : plus de {dataset_memory_limit:,} octets, "
+                          f"lecture en flux à chaque chargement")
+                    dataset = None
+                elif cache:
+                    dataset = cache.load(path, pg_loader)
+                else:
+                    dataset = CsvDataset.from_csv(path, pg_loader)
+                if scale_factor < 1:
+                    # Lignes réelles tirées au hasard, avec le schéma du jeu complet
+                    dataset = dataset.sample(scale_factor, seed=synthetic_seed)
+                    print(f"🧪 Échantillon x{scale_factor:g} : {dataset.total_rows:,} lignes")
+                elif scale_factor > 1:
+                    # Lignes synthétiques générées pendant chaque chargement
+                    dataset = SyntheticDataset(dataset, scale_factor, seed=synthetic_seed)
+                    print(f"🧪 Jeu synthétique x{scale_factor:g} : {dataset.total_rows:,} lignes"
+                          f" ({len(dataset.models)} colonnes apprises)")
+                if mixed_ingest_rates:
+                    # Lignes ajoutées par la charge mixte : premier morceau du jeu chargé
+                    chunks = (pg_loader.read_csv_chunks(path, phases=LoadPhases()) if streamed
+                              else dataset.iter_chunks())
+                    append_rows[table_name] = next(chunks)
+                    chunks.close()
+                pg_runs = _load_runs(pg_loader, path, dataset, table_name, pg_load_modes,
+                                     load_workers, table_incremental)
+                pg_metrics = next(iter(pg_runs.values()))
+                monet_runs = _load_runs(monet_loader, path, dataset, table_name,
+                                        monet_load_modes, load_workers, table_incremental)
+                if streamed:
+                    # Lecture comprise dans chaque chargement (phases 'parse' et 'clean')
+                    parse_time, from_cache, parse_phases = 0.0, False, {}
+                else:
+                    parse_time, from_cache = dataset.parse_time, dataset.from_cache
+                    parse_phases = dataset.phases.to_dict()
+
+                # Conception physique sur la table chargée en dernier
+                design = (physical_design or {}).get(table_name)
+                pg_design = pg_loader.apply_physical_design(table_name, design) if design else None
+                monet_design = (monet_loader.apply_physical_design(table_name, design)
+                                if design else None)
+                del dataset  # Libère les morceaux avant la table suivante
+                monet_metrics = next(iter(monet_runs.values()))
+                total_rows = pg_metrics['total_rows']
                 
                 results_loader.append({
                     'table_name': table_name,
-                    'rows': pg_metrics['total_rows'],
+                    'rows': total_rows,
+                    'scale_factor': scale_factor,
+                    'parse_time': round(parse_time, 2),
+                    'from_cache': from_cache,
                     'pg_load_time': round(pg_metrics['load_time'], 2),
                     'monet_load_time': round(monet_metrics['load_time'], 2),
                     'ratio': round(monet_metrics['load_time'] / (pg_metrics['load_time'] or 0.001), 2),
                     'load_per_row': {
-                        'pg': round((pg_metrics['load_time'] * 1000) / pg_metrics['total_rows'], 4),  # ms/ligne
-                        'monet': round((monet_metrics['load_time'] * 1000) / pg_metrics['total_rows'], 4)
+                        'pg': round((pg_metrics['load_time'] * 1000) / total_rows, 4),  # ms/ligne
+                        'monet': round((monet_metrics['load_time'] * 1000) / total_rows, 4)
+                    },
+                    'load_modes': {
+                        'pg': {mode: round(metrics['load_time'], 2)
+                               for mode, metrics in pg_runs.items()},
+                        'monet': {mode: round(metrics['load_time'], 2)
+                                  for mode, metrics in monet_runs.items()}
+                    },
+                    'load_per_row_by_mode': {
+                        'pg': {mode: round((metrics['load_time'] * 1000) / total_rows, 4)
+                               for mode, metrics in pg_runs.items()},
+                        'monet': {mode: round((metrics['load_time'] * 1000) / total_rows, 4)
+                                  for mode, metrics in monet_runs.items()}
+                    },
+                    'load_actions': {
+                        'pg': {mode: metrics['load_action'] for mode, metrics in pg_runs.items()},
+                        'monet': {mode: metrics['load_action']
+                                  for mode, metrics in monet_runs.items()}
+                    },
+                    'parse_phases': parse_phases,
+                    'pg_design_time': round(pg_design['total_time'], 2) if pg_design else 0.0,
+                    'monet_design_time': (round(monet_design['total_time'], 2)
+                                          if monet_design else 0.0),
+                    'physical_design': {'pg': pg_design, 'monet': monet_design},
+                    'load_phases': {
+                        'pg': {mode: metrics['phases'] for mode, metrics in pg_runs.items()},
+                        'monet': {mode: metrics['phases'] for mode, metrics in monet_runs.items()}
+                    },
+                    'load_workers': {
+                        'pg': {mode: metrics['worker_stats'] for mode, metrics in pg_runs.items()},
+                        'monet': {mode: metrics['worker_stats']
+                                  for mode, metrics in monet_runs.items()}
                     }
                 })
             
             print("\n📊 Résumé du chargement :")
             for result in results_loader:
-                print(f"\n{result['table_name']} ({result['rows']:,} lignes)")
-                print(f"├─ PostgreSQL : {result['pg_load_time']}s")
-                print(f"└─ MonetDB   : {result['monet_load_time']}s (x{result['ratio']})")
+                scale = ''
+                if result['scale_factor'] != 1:
+                    kind = 'échantillon' if result['scale_factor'] < 1 else 'synthétique'
+                    scale = f", {kind} x{result['scale_factor']:g}"
+                print(f"\n{result['table_name']} ({result['rows']:,} lignes{scale})")
+                source = 'cache' if result['from_cache'] else 'CSV'
+                print(f"├─ Lecture {source} : {result['parse_time']}s (commune aux deux SGBD)")
+                print(f"├─ PostgreSQL : {result['pg_load_time']}s{_action(result, 'pg')}"
+                      f" + conception {result['pg_design_time']}s")
+                for mode, load_time in result['load_modes']['pg'].items():
+                    per_row = result['load_per_row_by_mode']['pg'][mode]
+                    print(f"│  ├─ {mode:<11}: {load_time}s ({per_row} ms/ligne)"
+                          f"{_throughput(result['load_workers']['pg'][mode])}")
+                print(f"└─ MonetDB   : {result['monet_load_time']}s (x{result['ratio']})"
+                      f"{_action(result, 'monet')} + conception {result['monet_design_time']}s")
+                for mode, load_time in result['load_modes']['monet'].items():
+                    per_row = result['load_per_row_by_mode']['monet'][mode]
+                    print(f"   ├─ {mode:<11}: {load_time}s ({per_row} ms/ligne)"
+                          f"{_throughput(result['load_workers']['monet'][mode])}")
             
             print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         
@@ -102,59 +710,311 @@ def analyze_database_performance(
         results_analyzer = []
         total_queries = len(queries)
         
-        print(f"\n⏳ Exécution des requêtes...")
+        if cache_mode == 'cold':
+            warmup_iterations = 0
+        stats = TimingStats(confidence=confidence, resamples=bootstrap_resamples)
+        
+        # Requêtes enregistrées : la requête exécutée et sa définition
+        definitions = [query if isinstance(query, QueryDefinition) else None
+                       for query in queries]
+        queries = [query.query if isinstance(query, QueryDefinition) else query
+                   for query in queries]
+        
+        # Liaisons des modèles paramétrés, tirées dans les données chargées et
+        # communes aux deux SGBD : chauffe puis itérations mesurées
+        workloads = []
+        for i, query in enumerate(queries):
+            if isinstance(query, QueryTemplate):
+                query.fit(lambda sql: _fetch_rows(pg_connector, sql))
+                workloads.append(query.bindings(warmup_iterations + iterations,
+                                                seed=workload_seed + i))
+            else:
+                workloads.append(QueryTemplate.fixed(query))
+        
+        scheduled = None
+        if schedule == 'interleaved':
+            print(f"\n⏳ Exécution des requêtes (mesures à {cache_mode})...")
+        else:
+            print(f"\n⏳ Exécution des requêtes (mesures à {cache_mode},"
+                  f" SGBD {'en parallèle' if schedule == 'parallel' else 'isolés'}"
+                  f" dans des processus séparés)...")
+        prewarm_tables = [table_name] if table_name else [name for _, name in csv_paths or []]
+        if schedule != 'interleaved':
+            scheduler = EngineScheduler(
+                {'pg': (PostgresAnalyzer, PostgresConnector),
+                 'monet': (MonetDBAnalyzer, MonetDBConnector)},
+                schedule, cpu_sets,
+                {'connection_pool': connection_pool, 'analyzer_options': analyzer_options,
+                 'restart_commands': restart_commands})
+            scheduled = scheduler.run(workloads, {
+                'iterations': iterations, 'warmup_iterations': warmup_iterations,
+                'cache_mode': cache_mode, 'drop_os_cache': drop_os_cache,
+                'adaptive': adaptive, 'min_iterations': min_iterations,
+                'target_ci_width': target_ci_width, 'time_budget': time_budget,
+                'confidence': confidence, 'bootstrap_resamples': bootstrap_resamples,
+                'prewarm_tables': prewarm_tables})
+            for name in scheduled['prewarmed'].get('pg', {}):
+                print(f"🔥 {name} chargée en mémoire : PostgreSQL"
+                      f" {scheduled['prewarmed']['pg'][name]:,} blocs, MonetDB"
+                      f" {scheduled['prewarmed']['monet'][name]} colonnes")
+            engine_time = scheduled['engine_time']
+            print(f"└─ Mesures terminées en {scheduled['wall_time']:.1f} s"
+                  f" (PostgreSQL {engine_time['pg']:.1f} s, MonetDB {engine_time['monet']:.1f} s)")
+            config['schedule'] = {'mode': schedule, 'cpu_sets': cpu_sets,
+                                  'wall_time': scheduled['wall_time'],
+                                  'engine_time': engine_time}
+        elif cache_mode == 'hot':
+            for name in prewarm_tables:
+                pg_blocks = pg_analyzer.prewarm(name)
+                monet_columns = monet_analyzer.prewarm(name)
+                print(f"🔥 {name} chargée en mémoire : PostgreSQL {pg_blocks:,} blocs, "
+                      f"MonetDB {monet_columns} colonnes")
+        
+        suite_start = time.perf_counter()
         for i, query in enumerate(queries, 1):
-            pg_times = []
-            monet_times = []
-            
-            print(f"\n Requête {i}/{total_queries}")
-            print(f"└─ Exécution de {iterations} itérations")
+            definition = definitions[i - 1]
+            print(f"\n Requête {i}/{total_queries}"
+                  f"{f' : {definition.name} ({definition.label})' if definition else ''}")
+            if scheduled:
+                pg_run = scheduled['engines']['pg'][i - 1]
+                monet_run = scheduled['engines']['monet'][i - 1]
+                pg_times, pg_samples = pg_run['times'], pg_run['samples']
+                monet_times, monet_samples = monet_run['times'], monet_run['samples']
+                evictions = {'pg': set(pg_run['evictions']), 'monet': set(monet_run['evictions'])}
+                prepare_times = {'pg': pg_run['prepare_time'], 'monet': monet_run['prepare_time']}
+                errors = {'pg': pg_run['errors'], 'monet': monet_run['errors']}
+                stop_reason = (pg_run['stop_reason'] if pg_run['stop_reason'] == monet_run['stop_reason']
+                               else f"{pg_run['stop_reason']}/{monet_run['stop_reason']}")
+            else:
+                (pg_times, monet_times, pg_samples, monet_samples, evictions, stop_reason,
+                 errors) = (
+                    _interleaved_iterations(
+                        pg_analyzer, monet_analyzer, workloads[i - 1], stats, iterations,
+                        warmup_iterations, cache_mode, drop_os_cache, adaptive, min_iterations,
+                        target_ci_width, time_budget))
+                prepare_times = {'pg': prepare_time(pg_analyzer, workloads[i - 1]),
+                                 'monet': prepare_time(monet_analyzer, workloads[i - 1])}
             
-            with tqdm(total=iterations, unit='iter', ncols=80) as pbar:
-                for _ in range(iterations):
-                    try:
-                        # Exécution PostgreSQL
-                        pg_metrics = pg_analyzer.analyze_query(query)
-                        if 'error' not in pg_metrics:
-                            pg_times.append(pg_metrics['execution_time'])
-                        
-                        # Exécution MonetDB
-                        monet_metrics = monet_analyzer.analyze_query(query)
-                        if 'error' not in monet_metrics:
-                            monet_times.append(monet_metrics['execution_time'])
-                            
-                    except Exception as e:
-                        print(f"\nErreur lors de l'exécution: {str(e)}")
-                        continue
-                        
-                    pbar.update(1)
+            result_check = None
+            if hash_rows:
+                pg_samples, monet_samples, result_check = _check_results(pg_samples,
+                                                                         monet_samples)
+                pg_times = [sample['execution_time'] for sample in pg_samples]
+                monet_times = [sample['execution_time'] for sample in monet_samples]
             
             # Vérification qu'il y a des résultats valides
             if pg_times and monet_times:
+                pg_stats = stats.summarize(pg_times)
+                monet_stats = stats.summarize(monet_times)
                 comparison = {
                     'query_id': i,
-                    'query': query,
-                    'pg_execution_time': {
-                        'mean': float(np.mean(pg_times)),
-                        'min': float(np.min(pg_times)),
-                        'max': float(np.max(pg_times))
-                    },
-                    'monet_execution_time': {
-                        'mean': float(np.mean(monet_times)), 
-                        'min': float(np.min(monet_times)),
-                        'max': float(np.max(monet_times))
-                    }
+                    'query': str(query),
+                    'template': query.label if isinstance(query, QueryTemplate) else None,
+                    'name': definition.name if definition else None,
+                    'category': definition.category if definition else None,
+                    'category_label': definition.label if definition else None,
+                    'tables': list(definition.tables) if definition else None,
+                    'pg_execution_time': pg_stats,
+                    'monet_execution_time': monet_stats,
+                    'iterations': len(pg_times),
+                    'monet_iterations': len(monet_times),
+                    'schedule': schedule,
+                    'stop_reason': stop_reason,
+                    'errors': errors,
+                    'verdict': TimingStats.verdict(pg_stats, monet_stats),
+                    'result_check': result_check,
+                    'results_match': result_check['match'] if result_check else None,
+                    'fetch_mode': pg_analyzer.fetch_mode,
+                    'prepared': prepared,
+                    'prepare_time': prepare_times,
+                    'planning_time': ({'pg': float(np.mean([sample['planning_time']
+                                                            for sample in pg_samples])),
+                                       'monet': None} if server_metrics else None),
+                    'cache_mode': cache_mode,
+                    'warmup_iterations': warmup_iterations,
+                    'cache_eviction': {engine: ', '.join(sorted(methods))
+                                       for engine, methods in evictions.items()},
+                    'pg_latency': _latency_summary(pg_samples),
+                    'monet_latency': _latency_summary(monet_samples),
+                    'pg_selectivity': bucket_summary(pg_samples),
+                    'monet_selectivity': bucket_summary(monet_samples),
+                    'expected': definition.expected if definition else None,
+                    'expectation_violations': (
+                        {'pg': definition.violations(pg_samples),
+                         'monet': definition.violations(monet_samples)}
+                        if definition and definition.expected else None)
                 }
+                winner = {'postgres': 'PostgreSQL plus rapide',
+                          'monetdb': 'MonetDB plus rapide'}.get(comparison['verdict'],
+                                                                'différence non significative')
+                if result_check and not result_check['match']:
+                    # Temps non comparables : les SGBD ne font pas le même travail
+                    comparison['verdict'] = None
+                    winner = 'résultats différents, pas de verdict'
+                counts = (f"{len(pg_times)}" if len(pg_times) == len(monet_times)
+                          else f"{len(pg_times)}/{len(monet_times)}")
+                print(f"├─ {counts} itérations ({stop_reason}) : {winner}")
+                if errors['pg'] or errors['monet']:
+                    print(f"├─ ⚠️ Exécutions en erreur : PostgreSQL {errors['pg']},"
+                          f" MonetDB {errors['monet']}")
+                if result_check:
+                    diverging = result_check['pg_diverging'] + result_check['monet_diverging']
+                    if not result_check['match']:
+                        print(f"├─ ⚠️ Résultats différents : PostgreSQL {result_check['pg']},"
+                              f" MonetDB {result_check['monet']} (temps non comparables)")
+                    if diverging:
+                        print(f"├─ ⚠️ {diverging} itérations écartées (résultat différent"
+                              f" de celui des autres itérations)")
+                violations = comparison['expectation_violations']
+                if violations and (violations['pg'] or violations['monet']):
+                    print(f"├─ ⚠️ Résultat inattendu ({definition.expected}) :"
+                          f" PostgreSQL {violations['pg']}, MonetDB {violations['monet']}"
+                          f" itérations")
+                for engine, label in (('pg', 'PostgreSQL'), ('monet', 'MonetDB   ')):
+                    timing = comparison[f'{engine}_execution_time']
+                    print(f"├─ {label} : médiane {timing['median']:.2f} ms,"
+                          f" p95 {timing['p95']:.2f} ms,"
+                          f" IC {confidence:.0%} [{timing['ci_low']:.2f} ; {timing['ci_high']:.2f}] ms"
+                          f" ({timing['outliers']} valeurs aberrantes)")
+                for bucket, pg_bucket in comparison['pg_selectivity'].items():
+                    monet_bucket = comparison['monet_selectivity'].get(bucket)
+                    monet_text = (f"MonetDB {monet_bucket['median']:.2f} ms"
+                                  if monet_bucket else "MonetDB -")
+                    print(f"├─ Sélectivité {bucket:>10} ({pg_bucket['count']} liaisons) :"
+                          f" médiane PostgreSQL {pg_bucket['median']:.2f} ms, {monet_text}")
+                if prepared:
+                    print(f"├─ Préparation (une fois par connexion) :"
+                          f" PostgreSQL {comparison['prepare_time']['pg']:.2f} ms (analyse),"
+                          f" MonetDB {comparison['prepare_time']['monet']:.2f} ms (compilation)")
+                    planning = (f"{comparison['planning_time']['pg']:.2f} ms"
+                                if comparison['planning_time'] else "non mesurée")
+                    print(f"├─ Planification PostgreSQL par exécution"
+                          f" (pg_stat_statements) : {planning}")
+                for engine, label in (('pg', 'PostgreSQL'), ('monet', 'MonetDB   ')):
+                    latency = comparison[f'{engine}_latency']
+                    print(f"├─ {label} : exécution {latency['execute_time']:.2f} ms,"
+                          f" première ligne {latency['first_row_time']:.2f} ms,"
+                          f" récupération {latency['fetch_time']:.2f} ms"
+                          f" (pool : attente {latency['pool_wait_time']:.2f} ms,"
+                          f" connexion {latency['connect_time']:.2f} ms)")
+                if server_metrics:
+                    comparison['pg_server_metrics'] = _server_summary(pg_samples)
+                    comparison['monet_server_metrics'] = _server_summary(monet_samples)
+                    pg_server = comparison['pg_server_metrics']
+                    monet_server = comparison['monet_server_metrics']
+                    print(f"├─ PostgreSQL : planification {pg_server['planning_time']:.2f} ms,"
+                          f" serveur {pg_server['server_time']['mean']:.2f} ms"
+                          f" + client {pg_server['client_overhead']:.2f} ms"
+                          f" ({pg_server['shared_hit_blocks']:,.0f} blocs en cache,"
+                          f" {pg_server['physical_reads']:,.0f} lus,"
+                          f" {pg_server['rows_processed']:,.0f} lignes renvoyées)")
+                    print(f"└─ MonetDB    : serveur {monet_server['server_time']['mean']:.2f} ms"
+                          f" + client {monet_server['client_overhead']:.2f} ms")
                 results_analyzer.append(comparison)
             else:
                 print(f"\n⚠️ Aucun résultat valide pour la requête {i}")
+        if not scheduled:
+            config['schedule'] = {'mode': schedule, 'cpu_sets': None,
+                                  'wall_time': time.perf_counter() - suite_start,
+                                  'engine_time': None}
+        
+        # Mélange rejoué par les mesures de débit : les liaisons mesurées des
+        # modèles, à tour de rôle entre les requêtes
+        rounds = max(len(workload) for workload in workloads)
+        mix = [workload[k % len(workload)]['sql'] for k in range(rounds)
+               for workload in workloads]
+        
+        if concurrency_clients:
+            print(f"\n⏳ Mesure du débit concurrent ({concurrency_duration:.0f} s par palier)...")
+            concurrency = {}
+            for engine, label, analyzer_cls, connector_cls in (
+                    ('pg', 'PostgreSQL', PostgresAnalyzer, PostgresConnector),
+                    ('monet', 'MonetDB', MonetDBAnalyzer, MonetDBConnector)):
+                benchmark = ConcurrencyBenchmark(
+                    analyzer_cls, connector_cls, concurrency_duration,
+                    {'fetch_mode': fetch_mode, 'fetch_size': fetch_size, 'prepared': prepared})
+                concurrency[engine] = benchmark.run(mix, concurrency_clients)
+                print(f"\n{label}")
+                for count, result in concurrency[engine].items():
+                    errors = f" ({result['errors']} erreurs)" if result['errors'] else ''
+                    print(f"├─ {count:>3} clients : {result['qps']:,.1f} requêtes/s,"
+                          f" médiane {result['latency']['median']:.2f} ms,"
+                          f" p95 {result['latency']['p95']:.2f} ms,"
+                          f" p99 {result['latency']['p99']:.2f} ms{errors}")
+            config['concurrency'] = concurrency
+        
+        if open_loop_rates:
+            print(f"\n⏳ Mesure en boucle ouverte (arrivées {open_loop_arrival},"
+                  f" {open_loop_duration:.0f} s par débit)...")
+            open_loop = {}
+            for engine, label, analyzer_cls, connector_cls in (
+                    ('pg', 'PostgreSQL', PostgresAnalyzer, PostgresConnector),
+                    ('monet', 'MonetDB', MonetDBAnalyzer, MonetDBConnector)):
+                benchmark = OpenLoopBenchmark(
+                    analyzer_cls, connector_cls, open_loop_duration,
+                    open_loop_max_in_flight, open_loop_arrival,
+                    {'fetch_mode': fetch_mode, 'fetch_size': fetch_size, 'prepared': prepared})
+                open_loop[engine] = benchmark.run(mix, open_loop_rates)
+                print(f"\n{label}")
+                for rate, result in open_loop[engine]['rates'].items():
+                    state = ' ⚠️ saturé' if result['saturated'] else ''
+                    print(f"├─ {rate:>7.1f} req/s offertes : {result['achieved_rate']:,.1f} obtenues,"
+                          f" p95 {result['latency']['p95']:.2f} ms"
+                          f" (dont attente {result['queue_time']['p95']:.2f} ms){state}")
+                sustained = open_loop[engine]['max_sustained_rate']
+                print(f"└─ Débit maximal tenu : "
+                      f"{f'{sustained:.1f} req/s' if sustained is not None else 'aucun'}")
+            config['open_loop'] = open_loop
+        
+        if mixed_ingest_rates:
+            mixed_table = table_name or next(iter(append_rows), None)
+            if mixed_table not in append_rows:
+                print("\n⚠️ Charge mixte ignorée : aucune table chargée par cette analyse")
+            else:
+                print(f"\n⏳ Charge mixte sur {mixed_table} ({mixed_writers} écrivains,"
+                      f" {mixed_readers} lecteurs, lots de {mixed_batch_rows:,} lignes,"
+                      f" {mixed_duration:.0f} s par débit)...")
+                mixed = {}
+                for engine, label, analyzer_cls, connector_cls, loader_cls, load_modes in (
+                        ('pg', 'PostgreSQL', PostgresAnalyzer, PostgresConnector, PostgresLoader,
+                         pg_load_modes),
+                        ('monet', 'MonetDB', MonetDBAnalyzer, MonetDBConnector, MonetDBLoader,
+                         monet_load_modes)):
+                    benchmark = MixedWorkloadBenchmark(
+                        analyzer_cls, connector_cls, loader_cls, mixed_readers, mixed_writers,
+                        mixed_duration, mixed_batch_rows, load_modes[0],
+                        {'fetch_mode': fetch_mode, 'fetch_size': fetch_size, 'prepared': prepared})
+                    mixed[engine] = benchmark.run(mix, mixed_table, append_rows[mixed_table],
+                                                  mixed_ingest_rates)
+                    print(f"\n{label} ({load_modes[0]})")
+                    for rate, result in mixed[engine]['rates'].items():
+                        if not rate:
+                            print(f"├─ Sans écriture : {result['qps']:,.1f} requêtes/s,"
+                                  f" p95 {result['latency']['p95']:.2f} ms")
+                            continue
+                        state = '' if result['sustained'] else ' ⚠️ non tenu'
+                        errors = (f", {result['write_errors']} lots en erreur"
+                                  if result['write_errors'] else '')
+                        print(f"├─ {rate:>9,.0f} lignes/s visées : {result['achieved_rate']:,.0f}"
+                              f" obtenues (validation p95 {result['commit_latency']['p95']:.1f} ms"
+                              f"{errors}){state}, requêtes p95 {result['latency']['p95']:.2f} ms"
+                              f" (x{result['degradation'] or 0:.2f})")
+                    sustained = mixed[engine]['max_sustained_rate']
+                    print(f"└─ Débit d'ingestion maximal tenu : "
+                          f"{f'{sustained:,.0f} lignes/s' if sustained is not None else 'aucun'}"
+                          f" ({mixed[engine]['rows_appended']:,} lignes ajoutées)")
+                config['mixed_workload'] = mixed
         
         if csv_paths and results_loader:
             config['loading_times'] = {
                 'pg_load_time': results_loader[0]['pg_load_time'],
                 'monet_load_time': results_loader[0]['monet_load_time']
             }
+            config['loading_times_by_mode'] = results_loader[0]['load_modes']
             config['total_rows'] = results_loader[0]['rows']
+            config['parse_phases'] = results_loader[0]['parse_phases']
+            config['load_phases'] = results_loader[0]['load_phases']
+            config['physical_design'] = results_loader[0]['physical_design']
         
         return results_analyzer, results_loader
     
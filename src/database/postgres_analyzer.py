@@ -2,33 +2,99 @@
 Analyseur de performances pour PostgreSQL.
 
 Ce module fournit une implémentation concrète de QueryAnalyzer pour PostgreSQL,
-permettant d'analyser les performances des requêtes SQL en utilisant EXPLAIN ANALYZE.
+permettant d'analyser les performances des requêtes SQL en utilisant les
+compteurs de l'extension pg_stat_statements.
 """
 
 from src.base_classes import QueryAnalyzer
 from sqlalchemy import text
-from typing import Dict
+from typing import Dict, Optional
+import json
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 class PostgresAnalyzer(QueryAnalyzer):
     """
     Analyseur de performances pour les requêtes PostgreSQL.
     
-    Cette classe utilise la commande EXPLAIN ANALYZE de PostgreSQL pour collecter
-    des métriques détaillées sur l'exécution des requêtes, incluant les temps
-    d'exécution et les statistiques d'accès aux données.
+    Cette classe utilise l'extension pg_stat_statements de PostgreSQL pour
+    collecter des métriques détaillées sur l'exécution des requêtes, incluant
+    les temps d'exécution et les statistiques d'accès aux données.
 
     Attributes:
         connector: Instance de PostgresConnector pour la connexion à la base
+        EXPLAIN_PREFIX (str): Préfixe d'EXPLAIN donnant l'identifiant de la
+            requête dans pg_stat_statements (planification seule, sans exécution)
+        STATEMENT_COUNTERS (tuple): Colonnes de pg_stat_statements relevées
+            avant et après l'exécution chronométrée
+        SCRATCH_FACTOR (int): Taille de la table tampon en multiples de
+            ``shared_buffers`` (l'algorithme d'horloge n'évince une page
+            souvent lue qu'après plusieurs passages)
+        SCRATCH_ROW_BYTES (int): Taille approximative d'une ligne de la table tampon
 
     Notes:
         Les métriques collectées incluent :
-        - Temps d'exécution total (planification + exécution)
+        - Temps d'exécution total mesuré par le client, découpé en exécution,
+          délai jusqu'à la première ligne et récupération du résultat
         - Nombre de lignes retournées
-        - Nombre de lectures physiques
-        - Nombre d'écritures physiques
+        - Temps de planification et d'exécution mesurés par le serveur
+        - Blocs partagés et locaux trouvés en cache (hit) ou lus (read)
+        - Nombre de lectures physiques (blocs partagés, locaux et temporaires lus)
+        - Nombre d'écritures physiques (blocs partagés, locaux et temporaires écrits)
+        - Lignes renvoyées ou modifiées par la requête
+
+        Les métriques du serveur sont la différence des compteurs de
+        pg_stat_statements relevés juste avant et juste après l'exécution
+        chronométrée : elles décrivent cette exécution-là, sans la rejouer ni
+        réchauffer les caches (le mode 'cold' reste intact), et sans le
+        surcoût d'instrumentation par nœud d'EXPLAIN ANALYZE. Le serveur doit
+        charger l'extension (``shared_preload_libraries``, et
+        ``pg_stat_statements.track_planning`` pour le temps de planification) ;
+        à défaut, les métriques du serveur sont désactivées avec un
+        avertissement. Les compteurs étant agrégés par requête normalisée,
+        une exécution simultanée de la même requête par un autre client
+        fausserait la différence.
+
+        Chaque exécution emprunte une session au pool du connecteur ; l'attente
+        d'une session libre et son ouverture sont mesurées à part.
+
+        En mode préparé, la requête est préparée (``PREPARE``) une fois par
+        connexion du pool, puis exécutée par ``EXECUTE`` ; les liaisons d'un
+        modèle partagent une requête préparée à paramètres typés (``$1``…)
+        et ``EXECUTE`` ne transmet que leurs constantes. ``PREPARE`` ne fait
+        qu'analyser et réécrire la requête : la planification a lieu à
+        chaque ``EXECUTE`` (plan spécifique aux constantes, puis plan
+        générique en cache s'il n'est pas plus coûteux). pg_stat_statements
+        compte l'exécution sous la requête préparée ; son 'planning_time'
+        (``total_plan_time``) est le temps de planification de l'exécution
+        chronométrée, la durée de préparation n'en est pas un.
+
+        En mode 'stream', la requête passe par un curseur nommé côté serveur
+        (``stream_results``) : ``execute`` ne fait que le déclarer, et le
+        temps d'exécution se retrouve dans le délai jusqu'à la première ligne.
+        Un curseur nommé ne pouvant pas porter un ``EXECUTE``, le mode préparé
+        lit le résultat par lots sur un curseur client.
     """
 
+    EXPLAIN_PREFIX = 'EXPLAIN (VERBOSE, FORMAT JSON) '
+    STATEMENT_COUNTERS = (
+        'total_exec_time', 'total_plan_time', 'rows',
+        'shared_blks_hit', 'shared_blks_read', 'shared_blks_written',
+        'local_blks_hit', 'local_blks_read', 'local_blks_written',
+        'temp_blks_read', 'temp_blks_written'
+    )
+    SCRATCH_FACTOR = 6
+    SCRATCH_ROW_BYTES = 1000
+
+    def __init__(self, connector, **options):
+        super().__init__(connector, **options)
+        # requête exécutée (ou nom de la requête préparée) -> identifiant
+        # dans pg_stat_statements
+        self._query_ids = {}
+        self._statements_ready = False
+
     def analyze_query(self, query: str) -> Dict:
         """
         Analyse une requête SQL et mesure son temps d'exécution.
@@ -40,26 +106,247 @@ class PostgresAnalyzer(QueryAnalyzer):
             Dict: Métriques de performance
                 {
                     'execution_time': float,  # Temps total en ms
+                    'execute_time': float,    # Temps jusqu'au retour d'execute en ms
+                    'first_row_time': float,  # Temps jusqu'à la première ligne en ms
+                    'fetch_time': float,      # Temps de récupération du résultat en ms
                     'row_count': int,         # Nombre de lignes retournées
-                    'physical_reads': int,     # Toujours 0 (pour uniformité)
-                    'physical_writes': int     # Toujours 0 (pour uniformité)
+                    'physical_reads': int,     # Blocs lus hors du cache partagé
+                    'physical_writes': int,    # Blocs écrits
+                    'pool_wait_time': float,   # Attente d'une session du pool en ms
+                    'connect_time': float,     # Ouverture ou vérification de la session en ms
+                    ...                        # Métriques serveur (voir _server_metrics)
                 }
         """
+        with self.connector.session() as (conn, pool_stats):
+            statement, key = query, query
+            if self.prepared:
+                key, statement = self._prepare(conn, query)
+            sql = text(statement)
+            if self.streaming and not self.prepared:
+                sql = sql.execution_options(stream_results=True,
+                                            max_row_buffer=self.fetch_size)
+            query_id = self._query_id(conn, statement, key) if self.server_metrics else None
+            before = self._statement_counters(conn, query_id) if query_id else None
+            # Mesure directe du temps d'exécution
+            start_ns = time.perf_counter_ns()
+            result = conn.execute(sql)
+            executed_ns = time.perf_counter_ns()
+            metrics = self._consume(result if result.returns_rows else None,
+                                    start_ns, executed_ns)
+            result.close()
+            metrics.update(pool_stats)
+            metrics.update({'physical_reads': 0, 'physical_writes': 0})
+            if before is not None:
+                metrics.update(self._server_metrics(
+                    before, self._statement_counters(conn, query_id)))
+            return metrics
+
+    def _prepare(self, conn, query: str) -> tuple:
+        """
+        Prépare la requête sur la connexion si elle ne l'est pas encore.
+
+        Une liaison de modèle (BoundQuery) prépare le modèle, à paramètres
+        ``$n`` typés, une seule fois pour toutes ses liaisons. Les requêtes
+        préparées sont propres à une connexion PostgreSQL : leur liste est
+        conservée dans ``conn.info``, attaché à la connexion du pool et non
+        à l'objet Connection de SQLAlchemy.
+
+        Args:
+            conn: Connexion SQLAlchemy ouverte
+            query (str): Requête SQL ou liaison d'un modèle
+
+        Returns:
+            tuple: Nom de la requête préparée et instruction ``EXECUTE``
+                portant les constantes de la liaison
+        """
+        sql, literals, types = self.parameterized(query, numbered=True)
+        name = self.statement_name(sql)
+        prepared = conn.info.setdefault('prepared_statements', set())
+        if name not in prepared:
+            declared = f" ({', '.join(types)})" if types else ''
+            start_ns = time.perf_counter_ns()
+            conn.exec_driver_sql(f'PREPARE {name}{declared} AS {sql}')
+            self.prepare_times[self.statement_template(query)] = (
+                (time.perf_counter_ns() - start_ns) / 1e6)
+            prepared.add(name)
+        arguments = f"({', '.join(literals)})" if literals else ''
+        return name, f'EXECUTE {name}{arguments}'
+
+    def _enable_statements(self) -> bool:
+        """
+        Crée l'extension pg_stat_statements si le serveur la charge.
+
+        Returns:
+            bool: True si la vue pg_stat_statements est interrogeable
+        """
+        try:
+            with self.connector.get_connection().begin() as conn:
+                conn.exec_driver_sql('CREATE EXTENSION IF NOT EXISTS pg_stat_statements')
+                conn.exec_driver_sql('SELECT 1 FROM pg_stat_statements LIMIT 1')
+            return True
+        except Exception as e:
+            logger.warning(f"pg_stat_statements indisponible, métriques serveur "
+                           f"PostgreSQL désactivées : {str(e)}")
+            return False
+
+    def _query_id(self, conn, statement: str, key: Optional[str] = None) -> Optional[int]:
+        """
+        Identifiant de la requête normalisée dans pg_stat_statements.
+
+        L'identifiant est lu dans ``EXPLAIN (VERBOSE)``, qui planifie la
+        requête sans l'exécuter, puis conservé pour les itérations suivantes.
+
+        Args:
+            conn: Connexion SQLAlchemy ouverte
+            statement (str): Instruction exécutée (requête ou ``EXECUTE``)
+            key (str, optional): Clé de conservation de l'identifiant (nom de
+                la requête préparée, commun à toutes ses liaisons ; défaut :
+                ``statement``)
+
+        Returns:
+            int: Identifiant de la requête, None si les métriques du serveur
+                sont indisponibles (elles sont alors désactivées)
+        """
+        if not self._statements_ready:
+            self._statements_ready = self._enable_statements()
+            if not self._statements_ready:
+                self.server_metrics = False
+                return None
+        key = key or statement
+        if key not in self._query_ids:
+            explain = conn.exec_driver_sql(self.EXPLAIN_PREFIX + statement).scalar()
+            if isinstance(explain, str):
+                explain = json.loads(explain)
+            query_id = explain[0].get('Query Identifier')
+            if not query_id:
+                logger.warning("Identifiant de requête absent (compute_query_id), "
+                               "métriques serveur PostgreSQL désactivées")
+                self.server_metrics = False
+                return None
+            self._query_ids[key] = int(query_id)
+        return self._query_ids[key]
+
+    def _statement_counters(self, conn, query_id: int) -> Dict:
+        """
+        Relève les compteurs cumulés d'une requête dans pg_stat_statements.
+
+        Args:
+            conn: Connexion SQLAlchemy ouverte
+            query_id (int): Identifiant de la requête (voir ``_query_id``)
+
+        Returns:
+            Dict: Valeur de chaque colonne de STATEMENT_COUNTERS (0 si la
+                requête n'a encore jamais été exécutée)
+        """
+        columns = ', '.join(f'COALESCE(SUM({name}), 0)' for name in self.STATEMENT_COUNTERS)
+        row = conn.execute(text(
+            f"SELECT {columns} FROM pg_stat_statements "
+            f"WHERE queryid = :query_id "
+            f"AND userid = (SELECT oid FROM pg_roles WHERE rolname = current_user) "
+            f"AND dbid = (SELECT oid FROM pg_database WHERE datname = current_database())"),
+            {'query_id': query_id}).one()
+        return dict(zip(self.STATEMENT_COUNTERS, (float(value) for value in row)))
+
+    @staticmethod
+    def _server_metrics(before: Dict, after: Dict) -> Dict:
+        """
+        Métriques du serveur de l'exécution chronométrée.
+
+        Args:
+            before (Dict): Compteurs relevés avant l'exécution
+            after (Dict): Compteurs relevés après l'exécution
+
+        Returns:
+            Dict: Métriques du serveur
+                {
+                    'server_time': float,      # Temps d'exécution serveur en ms
+                    'planning_time': float,    # Temps de planification en ms
+                    'shared_hit_blocks': int,  # Blocs partagés trouvés en cache
+                    'shared_read_blocks': int, # Blocs partagés lus
+                    'local_hit_blocks': int,   # Blocs locaux trouvés en cache
+                    'local_read_blocks': int,  # Blocs locaux lus
+                    'physical_reads': int,     # Blocs partagés, locaux et temporaires lus
+                    'physical_writes': int,    # Blocs partagés, locaux et temporaires écrits
+                    'rows_processed': int      # Lignes renvoyées ou modifiées
+                }
+        """
+        delta = {name: after[name] - before[name] for name in after}
+
+        def blocks(name: str) -> int:
+            return int(delta[name])
+
+        return {
+            'server_time': delta['total_exec_time'],
+            'planning_time': delta['total_plan_time'],
+            'shared_hit_blocks': blocks('shared_blks_hit'),
+            'shared_read_blocks': blocks('shared_blks_read'),
+            'local_hit_blocks': blocks('local_blks_hit'),
+            'local_read_blocks': blocks('local_blks_read'),
+            'physical_reads': (blocks('shared_blks_read') + blocks('local_blks_read')
+                               + blocks('temp_blks_read')),
+            'physical_writes': (blocks('shared_blks_written') + blocks('local_blks_written')
+                                + blocks('temp_blks_written')),
+            'rows_processed': blocks('rows')
+        }
+
+    def _reconnect(self) -> None:
+        """
+        Ferme les connexions du pool et vérifie que le serveur répond.
+        """
+        self.connector.reset_pool()
         engine = self.connector.get_connection()
-        
+        engine.dispose()
         with engine.connect() as conn:
-            # Mesure directe du temps d'exécution
-            start_time = time.time()
-            result = conn.execute(text(query))
-            rows = result.fetchall()
-            execution_time = (time.time() - start_time) * 1000  # Conversion en ms
-            
-            return {
-                'execution_time': execution_time,
-                'row_count': len(rows),
-                'physical_reads': 0,  # Valeurs uniformisées avec MonetDB
-                'physical_writes': 0
-            }
+            conn.exec_driver_sql('SELECT 1')
+
+    def _evict_buffers(self) -> None:
+        """
+        Évince les pages mesurées de ``shared_buffers`` en lisant une table tampon.
+
+        La table est lue par parcours d'index : un parcours séquentiel d'une
+        grande table passe par un anneau de quelques pages et n'évincerait
+        rien. Elle est (re)créée lorsque sa taille ne couvre plus
+        SCRATCH_FACTOR fois ``shared_buffers``.
+        """
+        engine = self.connector.get_connection()
+        with engine.begin() as conn:
+            target = conn.execute(text(
+                "SELECT pg_size_bytes(current_setting('shared_buffers'))")).scalar()
+            target *= self.SCRATCH_FACTOR
+            current = conn.execute(text("SELECT COALESCE(pg_table_size(to_regclass(:name)), 0)"),
+                                   {'name': self.SCRATCH_TABLE}).scalar()
+            if current < target:
+                conn.exec_driver_sql(f'DROP TABLE IF EXISTS "{self.SCRATCH_TABLE}"')
+                conn.exec_driver_sql(
+                    f'CREATE UNLOGGED TABLE "{self.SCRATCH_TABLE}" AS '
+                    f"SELECT g AS id, repeat('x', {self.SCRATCH_ROW_BYTES - 100}) AS pad "
+                    f'FROM generate_series(1, {target // self.SCRATCH_ROW_BYTES + 1}) g')
+                conn.exec_driver_sql(f'ALTER TABLE "{self.SCRATCH_TABLE}" ADD PRIMARY KEY (id)')
+        with engine.begin() as conn:
+            conn.exec_driver_sql('SET LOCAL enable_seqscan = off')
+            conn.exec_driver_sql('SET LOCAL enable_bitmapscan = off')
+            conn.exec_driver_sql(f'SELECT SUM(length(pad)) FROM "{self.SCRATCH_TABLE}" '
+                                 f'WHERE id > 0')
+
+    def prewarm(self, table_name: str) -> int:
+        """
+        Charge la table et ses index dans ``shared_buffers`` avec ``pg_prewarm``.
+
+        Args:
+            table_name (str): Nom de la table
+
+        Returns:
+            int: Nombre de blocs chargés
+        """
+        engine = self.connector.get_connection()
+        with engine.begin() as conn:
+            conn.exec_driver_sql('CREATE EXTENSION IF NOT EXISTS pg_prewarm')
+            return int(conn.execute(text(
+                "SELECT COALESCE(SUM(pg_prewarm(c.oid)), 0) FROM pg_class c "
+                "WHERE c.oid = to_regclass(:name) "
+                "OR c.oid IN (SELECT indexrelid FROM pg_index "
+                "WHERE indrelid = to_regclass(:name))"),
+                {'name': f'"{table_name}"'}).scalar())
 
     def format_metrics(self, metrics: Dict) -> Dict:
         """
@@ -77,7 +364,9 @@ class PostgresAnalyzer(QueryAnalyzer):
                     'execution_time': float,  # Temps en ms
                     'row_count': int,         # Nombre de lignes
                     'physical_reads': int,     # Lectures
-                    'physical_writes': int     # Écritures
+                    'physical_writes': int,    # Écritures
+                    ...                        # LATENCY_METRICS, SERVER_METRICS
+                                               # et 'row_hash' s'il est calculé
                 }
 
         Example:
@@ -85,9 +374,17 @@ class PostgresAnalyzer(QueryAnalyzer):
             >>> formatted = analyzer.format_metrics(raw_metrics)
             >>> print(formatted['execution_time'])
         """
-        return {
+        formatted = {
             'execution_time': float(metrics['execution_time']),
             'row_count': int(metrics['row_count']),
             'physical_reads': int(metrics.get('physical_reads', 0)),
             'physical_writes': int(metrics.get('physical_writes', 0))
-        }
\ No newline at end of file
+        }
+        for key in self.LATENCY_METRICS:
+            formatted[key] = float(metrics.get(key, 0.0))
+        for key in self.SERVER_METRICS:
+            value = metrics.get(key, 0)
+            formatted[key] = float(value) if key.endswith('_time') else int(value)
+        if 'row_hash' in metrics:
+            formatted['row_hash'] = metrics['row_hash']
+        return formatted
\ No newline at end of file
@@ -26,6 +26,11 @@ class PostgresConnector(DatabaseConnector):
         port (int): Port de connexion PostgreSQL
         connection: Objet SQLAlchemy Engine
 
+    Les sessions du pool (voir ``DatabaseConnector.session``) sont des objets
+    Connection de SQLAlchemy gardés ouverts : chacune conserve la même
+    connexion PostgreSQL, donc ses requêtes préparées, d'un emprunt à l'autre.
+    Le pool de l'Engine est dimensionné en conséquence.
+
     Environment Variables:
         POSTGRES_USER: Nom d'utilisateur (défaut: 'postgres')
         POSTGRES_PASSWORD: Mot de passe (défaut: 'postgres')
@@ -43,11 +48,29 @@ class PostgresConnector(DatabaseConnector):
     def connect(self):
         if not self.connection:
             self.connection = create_engine(
-                f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+                f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}",
+                pool_size=self.pool_size,
+                pool_pre_ping=self.pre_ping,
+                pool_recycle=self.recycle if self.recycle is not None else -1
             )
         return self.connection
     
     def get_connection(self):
         if not self.connection:
             self.connect()
-        return self.connection
\ No newline at end of file
+        return self.connection
+
+    def _pool_connect(self):
+        return self.get_connection().connect()
+
+    def _pool_ping(self, session) -> None:
+        session.exec_driver_sql('SELECT 1')
+        session.rollback()
+
+    def _pool_reset(self, session) -> None:
+        session.rollback()
+
+    def _pool_close(self, session) -> None:
+        # La connexion PostgreSQL est fermée plutôt que rendue au pool de l'Engine
+        session.invalidate()
+        session.close()
\ No newline at end of file
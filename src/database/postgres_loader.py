@@ -1,9 +1,56 @@
+import time
 from src.base_classes import DatabaseLoader
 import pandas as pd
-import time
-from tqdm import tqdm
 from sqlalchemy import text
 
+
+class _DataFrameCsvStream:
+    """
+    Flux texte en lecture seule sérialisant un DataFrame en CSV par lots.
+
+    psycopg2 consomme ce flux via ``read(size)`` pendant un ``COPY FROM STDIN`` :
+    seul le lot en cours est sérialisé en mémoire, ce qui permet d'envoyer la
+    totalité du DataFrame en une seule commande COPY sans construire le CSV complet.
+
+    Les valeurs manquantes sont écrites sous la forme NULL_MARKER, déclarée
+    comme valeur NULL de la commande COPY : une chaîne vide reste une chaîne
+    vide, comme en mode 'insert' (un champ vide non quoté serait lu comme NULL
+    par le format CSV de PostgreSQL).
+
+    Attributes:
+        df (pd.DataFrame): Données à sérialiser
+        batch_size (int): Nombre de lignes sérialisées à la fois
+        serialize_ns (int): Temps passé à sérialiser, en nanosecondes
+        NULL_MARKER (str): Représentation des valeurs manquantes ; une valeur
+            texte égale à ce marqueur serait chargée comme NULL
+    """
+
+    NULL_MARKER = '\\N'
+
+    def __init__(self, df: pd.DataFrame, batch_size: int):
+        self.df = df
+        self.batch_size = batch_size
+        self.serialize_ns = 0
+        self._position = 0
+        self._buffer = ''
+
+    def _next_batch(self) -> str:
+        start = time.perf_counter_ns()
+        batch = self.df.iloc[self._position:self._position + self.batch_size]
+        self._position += len(batch)
+        text = batch.to_csv(index=False, header=False, na_rep=self.NULL_MARKER)
+        self.serialize_ns += time.perf_counter_ns() - start
+        return text
+
+    def read(self, size: int = -1) -> str:
+        while (size < 0 or len(self._buffer) < size) and self._position < len(self.df):
+            self._buffer += self._next_batch()
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
 class PostgresLoader(DatabaseLoader):
     """
     Chargeur de données pour PostgreSQL. Gère le chargement des fichiers CSV dans la base de données.
@@ -11,8 +58,16 @@ class PostgresLoader(DatabaseLoader):
     Cette classe hérite de DatabaseLoader et implémente les méthodes spécifiques à PostgreSQL
     pour le chargement et la vérification des données.
 
+    Deux modes de chargement sont disponibles :
+        - 'insert' : envoi par lots via ``DataFrame.to_sql`` (une instruction INSERT par ligne)
+        - 'copy' : envoi en flux via ``COPY ... FROM STDIN`` (protocole COPY de psycopg2)
+
+    Le chargement en flux (``load_csv``) est fourni par DatabaseLoader ; cette
+    classe implémente la création de la table et l'écriture de chaque morceau.
+
     Attributes:
         connector: Instance de PostgresConnector pour la connexion à la base de données
+        LOAD_MODES (tuple): Modes de chargement supportés
 
     Methods:
         table_exists(nom_table: str) -> bool:
@@ -20,11 +75,11 @@ class PostgresLoader(DatabaseLoader):
 
         get_row_count(nom_table: str) -> int:
             Retourne le nombre de lignes dans une table.
-
-        load_csv(chemin_csv: str, nom_table: str, separateur: str = ',', batch_size: int = 1000) -> dict:
-            Charge un fichier CSV dans une table PostgreSQL.
     """
 
+    LABEL = '🐘 PostgreSQL'
+    LOAD_MODES = ('insert', 'copy')
+
     def table_exists(self, nom_table: str) -> bool:
         """
         Vérifie si une table existe dans la base de données PostgreSQL.
@@ -68,43 +123,138 @@ class PostgresLoader(DatabaseLoader):
         query = f"SELECT COUNT(*) FROM {nom_table}"
         return pd.read_sql_query(query, engine).iloc[0, 0]
 
-    def load_csv(self, chemin_csv: str, nom_table: str, separateur: str = ',', 
-                 batch_size: int = 1000) -> dict:
+    def _drop_table(self, nom_table: str) -> None:
         """
-        Charge un fichier CSV dans une table PostgreSQL.
+        Supprime la table PostgreSQL (et ses dépendances) si elle existe.
+
+        Args:
+            nom_table (str): Nom de la table à supprimer
         """
-        print(f"\n🐘 PostgreSQL: Chargement de {nom_table}")
-        
-        engine = self.connector.get_connection()
-        start_time = time.time()
-        
-        print("   ├─ Vérification de la table existante...")
         if self.table_exists(nom_table):
-            with engine.connect() as connection:
+            with self.connector.get_connection().begin() as connection:
                 connection.execute(text(f"DROP TABLE IF EXISTS {nom_table} CASCADE"))
-        
-        print("   ├─ Lecture du fichier CSV...")
-        df = pd.read_csv(chemin_csv, sep=separateur)
-        df = self.clean_column_names(df)
-        total_rows = len(df)
-        
-        print(f"   ├─ Création de la table ({len(df.columns)} colonnes)")
-        df.head(0).to_sql(nom_table, engine, if_exists='replace', index=False)
-        
-        print(f"   └─ Insertion des données ({total_rows:,} lignes)", end='\r')
-        with tqdm(total=total_rows, unit='lignes', ncols=80) as pbar:
-            for i in range(0, len(df), batch_size):
-                batch = df.iloc[i:i + batch_size]
-                batch.to_sql(nom_table, engine, if_exists='append', index=False)
-                pbar.update(len(batch))
-        
-        print(f"\r      ✓ {total_rows:,} lignes insérées")
-        
-        end_time = time.time()
-        total_time = end_time - start_time
-        
-        return {
-            'table_name': nom_table,
-            'load_time': total_time,
-            'total_rows': total_rows
-        }
\ No newline at end of file
+
+    def _execute_sql(self, sql: str, params: tuple = ()):
+        """
+        Exécute une instruction paramétrée via le pilote psycopg2, dans sa propre transaction.
+
+        Args:
+            sql (str): Instruction SQL (paramètres ``%s``)
+            params (tuple, optional): Paramètres de l'instruction
+
+        Returns:
+            list: Lignes du résultat, None si l'instruction n'en renvoie pas
+        """
+        with self.connector.get_connection().begin() as connection:
+            result = connection.exec_driver_sql(sql, params)
+            return result.fetchall() if result.returns_rows else None
+
+    def _analyze_table(self, nom_table: str) -> None:
+        """
+        Met à jour les statistiques de l'optimiseur avec ``ANALYZE``.
+
+        Args:
+            nom_table (str): Nom de la table
+        """
+        self._execute_sql(f'ANALYZE "{nom_table}"')
+
+    def _create_index(self, nom_table: str, nom_index: str, column: str, kind: str) -> None:
+        """
+        Crée un index B-tree (type 'ordered') ou BRIN (type 'imprints').
+
+        BRIN résume chaque plage de blocs par ses bornes, ce qui en fait
+        l'équivalent PostgreSQL le plus proche des imprints de MonetDB.
+
+        Args:
+            nom_table (str): Nom de la table
+            nom_index (str): Nom de l'index
+            column (str): Colonne indexée
+            kind (str): 'ordered' ou 'imprints'
+        """
+        method = 'brin' if kind == 'imprints' else 'btree'
+        self._execute_sql(f'DROP INDEX IF EXISTS "{nom_index}"')
+        self._execute_sql(f'CREATE INDEX "{nom_index}" ON "{nom_table}" '
+                          f'USING {method} ("{column}")')
+
+    def _index_size(self, nom_table: str, nom_index: str, column: str, kind: str) -> int:
+        """
+        Retourne la taille de l'index avec ``pg_relation_size``.
+
+        Args:
+            nom_table (str): Nom de la table
+            nom_index (str): Nom de l'index
+            column (str): Colonne indexée
+            kind (str): Type d'index déclaré
+
+        Returns:
+            int: Taille de l'index en octets
+        """
+        rows = self._execute_sql("SELECT pg_relation_size(%s::regclass)", (f'"{nom_index}"',))
+        return int(rows[0][0])
+
+    def _create_table(self, nom_table: str, schema) -> None:
+        """
+        Crée la table avec les types compacts du schéma déduit.
+
+        Args:
+            nom_table (str): Nom de la table à créer
+            schema (TableSchema): Schéma déduit des données
+        """
+        with self.connector.get_connection().begin() as connection:
+            connection.execute(text(self.create_table_sql(nom_table, schema)))
+
+    def _open_session(self):
+        """
+        Ouvre une connexion SQLAlchemy avec une transaction explicite.
+
+        Les deux modes écrivent dans cette même transaction : ``to_sql`` via la
+        connexion SQLAlchemy et COPY via la connexion psycopg2 sous-jacente.
+
+        Returns:
+            sqlalchemy.engine.Connection: Connexion en cours de transaction
+        """
+        session = self.connector.get_connection().connect()
+        session.begin()
+        return session
+
+    def _close_session(self, session) -> None:
+        session.close()
+
+    def _write_chunk(self, session, nom_table: str, chunk: pd.DataFrame,
+                     mode: str, batch_size: int) -> None:
+        """
+        Écrit un morceau par lots ``to_sql`` (mode 'insert') ou en une
+        commande ``COPY FROM STDIN`` (mode 'copy').
+
+        En mode 'copy', le CSV est produit à la volée par lots de
+        ``batch_size`` lignes : les valeurs manquantes sont écrites sous la
+        forme ``_DataFrameCsvStream.NULL_MARKER``, déclarée comme valeur NULL,
+        pour que les chaînes vides soient chargées comme en mode 'insert'
+        (``''`` et non NULL). La sérialisation est comptée dans la phase 'convert' et
+        le reste de la commande COPY dans la phase 'insert' ; en mode 'insert',
+        ``to_sql`` ne permet pas de les séparer et tout est compté en 'insert'.
+
+        Args:
+            session: Connexion ouverte par ``_open_session``
+            nom_table (str): Table de destination
+            chunk (pd.DataFrame): Morceau normalisé
+            mode (str): 'insert' ou 'copy'
+            batch_size (int): Nombre de lignes par lot
+        """
+        nbytes = self.phases.nbytes(chunk)
+        if mode == 'copy':
+            column_names = ', '.join(f'"{col}"' for col in chunk.columns)
+            copy_sql = (f'COPY "{nom_table}" ({column_names}) FROM STDIN WITH (FORMAT csv, '
+                        f"NULL '{_DataFrameCsvStream.NULL_MARKER}')")
+            stream = _DataFrameCsvStream(chunk, batch_size)
+            start = time.perf_counter_ns()
+            with session.connection.cursor() as cursor:
+                cursor.copy_expert(copy_sql, stream)
+            elapsed = time.perf_counter_ns() - start
+            self.phases.add('convert', stream.serialize_ns, len(chunk), nbytes)
+            self.phases.add('insert', elapsed - stream.serialize_ns, len(chunk), nbytes)
+        else:
+            with self.phases.span('insert', len(chunk), nbytes):
+                for i in range(0, len(chunk), batch_size):
+                    batch = chunk.iloc[i:i + batch_size]
+                    batch.to_sql(nom_table, session, if_exists='append', index=False)
@@ -0,0 +1,203 @@
+"""
+Registre des requêtes mesurées.
+
+Chaque requête est décrite par une QueryDefinition : nom, catégorie
+(sélection, agrégation, jointure, fenêtrage, top-k, agrégation temporelle,
+projection), tables interrogées, suite à laquelle elle appartient et
+propriétés attendues de son résultat (nombre de lignes). La requête peut
+exister en version figée et en version paramétrée (QueryTemplate).
+
+Le QueryRegistry rassemble les définitions et sélectionne celles d'une
+analyse (par table, suite ou catégorie). analyze_database_performance
+accepte directement les définitions : la catégorie sert d'étiquette aux
+graphiques et les propriétés attendues sont vérifiées à chaque itération.
+"""
+
+import copy
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+class QueryDefinition:
+    """
+    Requête enregistrée et ses métadonnées.
+
+    Attributes:
+        name (str): Nom unique de la requête (ex. 'crimes.top_k_types')
+        category (str): Catégorie (voir CATEGORIES)
+        tables (tuple): Tables interrogées
+        query: Requête figée (str) ou modèle paramétré (QueryTemplate)
+        template (QueryTemplate, optional): Version paramétrée d'une requête figée
+        suite (str): Suite de requêtes (ex. 'core', 'analytical')
+        expected (Dict): Propriétés attendues du résultat, pour chaque
+            itération (voir EXPECTATIONS)
+        description (str): Ce que la requête met à l'épreuve
+        CATEGORIES (Dict[str, str]): Catégories et leurs libellés
+        EXPECTATIONS (tuple): Propriétés attendues supportées : 'rows' (nombre
+            exact de lignes), 'min_rows' et 'max_rows' (bornes)
+
+    Example:
+        >>> definition = QueryDefinition('crimes.top_k_types', 'top_k', ('crimes',),
+        ...                              "SELECT ... LIMIT 10", expected={'max_rows': 10})
+        >>> definition.violations(samples)
+        0
+    """
+
+    CATEGORIES = {
+        'selection': 'Sélection',
+        'aggregation': 'Agrégation',
+        'join': 'Jointure',
+        'window': 'Fenêtrage',
+        'top_k': 'Top-k',
+        'time_bucket': 'Agrégation temporelle',
+        'projection': 'Projection'
+    }
+    EXPECTATIONS = ('rows', 'min_rows', 'max_rows')
+
+    def __init__(self, name: str, category: str, tables: Sequence[str], query,
+                 template=None, suite: str = 'core', expected: Optional[Dict] = None,
+                 description: str = ''):
+        if category not in self.CATEGORIES:
+            raise ValueError(f"Catégorie de requête inconnue : {category} "
+                             f"(attendu : {', '.join(self.CATEGORIES)})")
+        unknown = set(expected or {}) - set(self.EXPECTATIONS)
+        if unknown:
+            raise ValueError(f"Propriétés attendues inconnues pour {name} : "
+                             f"{', '.join(sorted(unknown))}")
+        self.name = name
+        self.category = category
+        self.tables = tuple(tables)
+        self.query = query
+        self.template = template
+        self.suite = suite
+        self.expected = expected or {}
+        self.description = description
+
+    def __str__(self) -> str:
+        return str(self.query)
+
+    @property
+    def label(self) -> str:
+        """
+        Libellé de la catégorie, utilisé dans les graphiques.
+
+        Returns:
+            str: Libellé (ex. 'Fenêtrage')
+        """
+        return self.CATEGORIES[self.category]
+
+    def variant(self, templates: bool) -> 'QueryDefinition':
+        """
+        Définition exécutant la version paramétrée ou la version figée.
+
+        Args:
+            templates (bool): Préférer la version paramétrée lorsqu'elle existe
+
+        Returns:
+            QueryDefinition: Copie dont ``query`` est la version choisie
+        """
+        chosen = copy.copy(self)
+        if templates and self.template is not None:
+            chosen.query = self.template
+        return chosen
+
+    def check(self, row_count: int) -> bool:
+        """
+        Vérifie le nombre de lignes d'un résultat.
+
+        Args:
+            row_count (int): Lignes reçues
+
+        Returns:
+            bool: True si le résultat respecte les propriétés attendues
+        """
+        if 'rows' in self.expected and row_count != self.expected['rows']:
+            return False
+        if row_count < self.expected.get('min_rows', 0):
+            return False
+        if 'max_rows' in self.expected and row_count > self.expected['max_rows']:
+            return False
+        return True
+
+    def violations(self, samples: Iterable[Dict]) -> int:
+        """
+        Nombre d'itérations dont le résultat ne respecte pas les propriétés attendues.
+
+        Args:
+            samples (Iterable[Dict]): Métriques formatées des itérations ('row_count')
+
+        Returns:
+            int: Itérations en défaut
+        """
+        return sum(1 for sample in samples if not self.check(sample['row_count']))
+
+
+class QueryRegistry:
+    """
+    Ensemble ordonné de définitions de requêtes.
+
+    Example:
+        >>> registry = QueryRegistry(AIR_QUALITY_SUITE + CRIMES_SUITE)
+        >>> registry.select('crimes', suites=['analytical'], categories=['window'])
+    """
+
+    def __init__(self, definitions: Iterable[QueryDefinition] = ()):
+        self._definitions = {}
+        for definition in definitions:
+            self.register(definition)
+
+    def __iter__(self):
+        return iter(self._definitions.values())
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def register(self, definition: QueryDefinition) -> QueryDefinition:
+        """
+        Ajoute une définition au registre.
+
+        Args:
+            definition (QueryDefinition): Requête à enregistrer
+
+        Returns:
+            QueryDefinition: La définition enregistrée
+
+        Raises:
+            ValueError: Si une requête du même nom est déjà enregistrée
+        """
+        if definition.name in self._definitions:
+            raise ValueError(f"Requête déjà enregistrée : {definition.name}")
+        self._definitions[definition.name] = definition
+        return definition
+
+    def get(self, name: str) -> QueryDefinition:
+        """
+        Définition enregistrée sous un nom.
+
+        Raises:
+            KeyError: Si aucune requête ne porte ce nom
+        """
+        if name not in self._definitions:
+            raise KeyError(f"Requête inconnue : {name}")
+        return self._definitions[name]
+
+    def select(self, table: Optional[str] = None, suites: Optional[Sequence[str]] = None,
+               categories: Optional[Sequence[str]] = None,
+               templates: bool = False) -> List[QueryDefinition]:
+        """
+        Sélectionne les requêtes d'une analyse, dans l'ordre d'enregistrement.
+
+        Args:
+            table (str, optional): Table analysée ; seules les requêtes
+                n'interrogeant que cette table sont retenues
+            suites (Sequence[str], optional): Suites retenues (None pour toutes)
+            categories (Sequence[str], optional): Catégories retenues (None pour toutes)
+            templates (bool, optional): Exécuter les versions paramétrées
+                lorsqu'elles existent
+
+        Returns:
+            List[QueryDefinition]: Définitions retenues (voir ``variant``)
+        """
+        return [definition.variant(templates) for definition in self
+                if (table is None or set(definition.tables) == {table})
+                and (suites is None or definition.suite in suites)
+                and (categories is None or definition.category in categories)]
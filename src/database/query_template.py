@@ -0,0 +1,355 @@
+"""
+Modèles de requêtes paramétrées et génération d'une charge aléatoire.
+
+Rejouer cinquante fois une requête aux constantes figées (``vict_age > 18``)
+favorise les caches de résultats et de plans, et ne mesure qu'une seule
+sélectivité. Un QueryTemplate décrit plutôt une requête dont les constantes
+sont des paramètres typés, tirés à chaque itération dans la distribution
+réelle des valeurs de la table chargée :
+
+    - 'value' : égalité sur une colonne, valeur tirée selon sa fréquence
+    - 'lower' / 'upper' : borne inférieure (``col > x``) ou supérieure
+      (``col < x``), valeur tirée selon sa fréquence parmi celles qui
+      laissent au moins une valeur au-delà (la plus grande, respectivement
+      la plus petite, est exclue pour ne jamais sélectionner zéro ligne)
+    - 'range' : intervalle (``col BETWEEN x_low AND x_high``) dont la
+      sélectivité visée est tirée uniformément en échelle logarithmique
+
+Chaque tirage (« liaison ») donne le texte SQL à exécuter et une estimation
+de sa sélectivité, produit des sélectivités de ses paramètres (hypothèse
+d'indépendance des colonnes), qui sert à regrouper les mesures par classe
+de sélectivité. Les tirages sont reproductibles (graine) et identiques pour
+les deux SGBD.
+
+Le texte SQL d'une liaison est un BoundQuery : une chaîne qui garde le
+modèle et les constantes dont elle est issue, pour qu'un analyseur en mode
+préparé prépare le modèle une seule fois et n'envoie que les constantes.
+"""
+
+import math
+import string
+from typing import Callable, Dict, List, Optional, Sequence
+import numpy as np
+
+
+class QueryParameter:
+    """
+    Paramètre typé d'un modèle de requête.
+
+    Attributes:
+        name (str): Nom du paramètre dans le modèle (``{name}``, ou
+            ``{name_low}`` et ``{name_high}`` pour un intervalle)
+        column (str): Colonne dont la distribution est utilisée
+        kind (str): Nature du paramètre (voir KINDS)
+        type (str): Type de la valeur rendue (voir TYPES)
+        selectivity (tuple): Sélectivités minimale et maximale visées par un
+            intervalle ('range'), rapportées aux lignes non NULL
+        values (np.ndarray): Valeurs distinctes triées de la colonne (après ``fit``)
+        counts (np.ndarray): Nombre de lignes de chaque valeur (après ``fit``)
+        total_rows (int): Nombre de lignes de la table, NULL compris (après ``fit``)
+        KINDS (tuple): Natures supportées
+        TYPES (tuple): Types supportés
+    """
+
+    KINDS = ('value', 'lower', 'upper', 'range')
+    TYPES = ('int', 'float', 'text')
+
+    def __init__(self, name: str, column: str, kind: str = 'value', type: str = 'int',
+                 selectivity: tuple = (0.001, 0.5)):
+        if kind not in self.KINDS:
+            raise ValueError(f"Nature de paramètre inconnue : {kind} "
+                             f"(attendu : {', '.join(self.KINDS)})")
+        if type not in self.TYPES:
+            raise ValueError(f"Type de paramètre inconnu : {type} "
+                             f"(attendu : {', '.join(self.TYPES)})")
+        self.name = name
+        self.column = column
+        self.kind = kind
+        self.type = type
+        self.selectivity = selectivity
+        self.values = None
+        self.counts = None
+        self.total_rows = 0
+
+    def fit(self, table: str, fetch: Callable[[str], list]) -> None:
+        """
+        Relève la distribution des valeurs de la colonne dans la table chargée.
+
+        Args:
+            table (str): Table interrogée
+            fetch (Callable[[str], list]): Exécute une requête et renvoie ses lignes
+
+        Raises:
+            ValueError: Si la colonne ne contient aucune valeur non NULL
+        """
+        rows = fetch(f"SELECT {self.column}, COUNT(*) FROM {table} "
+                     f"WHERE {self.column} IS NOT NULL GROUP BY {self.column} "
+                     f"ORDER BY {self.column}")
+        if not rows:
+            raise ValueError(f"Aucune valeur pour {table}.{self.column}")
+        self.values = np.array([self._cast(row[0]) for row in rows],
+                               dtype=object if self.type == 'text' else float)
+        self.counts = np.array([int(row[1]) for row in rows], dtype=np.int64)
+        self.total_rows = int(fetch(f"SELECT COUNT(*) FROM {table}")[0][0])
+
+    def _cast(self, value):
+        if self.type == 'int':
+            return int(value)
+        if self.type == 'float':
+            return float(value)
+        return str(value)
+
+    def literal(self, value) -> str:
+        """
+        Écrit une valeur sous forme de constante SQL.
+
+        Args:
+            value: Valeur tirée
+
+        Returns:
+            str: Constante SQL (chaîne entre apostrophes pour le type 'text')
+        """
+        if self.type == 'int':
+            return str(int(value))
+        if self.type == 'float':
+            return repr(float(value))
+        return "'" + str(value).replace("'", "''") + "'"
+
+    def draw(self, rng: np.random.Generator) -> tuple:
+        """
+        Tire une valeur du paramètre dans la distribution de la colonne.
+
+        Args:
+            rng (np.random.Generator): Générateur aléatoire
+
+        Returns:
+            tuple: Constantes SQL par nom de paramètre, valeurs tirées par nom
+                et sélectivité du prédicat (part des lignes de la table)
+        """
+        if self.kind == 'range':
+            weights = self.counts / self.counts.sum()
+            low_target, high_target = self.selectivity
+            target = math.exp(rng.uniform(math.log(low_target), math.log(high_target)))
+            cumulative = np.cumsum(weights)
+            start = rng.uniform(0, max(1 - target, 0))
+            first = min(int(np.searchsorted(cumulative, start, side='right')), len(cumulative) - 1)
+            last = max(int(np.searchsorted(cumulative, start + target, side='left')), first)
+            last = min(last, len(cumulative) - 1)
+            low, high = self.values[first], self.values[last]
+            matched = int(self.counts[first:last + 1].sum())
+            values = {f'{self.name}_low': low, f'{self.name}_high': high}
+        else:
+            candidates = np.arange(len(self.values))
+            if len(candidates) > 1 and self.kind == 'lower':
+                candidates = candidates[:-1]
+            elif len(candidates) > 1 and self.kind == 'upper':
+                candidates = candidates[1:]
+            weights = self.counts[candidates] / self.counts[candidates].sum()
+            index = int(candidates[rng.choice(len(candidates), p=weights)])
+            value = self.values[index]
+            if self.kind == 'value':
+                matched = int(self.counts[index])
+            elif self.kind == 'lower':
+                matched = int(self.counts[index + 1:].sum())
+            else:
+                matched = int(self.counts[:index].sum())
+            values = {self.name: value}
+        literals = {name: self.literal(value) for name, value in values.items()}
+        plain = {name: (value if self.type == 'text' else self._cast(value))
+                 for name, value in values.items()}
+        return literals, plain, matched / self.total_rows if self.total_rows else 0.0
+
+
+class BoundQuery(str):
+    """
+    Texte SQL d'une liaison, qui garde son modèle et ses constantes.
+
+    La chaîne est la requête complète, exécutable telle quelle ; ``template``
+    et ``literals`` permettent de la réécrire avec des emplacements de
+    paramètres (voir ``placeholders``). Les attributs survivent à la
+    sérialisation (processus de mesure).
+
+    Attributes:
+        template (str): Texte SQL du modèle (emplacements ``{nom}``)
+        literals (Dict[str, str]): Constante SQL par nom de paramètre
+        types (Dict[str, str]): Type de chaque paramètre (voir QueryParameter.TYPES)
+        SQL_TYPES (Dict[str, str]): Type SQL déclaré pour chaque type de paramètre
+    """
+
+    SQL_TYPES = {'int': 'bigint', 'float': 'double precision', 'text': 'text'}
+
+    def __new__(cls, template: str, literals: Dict[str, str], types: Dict[str, str]):
+        query = super().__new__(cls, template.format(**literals))
+        query.template = template
+        query.literals = literals
+        query.types = types
+        return query
+
+    def __reduce__(self):
+        return BoundQuery, (self.template, self.literals, self.types)
+
+    def placeholders(self, numbered: bool = True) -> tuple:
+        """
+        Réécrit le modèle avec des emplacements de paramètres.
+
+        Args:
+            numbered (bool, optional): Emplacements numérotés ``$1``, ``$2``…
+                (un par paramètre, PostgreSQL) plutôt que ``?`` (un par
+                occurrence, MonetDB)
+
+        Returns:
+            tuple: Texte à préparer, constantes SQL dans l'ordre des
+                emplacements et type SQL de chacune (voir SQL_TYPES)
+        """
+        parts, names = [], []
+        for text, name, _, _ in string.Formatter().parse(self.template):
+            parts.append(text)
+            if name is None:
+                continue
+            if not numbered:
+                names.append(name)
+                parts.append('?')
+                continue
+            if name not in names:
+                names.append(name)
+            parts.append(f'${names.index(name) + 1}')
+        return (''.join(parts), [self.literals[name] for name in names],
+                [self.SQL_TYPES[self.types[name]] for name in names])
+
+
+class QueryTemplate:
+    """
+    Requête paramétrée dont chaque exécution utilise une liaison différente.
+
+    Attributes:
+        label (str): Nom court de la requête (ex. 'Sélection')
+        sql (str): Texte SQL contenant un emplacement ``{nom}`` par constante
+        table (str): Table dont les distributions sont relevées
+        parameters (List[QueryParameter]): Paramètres du modèle
+        SELECTIVITY_BUCKETS (tuple): Bornes supérieures des classes de
+            sélectivité (part des lignes), la dernière classe allant jusqu'à 1
+
+    Example:
+        >>> template = QueryTemplate('Sélection', "SELECT ... WHERE vict_age > {age}",
+        ...                          'crimes', [QueryParameter('age', 'vict_age', 'lower')])
+        >>> template.fit(fetch)
+        >>> bindings = template.bindings(50, seed=42)
+        >>> bindings[0]['sql'], bindings[0]['selectivity']
+    """
+
+    SELECTIVITY_BUCKETS = (0.001, 0.01, 0.1)
+
+    def __init__(self, label: str, sql: str, table: str, parameters: List[QueryParameter]):
+        self.label = label
+        self.sql = sql
+        self.table = table
+        self.parameters = parameters
+
+    def __str__(self) -> str:
+        return self.sql
+
+    def fit(self, fetch: Callable[[str], list]) -> None:
+        """
+        Relève la distribution de chaque paramètre dans la table chargée.
+
+        Args:
+            fetch (Callable[[str], list]): Exécute une requête et renvoie ses lignes
+        """
+        for parameter in self.parameters:
+            parameter.fit(self.table, fetch)
+
+    def bindings(self, count: int, seed: int = 0) -> List[Dict]:
+        """
+        Tire ``count`` liaisons reproductibles du modèle.
+
+        Args:
+            count (int): Nombre de liaisons
+            seed (int, optional): Graine du générateur aléatoire
+
+        Returns:
+            List[Dict]: Liaisons
+                {
+                    'sql': BoundQuery,     # Requête à exécuter
+                    'params': Dict,        # Valeurs tirées par nom de paramètre
+                    'selectivity': float   # Sélectivité estimée (part des lignes)
+                }
+
+        Raises:
+            RuntimeError: Si les distributions n'ont pas été relevées (``fit``)
+        """
+        if any(parameter.values is None for parameter in self.parameters):
+            raise RuntimeError(f"Distributions non relevées pour le modèle '{self.label}'")
+        rng = np.random.default_rng(seed)
+        bindings = []
+        for _ in range(count):
+            literals, types, params, selectivity = {}, {}, {}, 1.0
+            for parameter in self.parameters:
+                drawn_literals, drawn, parameter_selectivity = parameter.draw(rng)
+                literals.update(drawn_literals)
+                types.update({name: parameter.type for name in drawn_literals})
+                params.update(drawn)
+                selectivity *= parameter_selectivity
+            bindings.append({'sql': BoundQuery(self.sql, literals, types), 'params': params,
+                             'selectivity': selectivity})
+        return bindings
+
+    @classmethod
+    def bucket(cls, selectivity: Optional[float]) -> Optional[str]:
+        """
+        Classe de sélectivité d'une liaison.
+
+        Args:
+            selectivity (float): Sélectivité estimée (None pour une requête fixe)
+
+        Returns:
+            str: Libellé de la classe (ex. '0.1-1%'), None pour une requête fixe
+        """
+        if selectivity is None:
+            return None
+        lower = 0.0
+        for upper in cls.SELECTIVITY_BUCKETS:
+            if selectivity < upper:
+                return f"{lower * 100:g}-{upper * 100:g}%"
+            lower = upper
+        return f"{lower * 100:g}-100%"
+
+    @staticmethod
+    def fixed(query: str, count: int = 1) -> List[Dict]:
+        """
+        Liaisons d'une requête sans paramètre, rejouée à l'identique.
+
+        Args:
+            query (str): Requête SQL
+            count (int, optional): Nombre de liaisons
+
+        Returns:
+            List[Dict]: Liaisons au format de ``bindings`` (sélectivité None)
+        """
+        return [{'sql': query, 'params': {}, 'selectivity': None}] * count
+
+
+def bucket_summary(samples: Sequence[Dict]) -> Dict[str, Dict]:
+    """
+    Résume les temps d'exécution par classe de sélectivité.
+
+    Args:
+        samples (Sequence[Dict]): Métriques formatées des itérations,
+            complétées de 'selectivity'
+
+    Returns:
+        Dict[str, Dict]: Nombre de mesures, moyenne, médiane et p95 (ms) par
+            classe, dans l'ordre croissant des sélectivités ; vide pour une
+            requête fixe
+    """
+    groups = {}
+    for sample in sorted(samples, key=lambda sample: sample.get('selectivity') or 0.0):
+        label = QueryTemplate.bucket(sample.get('selectivity'))
+        if label is not None:
+            groups.setdefault(label, []).append(sample['execution_time'])
+    summary = {}
+    for label, times in groups.items():
+        values = np.asarray(times, dtype=float)
+        summary[label] = {'count': int(len(values)), 'mean': float(values.mean()),
+                          'median': float(np.median(values)),
+                          'p95': float(np.percentile(values, 95))}
+    return summary
@@ -0,0 +1,142 @@
+"""
+Empreinte des résultats de requêtes, indépendante de l'ordre des lignes.
+
+Les temps de PostgreSQL et de MonetDB ne sont comparables que si les deux
+SGBD renvoient le même résultat. ResultFingerprint résume un résultat par
+son nombre de lignes et par la somme (modulo 2^64) des empreintes de ses
+lignes normalisées : la somme ne dépend pas de l'ordre de réception, prend
+en compte les doublons et se calcule au fil de la récupération, lot par lot,
+sans conserver les lignes. Deux empreintes partielles se combinent par
+simple addition.
+
+Les valeurs sont normalisées pour que des types différents selon le pilote
+représentant la même valeur donnent la même empreinte : les nombres (int,
+float, Decimal, bool) sont arrondis à NUMERIC_DIGITS chiffres significatifs,
+les dates et heures écrites au format ISO et les chaînes débarrassées des
+espaces de fin (colonnes CHAR complétées par des espaces).
+"""
+
+import datetime
+import decimal
+import hashlib
+from typing import Iterable, Optional
+
+MASK = (1 << 64) - 1
+
+
+class ResultFingerprint:
+    """
+    Nombre de lignes et somme des empreintes des lignes d'un résultat.
+
+    Attributes:
+        row_count (int): Lignes prises en compte
+        checksum (int): Somme modulo 2^64 des empreintes des lignes
+        NUMERIC_DIGITS (int): Chiffres significatifs conservés pour les nombres
+        NULL (str): Représentation de la valeur NULL
+
+    Example:
+        >>> fingerprint = ResultFingerprint()
+        >>> fingerprint.update(cursor.fetchmany(10000))
+        >>> fingerprint.hexdigest()
+        '1000:5f0c2e9a7b31d4c8'
+    """
+
+    NUMERIC_DIGITS = 9
+    NULL = '\\N'
+
+    def __init__(self, row_count: int = 0, checksum: int = 0):
+        self.row_count = row_count
+        self.checksum = checksum
+
+    @classmethod
+    def normalize(cls, value) -> str:
+        """
+        Représentation d'une valeur commune à tous les pilotes.
+
+        Args:
+            value: Valeur d'une colonne
+
+        Returns:
+            str: Valeur normalisée
+        """
+        if value is None:
+            return cls.NULL
+        if isinstance(value, (int, float, decimal.Decimal)):
+            number = float(value)
+            if number != number:
+                return 'nan'
+            return format(number + 0.0, f'.{cls.NUMERIC_DIGITS}g')
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value).hex()
+        return str(value).rstrip(' ')
+
+    @classmethod
+    def row_digest(cls, row) -> int:
+        """
+        Empreinte 64 bits d'une ligne normalisée.
+
+        Args:
+            row: Ligne (séquence de valeurs)
+
+        Returns:
+            int: Empreinte de la ligne
+        """
+        text = '\x1f'.join(cls.normalize(value) for value in row)
+        return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'little')
+
+    def update(self, rows: Iterable) -> None:
+        """
+        Ajoute un lot de lignes à l'empreinte.
+
+        Args:
+            rows (Iterable): Lignes reçues
+        """
+        checksum = self.checksum
+        count = 0
+        for row in rows:
+            checksum += self.row_digest(row)
+            count += 1
+        self.checksum = checksum & MASK
+        self.row_count += count
+
+    def combine(self, other: 'ResultFingerprint') -> 'ResultFingerprint':
+        """
+        Empreinte de la réunion de deux résultats partiels.
+
+        Args:
+            other (ResultFingerprint): Empreinte d'un autre lot de lignes
+
+        Returns:
+            ResultFingerprint: Empreinte combinée
+        """
+        return ResultFingerprint(self.row_count + other.row_count,
+                                 (self.checksum + other.checksum) & MASK)
+
+    def hexdigest(self) -> str:
+        """
+        Représentation textuelle de l'empreinte.
+
+        Returns:
+            str: '<lignes>:<somme en hexadécimal>'
+        """
+        return f"{self.row_count}:{self.checksum:016x}"
+
+    @staticmethod
+    def majority(digests: Iterable[Optional[str]]) -> Optional[str]:
+        """
+        Empreinte la plus fréquente d'une série d'itérations.
+
+        Args:
+            digests (Iterable[str]): Empreintes des itérations (None ignorées)
+
+        Returns:
+            str: Empreinte majoritaire (la première rencontrée en cas
+                d'égalité), None si aucune empreinte n'est fournie
+        """
+        counts = {}
+        for digest in digests:
+            if digest is not None:
+                counts[digest] = counts.get(digest, 0) + 1
+        return max(counts, key=counts.get) if counts else None
@@ -0,0 +1,238 @@
+"""
+Courbes de passage à l'échelle des chargements et des requêtes.
+
+analyze_database_performance mesure chaque table à une seule taille. Pour
+décider à partir de quel volume une charge doit passer de PostgreSQL à
+MonetDB, ScalingBenchmark recharge la même table à plusieurs facteurs
+d'échelle (échantillon des lignes réelles en dessous de 1, lignes
+synthétiques au-dessus, voir ``scale_factor``), rejoue les requêtes à chaque
+taille puis ajuste, pour chaque requête et chaque SGBD, une loi de puissance
+du temps en fonction du nombre de lignes :
+
+    temps = coefficient * lignes ^ exposant
+
+L'ajustement se fait par moindres carrés en échelle log-log. Un exposant
+proche de 1 indique un coût linéaire ; au-delà de SUPERLINEAR_EXPONENT, la
+requête est signalée comme super-linéaire. Lorsque les exposants des deux
+SGBD diffèrent, les courbes se croisent à un nombre de lignes calculé
+(éventuellement extrapolé) au-delà duquel le SGBD à la croissance la plus
+lente devient le plus rapide.
+"""
+
+import math
+from typing import Dict, List, Optional
+import numpy as np
+
+from src.database.performance_analyzer import analyze_database_performance
+
+
+class ScalingBenchmark:
+    """
+    Mesures d'une table à plusieurs tailles et lois de croissance ajustées.
+
+    Attributes:
+        scale_factors (List[float]): Facteurs d'échelle mesurés, triés
+        load (Dict): Options de chargement transmises à
+            analyze_database_performance (voir LOAD_OPTIONS) ; le chargement
+            incrémental, qui confondrait les tailles, est toujours désactivé
+        execution (Dict): Options d'exécution des requêtes (voir
+            EXECUTION_OPTIONS) ; les mesures de débit ne participent pas aux
+            courbes et ne sont pas lancées
+        superlinear_exponent (float): Exposant au-delà duquel une croissance
+            est signalée comme super-linéaire
+        SUPERLINEAR_EXPONENT (float): Seuil par défaut ; la marge au-dessus de
+            1 absorbe le bruit de mesure et les coûts fixes des petites tailles
+        ENGINES (tuple): SGBD comparés (clé, libellé)
+
+    Example:
+        >>> benchmark = ScalingBenchmark([0.1, 0.5, 1, 2, 5],
+        ...                              execution={'iterations': 10})
+        >>> scaling = benchmark.run(CRIMES_TEMPLATES, CSV_PATHS, 'crimes')
+        >>> scaling['queries'][1]['pg']['exponent']
+    """
+
+    SUPERLINEAR_EXPONENT = 1.1
+    ENGINES = (('pg', 'PostgreSQL'), ('monet', 'MonetDB'))
+
+    def __init__(self, scale_factors: List[float], load: Optional[Dict] = None,
+                 execution: Optional[Dict] = None,
+                 superlinear_exponent: Optional[float] = None):
+        if len(set(scale_factors)) < 2:
+            raise ValueError("Au moins deux facteurs d'échelle distincts sont nécessaires")
+        if min(scale_factors) <= 0:
+            raise ValueError(f"Facteurs d'échelle invalides : {scale_factors}")
+        self.scale_factors = sorted(set(scale_factors))
+        self.load = load or {}
+        self.execution = execution or {}
+        self.superlinear_exponent = superlinear_exponent or self.SUPERLINEAR_EXPONENT
+
+    def run(self, queries: list, csv_paths: list, table_name: str) -> Dict:
+        """
+        Charge la table à chaque taille, mesure les requêtes et ajuste les courbes.
+
+        Args:
+            queries (list): Requêtes ou modèles de requêtes mesurés
+            csv_paths (list): Chemins des CSV et noms des tables
+            table_name (str): Table mesurée
+
+        Returns:
+            Dict: Points mesurés et lois de croissance
+                {
+                    'table_name': str,
+                    'points': List[Dict],   # Par taille : 'scale_factor', 'rows',
+                                            # 'pg_load_time', 'monet_load_time' (s)
+                                            # et 'queries' (médianes en ms par requête)
+                    'load': Dict,           # Loi du temps de chargement par SGBD
+                                            # ('pg', 'monet') et 'crossover'
+                    'queries': Dict[int, Dict] # Par requête : 'label', loi par SGBD
+                                               # ('pg', 'monet'), 'superlinear'
+                                               # (SGBD concernés) et 'crossover'
+                }
+        """
+        points = []
+        for scale_factor in self.scale_factors:
+            print(f"\n📏 Passage à l'échelle : {table_name} x{scale_factor:g}")
+            results_analyzer, results_loader = analyze_database_performance(
+                queries, csv_paths=csv_paths, table_name=table_name, config={},
+                load={**self.load, 'incremental': False, 'scale_factor': scale_factor},
+                execution=self.execution)
+            if not results_loader:
+                raise RuntimeError(f"Aucun chargement pour {table_name} x{scale_factor:g}")
+            points.append({
+                'scale_factor': scale_factor,
+                'rows': results_loader[0]['rows'],
+                'pg_load_time': results_loader[0]['pg_load_time'],
+                'monet_load_time': results_loader[0]['monet_load_time'],
+                'queries': {result['query_id']: {
+                    'label': (result.get('name') or result['template']
+                              or f"Q{result['query_id']}"),
+                    'pg': result['pg_execution_time']['median'],
+                    'monet': result['monet_execution_time']['median']
+                } for result in results_analyzer}
+            })
+
+        rows = [point['rows'] for point in points]
+        load = {engine: self.fit(rows, [point[f'{engine}_load_time'] for point in points])
+                for engine, _ in self.ENGINES}
+        load['crossover'] = self.crossover(load['pg'], load['monet'], max(rows))
+        curves = {}
+        query_ids = sorted({query_id for point in points for query_id in point['queries']})
+        for query_id in query_ids:
+            measured = [point for point in points if query_id in point['queries']]
+            curve = {'label': measured[-1]['queries'][query_id]['label']}
+            for engine, _ in self.ENGINES:
+                curve[engine] = self.fit([point['rows'] for point in measured],
+                                         [point['queries'][query_id][engine]
+                                          for point in measured])
+            curve['superlinear'] = [engine for engine, _ in self.ENGINES
+                                    if curve[engine] and curve[engine]['superlinear']]
+            curve['crossover'] = self.crossover(curve['pg'], curve['monet'], max(rows))
+            curves[query_id] = curve
+
+        scaling = {'table_name': table_name, 'points': points, 'load': load,
+                   'queries': curves}
+        self._report(scaling)
+        return scaling
+
+    def fit(self, rows: List[int], values: List[float]) -> Optional[Dict]:
+        """
+        Ajuste une loi de puissance ``valeur = coefficient * lignes ^ exposant``.
+
+        Args:
+            rows (List[int]): Nombre de lignes de chaque point
+            values (List[float]): Temps mesuré à chaque point
+
+        Returns:
+            Dict: Loi ajustée, None si moins de deux points exploitables
+                (temps et nombre de lignes strictement positifs, tailles distinctes)
+                {
+                    'coefficient': float,  # Temps prédit pour une ligne
+                    'exponent': float,     # Exposant de croissance
+                    'r2': float,           # Coefficient de détermination (log-log)
+                    'superlinear': bool    # Exposant > superlinear_exponent
+                }
+        """
+        pairs = [(n, value) for n, value in zip(rows, values) if n > 0 and value > 0]
+        if len({n for n, _ in pairs}) < 2:
+            return None
+        x = np.log([n for n, _ in pairs])
+        y = np.log([value for _, value in pairs])
+        exponent, intercept = np.polyfit(x, y, 1)
+        residuals = y - (exponent * x + intercept)
+        total = float(((y - y.mean()) ** 2).sum())
+        r2 = 1 - float((residuals ** 2).sum()) / total if total else 1.0
+        return {'coefficient': float(math.exp(intercept)), 'exponent': float(exponent),
+                'r2': r2, 'superlinear': bool(exponent > self.superlinear_exponent)}
+
+    @staticmethod
+    def predict(curve: Dict, rows: float) -> float:
+        """
+        Temps prédit par une loi ajustée.
+
+        Args:
+            curve (Dict): Loi ajustée (voir ``fit``)
+            rows (float): Nombre de lignes
+
+        Returns:
+            float: Temps prédit, dans l'unité des mesures ajustées
+        """
+        return curve['coefficient'] * rows ** curve['exponent']
+
+    @staticmethod
+    def crossover(pg_curve: Optional[Dict], monet_curve: Optional[Dict],
+                  measured_rows: int) -> Optional[Dict]:
+        """
+        Nombre de lignes où les lois des deux SGBD se croisent.
+
+        Args:
+            pg_curve (Dict): Loi de PostgreSQL (voir ``fit``)
+            monet_curve (Dict): Loi de MonetDB
+            measured_rows (int): Plus grande taille mesurée
+
+        Returns:
+            Dict: Croisement, None si une loi manque ou si les exposants sont égaux
+                {
+                    'rows': float,          # Nombre de lignes au croisement
+                    'faster_after': str,    # SGBD le plus rapide au-delà ('pg', 'monet')
+                    'extrapolated': bool    # Croisement au-delà des tailles mesurées
+                }
+        """
+        if not pg_curve or not monet_curve:
+            return None
+        slope = pg_curve['exponent'] - monet_curve['exponent']
+        if abs(slope) < 1e-9:
+            return None
+        log_rows = math.log(monet_curve['coefficient'] / pg_curve['coefficient']) / slope
+        if log_rows > 700:
+            # Croisement hors de toute taille réaliste (dépassement de float)
+            return None
+        rows = math.exp(log_rows)
+        return {'rows': rows, 'faster_after': 'monet' if slope > 0 else 'pg',
+                'extrapolated': rows > measured_rows}
+
+    def _report(self, scaling: Dict) -> None:
+        labels = dict(self.ENGINES)
+        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(f"        Passage à l'Échelle - {scaling['table_name']}")
+        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        sizes = ', '.join(f"{point['rows']:,}" for point in scaling['points'])
+        print(f"\nTailles mesurées : {sizes} lignes")
+        curves = [('Chargement', scaling['load'], scaling['load']['crossover'])]
+        curves += [(f"Q{query_id} {curve['label']}", curve, curve['crossover'])
+                   for query_id, curve in scaling['queries'].items()]
+        for name, curve, crossover in curves:
+            print(f"\n{name}")
+            for engine, label in self.ENGINES:
+                fit = curve[engine]
+                if fit is None:
+                    print(f"├─ {label:<10} : ajustement impossible")
+                    continue
+                flag = ' ⚠️ super-linéaire' if fit['superlinear'] else ''
+                print(f"├─ {label:<10} : ~ lignes^{fit['exponent']:.2f}"
+                      f" (R² {fit['r2']:.2f}){flag}")
+            if crossover:
+                when = ' (extrapolé)' if crossover['extrapolated'] else ''
+                print(f"└─ {labels[crossover['faster_after']]} plus rapide au-delà de"
+                      f" {crossover['rows']:,.0f} lignes{when}")
+            else:
+                print("└─ Pas de croisement des courbes")
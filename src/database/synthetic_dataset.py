@@ -0,0 +1,361 @@
+"""
+Jeu de données synthétique à facteur d'échelle, appris sur un CSV chargé.
+
+Pour observer les SGBD à des volumes 10 à 100 fois supérieurs à ceux des
+fichiers disponibles, SyntheticDataset apprend sur un jeu de données déjà
+analysé (CsvDataset) la distribution de chaque colonne, sa cardinalité, sa
+part de valeurs manquantes et les corrélations entre colonnes, puis produit
+à la demande des morceaux de lignes synthétiques :
+
+    - colonnes texte et booléennes : valeurs observées, tirées selon leur
+      fréquence (la cardinalité reste celle du fichier)
+    - colonnes numériques, dates et horodatages : fonction de répartition
+      empirique (QUANTILES quantiles) inversée, valeurs entières arrondies
+    - identifiants (entiers ou textes tous distincts) : valeurs d'origine
+      reprises puis décalées à chaque réplique (``+ réplique * étendue``
+      pour les entiers, suffixe ``-réplique`` pour les textes), pour rester
+      uniques et voir leur cardinalité croître avec le facteur d'échelle ;
+      leur type est élargi en conséquence dans le schéma du jeu synthétique
+    - corrélations : copule gaussienne dont la matrice est déduite des
+      corrélations de rang de Spearman (r = 2 sin(pi rho / 6))
+
+Les morceaux sont générés par lots NumPy vectorisés au moment où le chargeur
+les consomme (même interface que CsvDataset), sans fichier intermédiaire ;
+chaque morceau a sa propre graine, de sorte que chaque chargement reçoit
+exactement les mêmes lignes.
+"""
+
+import math
+import time
+from typing import Iterator, List, Optional
+import numpy as np
+import pandas as pd
+
+from src.database.csv_dataset import CsvDataset
+from src.database.load_phases import LoadPhases
+from src.database.table_schema import ColumnSchema, TableSchema
+
+
+class ColumnModel:
+    """
+    Distribution apprise d'une colonne.
+
+    Attributes:
+        name (str): Nom de la colonne
+        kind (str): Modèle de la colonne ('category', 'numeric' ou 'unique')
+        column (ColumnSchema): Type déduit de la colonne
+        dtype: Type pandas de la colonne d'origine
+        null_rate (float): Part des valeurs manquantes
+        values (np.ndarray): Valeurs observées ('category' : distinctes et
+            triées ; 'unique' : dans l'ordre du fichier)
+        cumulative (np.ndarray): Fréquences cumulées des valeurs ('category')
+        quantiles (np.ndarray): Quantiles de la colonne ('numeric')
+        span (int): Décalage d'une réplique à la suivante ('unique' entier)
+        QUANTILES (int): Nombre d'intervalles de la fonction de répartition
+        INTEGER_KINDS (tuple): Types arrondis à l'entier
+        TEMPORAL_KINDS (tuple): Types convertis en nanosecondes
+    """
+
+    QUANTILES = 1024
+    INTEGER_KINDS = ('smallint', 'integer', 'bigint')
+    TEMPORAL_KINDS = ('date', 'timestamp')
+
+    def __init__(self, column: ColumnSchema, series: pd.Series):
+        self.name = column.name
+        self.column = column
+        self.dtype = series.dtype
+        self.null_rate = float(series.isna().mean())
+        self.values = None
+        self.cumulative = None
+        self.quantiles = None
+        self.span = 0
+
+        present = series.dropna()
+        if self._is_unique(present):
+            self.kind = 'unique'
+            self.values = present.to_numpy(dtype=object if self._textual else np.int64)
+            if not self._textual:
+                self.span = int(self.values.max() - self.values.min() + 1)
+        elif self._textual or present.empty:
+            self.kind = 'category'
+            counts = present.value_counts(sort=False)
+            try:
+                counts = counts.sort_index()
+            except TypeError:
+                pass
+            self.values = counts.index.to_numpy(dtype=object)
+            self.cumulative = np.cumsum(counts.to_numpy(dtype=float)) / max(counts.sum(), 1)
+        else:
+            self.kind = 'numeric'
+            grid = np.linspace(0, 1, self.QUANTILES + 1)
+            self.quantiles = np.quantile(self._to_float(present), grid)
+
+    @property
+    def _textual(self) -> bool:
+        return self.column.kind not in self.INTEGER_KINDS + ('double',) + self.TEMPORAL_KINDS
+
+    def widened(self, total_rows: int) -> ColumnSchema:
+        """
+        Type de la colonne dans un jeu synthétique de ``total_rows`` lignes.
+
+        Les identifiants décalés à chaque réplique dépassent les valeurs
+        d'origine : les entiers reçoivent le plus petit type contenant la
+        dernière réplique, les textes la longueur du suffixe ``-réplique``.
+
+        Args:
+            total_rows (int): Nombre de lignes du jeu synthétique
+
+        Returns:
+            ColumnSchema: Type d'origine, élargi pour un identifiant
+
+        Raises:
+            ValueError: Si les identifiants entiers dépassent BIGINT
+        """
+        if self.kind != 'unique':
+            return self.column
+        last_replica = max(total_rows - 1, 0) // len(self.values)
+        if self._textual:
+            if self.column.kind != 'varchar' or not last_replica:
+                return self.column
+            return ColumnSchema(self.name, 'varchar',
+                                length=self.column.length + len(f"-{last_replica}"))
+        minimum = int(self.values.min())
+        maximum = int(self.values.max()) + last_replica * self.span
+        kind = TableSchema.integer_kind(minimum, maximum)
+        if kind is None:
+            raise ValueError(f"Colonne {self.name} : identifiants synthétiques jusqu'à "
+                             f"{maximum:,}, au-delà de BIGINT")
+        return ColumnSchema(self.name, kind)
+
+    def _is_unique(self, present: pd.Series) -> bool:
+        if len(present) < 2 or self.column.kind not in self.INTEGER_KINDS + ('varchar', 'text'):
+            return False
+        return bool(present.is_unique)
+
+    def _to_float(self, series: pd.Series) -> np.ndarray:
+        if self.column.kind in self.TEMPORAL_KINDS:
+            stamps = pd.to_datetime(series).to_numpy(dtype='datetime64[ns]')
+            return np.where(np.isnat(stamps), np.nan, stamps.astype(np.int64))
+        return pd.to_numeric(series).to_numpy(dtype=float, na_value=np.nan)
+
+    @property
+    def correlated(self) -> bool:
+        """True si la colonne participe à la copule (ni identifiant ni constante)."""
+        if self.kind == 'unique':
+            return False
+        if self.kind == 'category':
+            return len(self.values) > 1
+        return self.quantiles[0] != self.quantiles[-1]
+
+    def codes(self, series: pd.Series) -> np.ndarray:
+        """
+        Valeurs ordonnables de la colonne pour le calcul des rangs.
+
+        Args:
+            series (pd.Series): Échantillon de la colonne
+
+        Returns:
+            np.ndarray: Position de la valeur ('category') ou valeur numérique,
+                NaN pour une valeur manquante
+        """
+        if self.kind == 'category':
+            positions = pd.Series(np.arange(len(self.values), dtype=float), index=self.values)
+            return series.map(positions).to_numpy(dtype=float, na_value=np.nan)
+        return self._to_float(series)
+
+    def generate(self, uniform: np.ndarray, index: np.ndarray,
+                 rng: np.random.Generator) -> pd.Series:
+        """
+        Produit les valeurs d'un lot.
+
+        Args:
+            uniform (np.ndarray): Variables uniformes issues de la copule
+            index (np.ndarray): Numéros des lignes dans le jeu synthétique
+            rng (np.random.Generator): Générateur du lot (valeurs manquantes)
+
+        Returns:
+            pd.Series: Valeurs du type pandas de la colonne d'origine
+        """
+        missing = rng.random(len(index)) < self.null_rate
+        if self.kind == 'unique':
+            base = self.values[index % len(self.values)]
+            replica = index // len(self.values)
+            if self._textual:
+                series = pd.Series(base, dtype=object)
+                suffixed = series + '-' + pd.Series(replica).astype(str)
+                return series.where(replica == 0, suffixed).where(~missing, None)
+            values = base.astype(np.int64) + replica * self.span
+            return pd.Series(values, dtype=self.dtype).mask(missing)
+        if self.kind == 'category':
+            if not len(self.values):
+                return pd.Series([None] * len(index), dtype=object)
+            positions = np.minimum(np.searchsorted(self.cumulative, uniform, side='right'),
+                                   len(self.values) - 1)
+            series = pd.Series(self.values[positions], dtype=object).where(~missing, None)
+            if pd.api.types.is_bool_dtype(self.dtype) and not missing.any():
+                return series.astype(bool)
+            return series
+
+        grid = np.linspace(0, 1, self.QUANTILES + 1)
+        values = np.interp(uniform, grid, self.quantiles)
+        if self.column.kind in self.TEMPORAL_KINDS:
+            stamps = pd.to_datetime(np.rint(values).astype(np.int64))
+            if self.column.kind == 'date' and not pd.api.types.is_datetime64_any_dtype(self.dtype):
+                return pd.Series(stamps.date, dtype=object).where(~missing, None)
+            return pd.Series(stamps).mask(missing)
+        if self.column.kind in self.INTEGER_KINDS:
+            return pd.Series(np.rint(values).astype(np.int64), dtype=self.dtype).mask(missing)
+        return pd.Series(values, dtype=float).mask(missing)
+
+
+class SyntheticDataset:
+    """
+    Lignes synthétiques produites en flux à partir d'un jeu de données appris.
+
+    L'interface est celle de CsvDataset (``schema``, ``iter_chunks``,
+    ``chunk_count``, ...), de sorte que le jeu synthétique peut être passé
+    tel quel à ``DatabaseLoader.load_csv``. La génération se fait pendant le
+    chargement : sa durée est comptée dans la phase 'parse' du chargeur,
+    comme la lecture d'un CSV en flux.
+
+    Attributes:
+        chemin_csv (str): Chemin du fichier CSV d'origine
+        schema (TableSchema): Schéma du jeu d'origine, identifiants élargis
+            aux valeurs générées (voir ``ColumnModel.widened``)
+        scale_factor (float): Facteur d'échelle par rapport au jeu d'origine
+        seed (int): Graine de la génération
+        chunksize (int): Lignes par morceau
+        models (List[ColumnModel]): Distribution de chaque colonne
+        correlation (np.ndarray): Matrice de corrélation de la copule
+        parse_time (float): Lecture du jeu d'origine et apprentissage en secondes
+        from_cache (bool): True si le jeu d'origine provient du cache disque
+        phases (LoadPhases): Phases du jeu d'origine, apprentissage compté en 'convert'
+        FIT_SAMPLE_ROWS (int): Lignes tirées pour estimer les corrélations
+        MIN_EIGENVALUE (float): Plus petite valeur propre conservée lors de la
+            correction de la matrice de corrélation
+
+    Example:
+        >>> dataset = CsvDataset.from_csv("data/crimes.csv", pg_loader)
+        >>> synthetic = SyntheticDataset(dataset, scale_factor=10, seed=0)
+        >>> pg_loader.load_csv(synthetic.chemin_csv, "crimes", dataset=synthetic)
+    """
+
+    FIT_SAMPLE_ROWS = 200_000
+    MIN_EIGENVALUE = 1e-6
+
+    def __init__(self, source: CsvDataset, scale_factor: float, seed: int = 0,
+                 chunksize: Optional[int] = None):
+        if scale_factor <= 0:
+            raise ValueError(f"Le facteur d'échelle doit être positif : {scale_factor}")
+        start_time = time.perf_counter()
+        self.chemin_csv = source.chemin_csv
+        self.scale_factor = scale_factor
+        self.seed = seed
+        self.chunksize = chunksize or max(len(chunk) for chunk in source.chunks)
+        self.source_rows = source.total_rows
+        self.from_cache = source.from_cache
+        self.phases = source.phases
+        with self.phases.span('convert', self.source_rows):
+            self._fit(source)
+        self.schema = TableSchema([model.widened(self.total_rows) for model in self.models],
+                                  exact=source.schema.exact)
+        self.parse_time = source.parse_time + time.perf_counter() - start_time
+
+    def _fit(self, source: CsvDataset) -> None:
+        """
+        Apprend les distributions des colonnes et la matrice de la copule.
+
+        Args:
+            source (CsvDataset): Jeu de données d'origine
+        """
+        rng = np.random.default_rng(self.seed)
+        sample = np.sort(rng.choice(self.source_rows, size=min(self.FIT_SAMPLE_ROWS,
+                                                              self.source_rows),
+                                    replace=False))
+        self.models = []
+        ranks = []
+        for column in source.schema.columns:
+            series = pd.concat([chunk[column.name] for chunk in source.chunks],
+                               ignore_index=True)
+            model = ColumnModel(column, series)
+            self.models.append(model)
+            if model.correlated:
+                codes = pd.Series(model.codes(series.iloc[sample]))
+                ranks.append(codes.rank(pct=True).fillna(0.5).to_numpy())
+
+        self._correlated = [i for i, model in enumerate(self.models) if model.correlated]
+        if len(ranks) > 1:
+            spearman = np.nan_to_num(np.corrcoef(np.column_stack(ranks), rowvar=False))
+            np.fill_diagonal(spearman, 1.0)
+            correlation = 2 * np.sin(np.pi * spearman / 6)
+            # Projection sur les matrices définies positives
+            eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+            clipped = np.maximum(eigenvalues, self.MIN_EIGENVALUE)
+            correlation = (eigenvectors * clipped) @ eigenvectors.T
+            scale = np.sqrt(np.diag(correlation))
+            self.correlation = correlation / np.outer(scale, scale)
+        else:
+            self.correlation = np.eye(len(ranks))
+        self._cholesky = np.linalg.cholesky(self.correlation) if len(ranks) else None
+
+    @property
+    def total_rows(self) -> int:
+        """Nombre total de lignes du jeu synthétique."""
+        return int(round(self.source_rows * self.scale_factor))
+
+    @property
+    def columns(self) -> List[str]:
+        """Noms des colonnes nettoyés."""
+        return [model.name for model in self.models]
+
+    @property
+    def chunk_count(self) -> int:
+        """Nombre de morceaux produits par ``iter_chunks``."""
+        return math.ceil(self.total_rows / self.chunksize)
+
+    def chunk(self, number: int) -> pd.DataFrame:
+        """
+        Produit un morceau du jeu synthétique.
+
+        Les variables de la copule sont rendues uniformes par leur rang dans
+        le lot, ce qui évite le calcul de la fonction de répartition normale.
+
+        Args:
+            number (int): Numéro du morceau
+
+        Returns:
+            pd.DataFrame: Lignes ``number * chunksize`` et suivantes
+        """
+        first = number * self.chunksize
+        rows = min(self.chunksize, self.total_rows - first)
+        rng = np.random.default_rng([self.seed, number])
+        uniform = np.empty((rows, 0))
+        if self._cholesky is not None:
+            normal = rng.standard_normal((rows, len(self._correlated))) @ self._cholesky.T
+            uniform = (normal.argsort(axis=0).argsort(axis=0) + 0.5) / rows
+        index = np.arange(first, first + rows, dtype=np.int64)
+        data = {}
+        for i, model in enumerate(self.models):
+            u = (uniform[:, self._correlated.index(i)] if i in self._correlated
+                 else rng.random(rows))
+            data[model.name] = model.generate(u, index, rng)
+        return pd.DataFrame(data)
+
+    def iter_chunks(self, phases: Optional[LoadPhases] = None) -> Iterator[pd.DataFrame]:
+        """
+        Produit les morceaux dans l'ordre, au fil de leur consommation.
+
+        Args:
+            phases (LoadPhases, optional): Phases du chargement consommateur,
+                auxquelles la génération est ajoutée ('parse')
+
+        Yields:
+            pd.DataFrame: Morceaux synthétiques, au format des morceaux d'origine
+        """
+        for number in range(self.chunk_count):
+            start = time.perf_counter_ns()
+            chunk = self.chunk(number)
+            if phases is not None:
+                phases.add('parse', time.perf_counter_ns() - start, len(chunk),
+                           LoadPhases.nbytes(chunk))
+            yield chunk
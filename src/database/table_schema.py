@@ -0,0 +1,355 @@
+"""
+Inférence du schéma physique des tables, commune à tous les chargeurs.
+
+Ce module déduit des données nettoyées un type SQL compact pour chaque
+colonne : entiers réduits à la plus petite taille suffisante (y compris les
+colonnes flottantes ne contenant que des valeurs entières), dates et
+horodatages reconnus dans les colonnes texte, longueur maximale des chaînes
+et repérage des colonnes catégorielles (peu de valeurs distinctes). Les deux
+SGBD reçoivent ainsi le même schéma physique, traduit par chaque chargeur
+dans son dialecte (voir ``DatabaseLoader.SQL_TYPES``).
+"""
+
+import datetime
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+
+class ColumnSchema:
+    """
+    Type déduit pour une colonne.
+
+    Attributes:
+        name (str): Nom de la colonne
+        kind (str): Type logique ('boolean', 'smallint', 'integer', 'bigint',
+            'double', 'date', 'timestamp', 'varchar' ou 'text')
+        length (int, optional): Longueur maximale des chaînes ('varchar')
+        distinct (int, optional): Nombre de valeurs distinctes si la colonne
+            est catégorielle, None sinon
+    """
+
+    def __init__(self, name: str, kind: str, length: Optional[int] = None,
+                 distinct: Optional[int] = None):
+        self.name = name
+        self.kind = kind
+        self.length = length
+        self.distinct = distinct
+
+    @property
+    def categorical(self) -> bool:
+        """True si la colonne ne contient que peu de valeurs distinctes."""
+        return self.distinct is not None
+
+    def __repr__(self) -> str:
+        details = f"({self.length})" if self.kind == 'varchar' else ''
+        if self.categorical:
+            details += f", {self.distinct} valeurs"
+        return f"{self.name}: {self.kind}{details}"
+
+
+class TableSchema:
+    """
+    Schéma d'une table déduit de ses morceaux.
+
+    En mode exact, l'inférence parcourt tous les morceaux et les convertit en
+    place (dates reconnues, flottants entiers convertis en ``Int64``) : le
+    schéma est alors garanti pour l'ensemble des données. Sur un simple
+    échantillon (chargement en flux), elle se limite aux types pandas et
+    n'applique aucune réduction, les morceaux suivants n'étant pas connus ;
+    les colonnes de dates y sont déjà converties par le chargeur, d'après
+    les formats reconnus sur le premier morceau (voir ``date_formats``).
+
+    Les colonnes texte de peu de valeurs distinctes sont repérées comme
+    catégorielles : elles restent en VARCHAR de la longueur maximale (aucun
+    des deux SGBD n'offre de type dictionnaire commun) et leur cardinalité
+    est conservée dans le schéma.
+
+    Attributes:
+        columns (List[ColumnSchema]): Colonnes dans l'ordre de la table
+        exact (bool): True si le schéma couvre l'ensemble des données
+        DATE_FORMATS (tuple): Formats de dates essayés sur les colonnes texte
+        DATE_SAMPLE (int): Nombre de valeurs testées avant de convertir une colonne
+        CATEGORY_MAX_DISTINCT (int): Nombre maximal de valeurs distinctes d'une
+            colonne catégorielle
+        CATEGORY_MAX_RATIO (float): Part maximale de valeurs distinctes par
+            rapport au nombre de lignes d'une colonne catégorielle
+    """
+
+    DATE_FORMATS = (
+        '%m/%d/%Y %I:%M:%S %p',
+        '%m/%d/%Y',
+        '%Y-%m-%d',
+        '%Y-%m-%d %H:%M:%S',
+        '%Y-%m-%dT%H:%M:%S',
+    )
+    DATE_SAMPLE = 1000
+    CATEGORY_MAX_DISTINCT = 256
+    CATEGORY_MAX_RATIO = 0.05
+    INTEGER_KINDS = (
+        ('smallint', -2 ** 15, 2 ** 15 - 1),
+        ('integer', -2 ** 31, 2 ** 31 - 1),
+        ('bigint', -2 ** 63, 2 ** 63 - 1),
+    )
+
+    def __init__(self, columns: List[ColumnSchema], exact: bool):
+        self.columns = columns
+        self.exact = exact
+
+    @classmethod
+    def infer(cls, chunks: List[pd.DataFrame], exact: bool = True) -> 'TableSchema':
+        """
+        Déduit le schéma des morceaux (et les convertit en place en mode exact).
+
+        Args:
+            chunks (List[pd.DataFrame]): Morceaux nettoyés et normalisés
+            exact (bool, optional): True si les morceaux représentent toutes
+                les données, False pour un échantillon
+
+        Returns:
+            TableSchema: Schéma de la table
+        """
+        if not exact:
+            return cls([cls._infer_sample(chunks[0][col]) for col in chunks[0].columns],
+                       exact=False)
+        return cls([cls._infer_column(chunks, col) for col in chunks[0].columns],
+                   exact=True)
+
+    @staticmethod
+    def _infer_sample(series: pd.Series) -> ColumnSchema:
+        """
+        Type sûr d'une colonne connue par un échantillon seulement.
+
+        Args:
+            series (pd.Series): Colonne du premier morceau
+
+        Returns:
+            ColumnSchema: Type le plus large de chaque famille
+        """
+        if pd.api.types.is_bool_dtype(series.dtype):
+            return ColumnSchema(series.name, 'boolean')
+        if pd.api.types.is_integer_dtype(series.dtype):
+            return ColumnSchema(series.name, 'bigint')
+        if pd.api.types.is_float_dtype(series.dtype):
+            return ColumnSchema(series.name, 'double')
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            return ColumnSchema(series.name, 'timestamp')
+        return ColumnSchema(series.name, 'text')
+
+    @classmethod
+    def _infer_column(cls, chunks: List[pd.DataFrame], col: str) -> ColumnSchema:
+        """
+        Déduit le type d'une colonne sur l'ensemble des morceaux.
+
+        Args:
+            chunks (List[pd.DataFrame]): Morceaux à analyser (convertis en place)
+            col (str): Nom de la colonne
+
+        Returns:
+            ColumnSchema: Type déduit
+        """
+        dtype = chunks[0][col].dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            return ColumnSchema(col, 'boolean')
+        if pd.api.types.is_float_dtype(dtype):
+            if not cls._all_integral(chunks, col):
+                return ColumnSchema(col, 'double')
+            for chunk in chunks:
+                chunk[col] = chunk[col].astype('Int64')
+            dtype = chunks[0][col].dtype
+        if pd.api.types.is_integer_dtype(dtype):
+            return ColumnSchema(col, cls._integer_kind(chunks, col))
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            # Dates converties à la lecture (voir date_formats)
+            return ColumnSchema(col, cls._store_dates(chunks, col,
+                                                      [chunk[col] for chunk in chunks]))
+
+        values = cls._first_values(chunks, col)
+        if values and all(isinstance(v, datetime.date) for v in values):
+            return ColumnSchema(col, 'date')
+        date_format = cls._date_format(values)
+        kind = cls._convert_dates(chunks, col, date_format) if date_format else None
+        if kind:
+            return ColumnSchema(col, kind)
+        return cls._infer_text(chunks, col)
+
+    @staticmethod
+    def _all_integral(chunks: List[pd.DataFrame], col: str) -> bool:
+        for chunk in chunks:
+            values = chunk[col].dropna()
+            if not values.empty and not (np.isfinite(values).all()
+                                         and (values % 1 == 0).all()
+                                         and values.abs().max() < 2 ** 53):
+                return False
+        return True
+
+    @classmethod
+    def _integer_kind(cls, chunks: List[pd.DataFrame], col: str) -> str:
+        minimum = min((chunk[col].min() for chunk in chunks
+                       if chunk[col].notna().any()), default=0)
+        maximum = max((chunk[col].max() for chunk in chunks
+                       if chunk[col].notna().any()), default=0)
+        return cls.integer_kind(minimum, maximum) or 'bigint'
+
+    @classmethod
+    def integer_kind(cls, minimum: int, maximum: int) -> Optional[str]:
+        """
+        Plus petit type entier contenant un intervalle de valeurs.
+
+        Args:
+            minimum (int): Plus petite valeur
+            maximum (int): Plus grande valeur
+
+        Returns:
+            str: Type logique ('smallint', 'integer' ou 'bigint'), None si
+                l'intervalle dépasse BIGINT
+        """
+        for kind, low, high in cls.INTEGER_KINDS:
+            if low <= minimum and maximum <= high:
+                return kind
+        return None
+
+    @classmethod
+    def _first_values(cls, chunks: List[pd.DataFrame], col: str) -> list:
+        values = []
+        for chunk in chunks:
+            values.extend(chunk[col].dropna().head(cls.DATE_SAMPLE - len(values)))
+            if len(values) >= cls.DATE_SAMPLE:
+                break
+        return values
+
+    @classmethod
+    def _date_format(cls, values: list) -> Optional[str]:
+        """
+        Cherche un format de date reconnaissant toutes les valeurs de l'échantillon.
+
+        Args:
+            values (list): Premières valeurs non manquantes de la colonne
+
+        Returns:
+            str: Format reconnu, None si la colonne n'est pas une colonne de dates
+        """
+        if not values or not all(isinstance(v, str) for v in values):
+            return None
+        for date_format in cls.DATE_FORMATS:
+            try:
+                pd.to_datetime(pd.Series(values), format=date_format)
+                return date_format
+            except (TypeError, ValueError):
+                continue
+        return None
+
+    @classmethod
+    def date_formats(cls, chunk: pd.DataFrame) -> Dict[str, str]:
+        """
+        Reconnaît les colonnes de dates d'un premier morceau.
+
+        Les chargeurs convertissent ensuite chaque morceau avec les formats
+        reconnus (voir ``DatabaseLoader.normalize_chunk``), de sorte qu'un
+        schéma déduit du seul premier morceau type aussi ces colonnes.
+
+        Args:
+            chunk (pd.DataFrame): Premier morceau nettoyé
+
+        Returns:
+            Dict[str, str]: Format de chaque colonne texte dont toutes les
+                valeurs du morceau respectent un des DATE_FORMATS
+        """
+        formats = {}
+        for col in chunk.columns:
+            if not pd.api.types.is_string_dtype(chunk[col].dtype):
+                continue
+            date_format = cls._date_format(list(chunk[col].dropna().head(cls.DATE_SAMPLE)))
+            if date_format is None:
+                continue
+            try:
+                pd.to_datetime(chunk[col], format=date_format)
+            except (TypeError, ValueError):
+                continue
+            formats[col] = date_format
+        return formats
+
+    @classmethod
+    def _convert_dates(cls, chunks: List[pd.DataFrame], col: str,
+                       date_format: str) -> Optional[str]:
+        """
+        Convertit une colonne de dates dans tous les morceaux.
+
+        Rien n'est modifié si une valeur ne respecte pas le format.
+
+        Args:
+            chunks (List[pd.DataFrame]): Morceaux à convertir en place
+            col (str): Nom de la colonne
+            date_format (str): Format reconnu sur l'échantillon
+
+        Returns:
+            str: Type logique ('date' ou 'timestamp', voir ``_store_dates``),
+                None si la colonne n'a pas été convertie
+        """
+        try:
+            parsed = [pd.to_datetime(chunk[col], format=date_format) for chunk in chunks]
+        except (TypeError, ValueError):
+            return None
+        return cls._store_dates(chunks, col, parsed)
+
+    @staticmethod
+    def _store_dates(chunks: List[pd.DataFrame], col: str, parsed: List[pd.Series]) -> str:
+        """
+        Range dans les morceaux une colonne d'horodatages.
+
+        Les colonnes dont toutes les heures valent minuit sont converties en
+        ``datetime.date`` (type DATE), les autres restent des horodatages.
+
+        Args:
+            chunks (List[pd.DataFrame]): Morceaux à modifier en place
+            col (str): Nom de la colonne
+            parsed (List[pd.Series]): Horodatages de chaque morceau
+
+        Returns:
+            str: 'date' ou 'timestamp'
+        """
+        dates_only = all((series.dropna() == series.dropna().dt.normalize()).all()
+                         for series in parsed)
+        for chunk, series in zip(chunks, parsed):
+            if dates_only:
+                series = series.dt.date.astype(object)
+                series = series.where(series.notna(), None)
+            chunk[col] = series
+        return 'date' if dates_only else 'timestamp'
+
+    @classmethod
+    def _infer_text(cls, chunks: List[pd.DataFrame], col: str) -> ColumnSchema:
+        """
+        Déduit la longueur maximale et la cardinalité d'une colonne texte.
+
+        Les valeurs qui ne sont pas des chaînes (nombres d'une colonne vide
+        dans le premier morceau, par exemple) sont converties en texte, pour
+        que la colonne ait le même type dans tous les morceaux.
+
+        Args:
+            chunks (List[pd.DataFrame]): Morceaux à analyser (convertis en place)
+            col (str): Nom de la colonne
+
+        Returns:
+            ColumnSchema: 'varchar' de la longueur maximale (et nombre de valeurs
+                distinctes si la colonne est catégorielle), 'text' si la colonne est vide
+        """
+        length, rows = 0, 0
+        distinct = set()
+        for chunk in chunks:
+            if pd.api.types.infer_dtype(chunk[col], skipna=True) not in ('string', 'empty'):
+                series = chunk[col].map(str, na_action='ignore')
+                chunk[col] = series.where(series.notna(), None)
+            values = chunk[col].dropna().astype(str)
+            rows += len(chunk)
+            if values.empty:
+                continue
+            length = max(length, int(values.str.len().max()))
+            if len(distinct) <= cls.CATEGORY_MAX_DISTINCT:
+                distinct.update(values.unique())
+        if length == 0:
+            return ColumnSchema(col, 'text')
+        categorical = (len(distinct) <= cls.CATEGORY_MAX_DISTINCT
+                       and len(distinct) <= rows * cls.CATEGORY_MAX_RATIO)
+        return ColumnSchema(col, 'varchar', length=length,
+                            distinct=len(distinct) if categorical else None)
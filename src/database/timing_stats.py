@@ -0,0 +1,175 @@
+"""
+Statistiques des temps d'exécution mesurés sur plusieurs itérations.
+
+Ce module fournit TimingStats, qui résume une série de mesures d'une requête
+(médiane, percentiles, écart type, intervalle de confiance par bootstrap)
+après rejet des valeurs aberrantes, et décide si la série est assez précise
+pour arrêter les itérations (mode adaptatif). Tous les calculs sont
+vectorisés avec NumPy, y compris le rééchantillonnage du bootstrap.
+"""
+
+from typing import Dict, Optional, Sequence
+import numpy as np
+
+
+class TimingStats:
+    """
+    Résumé statistique d'une série de temps d'exécution.
+
+    Les valeurs aberrantes sont rejetées par la règle de Tukey (au-delà de
+    OUTLIER_FENCE écarts interquartiles des quartiles) avant le calcul des
+    statistiques ; leur nombre est conservé dans le résumé. L'intervalle de
+    confiance porte sur la moyenne et est obtenu par bootstrap percentile.
+
+    Attributes:
+        confidence (float): Niveau de confiance de l'intervalle (ex. 0.95)
+        resamples (int): Nombre de rééchantillonnages du bootstrap
+        OUTLIER_FENCE (float): Multiple de l'écart interquartile au-delà
+            duquel une mesure est rejetée
+        PERCENTILES (tuple): Percentiles calculés
+        SEED (int): Graine du générateur aléatoire (résultats reproductibles)
+        CHECK_EVERY (int): Itérations entre deux tests d'arrêt en mode adaptatif
+
+    Example:
+        >>> stats = TimingStats(confidence=0.95)
+        >>> summary = stats.summarize(pg_times)
+        >>> summary['median'], summary['ci_low'], summary['ci_high']
+    """
+
+    OUTLIER_FENCE = 1.5
+    PERCENTILES = (90, 95, 99)
+    SEED = 0
+    CHECK_EVERY = 5
+
+    def __init__(self, confidence: float = 0.95, resamples: int = 2000):
+        if not 0 < confidence < 1:
+            raise ValueError(f"Niveau de confiance invalide : {confidence} (attendu entre 0 et 1)")
+        self.confidence = confidence
+        self.resamples = resamples
+        self._rng = np.random.default_rng(self.SEED)
+
+    def inliers(self, samples: Sequence[float]) -> np.ndarray:
+        """
+        Rejette les valeurs aberrantes selon la règle de Tukey.
+
+        Args:
+            samples (Sequence[float]): Mesures brutes
+
+        Returns:
+            np.ndarray: Mesures conservées, dans l'ordre d'origine
+        """
+        values = np.asarray(samples, dtype=float)
+        if len(values) < 4:
+            return values
+        q1, q3 = np.percentile(values, [25, 75])
+        fence = self.OUTLIER_FENCE * (q3 - q1)
+        return values[(values >= q1 - fence) & (values <= q3 + fence)]
+
+    def confidence_interval(self, values: np.ndarray) -> tuple:
+        """
+        Calcule l'intervalle de confiance de la moyenne par bootstrap.
+
+        Les ``resamples`` rééchantillonnages sont tirés en une seule matrice
+        d'indices, dont les moyennes sont calculées ligne à ligne.
+
+        Args:
+            values (np.ndarray): Mesures conservées
+
+        Returns:
+            tuple: Bornes basse et haute de l'intervalle
+        """
+        if len(values) < 2:
+            mean = float(values.mean()) if len(values) else 0.0
+            return mean, mean
+        indices = self._rng.integers(0, len(values), size=(self.resamples, len(values)))
+        means = values[indices].mean(axis=1)
+        alpha = (1 - self.confidence) / 2 * 100
+        low, high = np.percentile(means, [alpha, 100 - alpha])
+        return float(low), float(high)
+
+    def summarize(self, samples: Sequence[float]) -> Dict:
+        """
+        Résume une série de mesures.
+
+        Args:
+            samples (Sequence[float]): Mesures brutes en ms
+
+        Returns:
+            Dict: Statistiques des mesures conservées
+                {
+                    'mean': float,       # Moyenne
+                    'min': float,        # Minimum
+                    'max': float,        # Maximum
+                    'median': float,     # Médiane
+                    'p90': float,        # 90e percentile (idem p95, p99)
+                    'std': float,        # Écart type (ddof=1)
+                    'ci_low': float,     # Borne basse de l'IC de la moyenne
+                    'ci_high': float,    # Borne haute de l'IC de la moyenne
+                    'ci_width': float,   # Largeur de l'IC rapportée à la moyenne
+                    'samples': int,      # Mesures conservées
+                    'outliers': int      # Mesures rejetées
+                }
+
+        Raises:
+            ValueError: Si la série est vide
+        """
+        if len(samples) == 0:
+            raise ValueError("Aucune mesure à résumer")
+        values = self.inliers(samples)
+        mean = float(values.mean())
+        ci_low, ci_high = self.confidence_interval(values)
+        summary = {
+            'mean': mean,
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'median': float(np.median(values)),
+        }
+        for percentile, value in zip(self.PERCENTILES,
+                                     np.percentile(values, self.PERCENTILES)):
+            summary[f'p{percentile}'] = float(value)
+        summary.update({
+            'std': float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+            'ci_low': ci_low,
+            'ci_high': ci_high,
+            'ci_width': (ci_high - ci_low) / mean if mean else 0.0,
+            'samples': int(len(values)),
+            'outliers': int(len(samples) - len(values))
+        })
+        return summary
+
+    def converged(self, samples: Sequence[float], target_ci_width: float,
+                  min_samples: int) -> bool:
+        """
+        Indique si une série est assez précise pour arrêter les itérations.
+
+        Args:
+            samples (Sequence[float]): Mesures brutes en ms
+            target_ci_width (float): Largeur maximale de l'IC rapportée à la moyenne
+            min_samples (int): Nombre minimal de mesures avant tout arrêt
+
+        Returns:
+            bool: True si la largeur relative de l'IC est sous la cible
+        """
+        if len(samples) < max(min_samples, 2):
+            return False
+        return self.summarize(samples)['ci_width'] <= target_ci_width
+
+    @staticmethod
+    def verdict(pg_summary: Dict, monet_summary: Dict) -> Optional[str]:
+        """
+        Compare deux séries d'après leurs intervalles de confiance.
+
+        Args:
+            pg_summary (Dict): Résumé des mesures PostgreSQL
+            monet_summary (Dict): Résumé des mesures MonetDB
+
+        Returns:
+            str: 'postgres' ou 'monetdb' si l'intervalle du SGBD le plus rapide
+                est entièrement sous celui de l'autre, None si les intervalles
+                se chevauchent (différence non significative)
+        """
+        if pg_summary['ci_high'] < monet_summary['ci_low']:
+            return 'postgres'
+        if monet_summary['ci_high'] < pg_summary['ci_low']:
+            return 'monetdb'
+        return None
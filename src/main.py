@@ -32,11 +32,132 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Imports des modules internes
-from src.queries.air_quality_queries import AIR_QUALITY_QUERIES
-from src.queries.crimes_queries import CRIMES_QUERIES
-from src.config import CSV_PATHS, GRAPH_CONFIG
-from src.visualization import create_performance_graph
+from src.queries.registry import QUERY_REGISTRY
+from src.config import (CSV_PATHS, GRAPH_CONFIG, LOAD_MODES, LOAD_WORKERS,
+                        DATASET_CACHE_DIR, DATASET_MEMORY_LIMIT, INCREMENTAL_LOAD,
+                        PHYSICAL_DESIGN,
+                        SERVER_METRICS, FETCH_MODE, FETCH_SIZE, HASH_ROWS, CACHE_MODE,
+                        ITERATION_STATS, CONCURRENCY, OPEN_LOOP, PREPARED_STATEMENTS,
+                        CONNECTION_POOL, ENGINE_SCHEDULE, QUERY_WORKLOAD,
+                        SYNTHETIC_DATA, SCALING, MIXED_WORKLOAD)
+from src.visualization import create_performance_graph, create_scaling_graph
 from src.database.performance_analyzer import analyze_database_performance
+from src.database.scaling_benchmark import ScalingBenchmark
+
+def _load_modes_ms(metrics: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """
+    Convertit les temps de chargement par mode en millisecondes.
+
+    Args:
+        metrics: Métriques de chargement d'une table (issues de results_loader)
+
+    Returns:
+        Dict: Temps de chargement en ms par SGBD puis par mode
+    """
+    return {
+        engine: {mode: load_time * 1000 for mode, load_time in modes.items()}
+        for engine, modes in metrics['load_modes'].items()
+    }
+
+def _select_queries(table_name: str) -> list:
+    """
+    Sélectionne dans le registre les requêtes d'une table (voir QUERY_WORKLOAD).
+
+    Args:
+        table_name: Table analysée
+
+    Returns:
+        list: Définitions des requêtes, en version paramétrée si demandé
+    """
+    return QUERY_REGISTRY.select(table_name, suites=QUERY_WORKLOAD['suites'],
+                                 categories=QUERY_WORKLOAD['categories'],
+                                 templates=QUERY_WORKLOAD['templates'])
+
+def _mixed_rates(table_name: str) -> list:
+    """
+    Débits d'ingestion de la charge mixte pour une table (voir MIXED_WORKLOAD).
+
+    Args:
+        table_name: Table analysée
+
+    Returns:
+        list: Débits visés en lignes/s, vide si la table n'est pas concernée
+    """
+    return MIXED_WORKLOAD['ingest_rates'] if table_name in MIXED_WORKLOAD['tables'] else []
+
+def _load_options() -> Dict[str, Any]:
+    """
+    Options de chargement d'analyze_database_performance (voir LOAD_OPTIONS).
+
+    Returns:
+        Dict: Modes et processus de chargement, cache, conception physique
+            et facteur d'échelle issus de la configuration
+    """
+    return {
+        'pg_load_modes': LOAD_MODES['postgres'],
+        'monet_load_modes': LOAD_MODES['monetdb'],
+        'load_workers': LOAD_WORKERS,
+        'cache_dir': DATASET_CACHE_DIR,
+        'dataset_memory_limit': DATASET_MEMORY_LIMIT,
+        'incremental': INCREMENTAL_LOAD,
+        'physical_design': PHYSICAL_DESIGN,
+        'scale_factor': SYNTHETIC_DATA['scale_factor'],
+        'synthetic_seed': SYNTHETIC_DATA['seed']
+    }
+
+def _execution_options() -> Dict[str, Any]:
+    """
+    Options d'exécution des requêtes d'analyze_database_performance
+    (voir EXECUTION_OPTIONS).
+
+    Returns:
+        Dict: Itérations, métriques, caches, statistiques, préparation,
+            pool de sessions et ordonnancement issus de la configuration
+    """
+    return {
+        'iterations': ITERATION_STATS['iterations'],
+        'server_metrics': SERVER_METRICS,
+        'fetch_mode': FETCH_MODE,
+        'fetch_size': FETCH_SIZE,
+        'hash_rows': HASH_ROWS,
+        'cache_mode': CACHE_MODE['mode'],
+        'warmup_iterations': CACHE_MODE['warmup_iterations'],
+        'restart_commands': CACHE_MODE['restart_commands'],
+        'drop_os_cache': CACHE_MODE['drop_os_cache'],
+        'adaptive': ITERATION_STATS['adaptive'],
+        'min_iterations': ITERATION_STATS['min_iterations'],
+        'target_ci_width': ITERATION_STATS['target_ci_width'],
+        'time_budget': ITERATION_STATS['time_budget'],
+        'confidence': ITERATION_STATS['confidence'],
+        'bootstrap_resamples': ITERATION_STATS['bootstrap_resamples'],
+        'prepared': PREPARED_STATEMENTS,
+        'workload_seed': QUERY_WORKLOAD['seed'],
+        'connection_pool': CONNECTION_POOL,
+        'schedule': ENGINE_SCHEDULE['mode'],
+        'cpu_sets': ENGINE_SCHEDULE['cpu_sets']
+    }
+
+def _throughput_options() -> Dict[str, Any]:
+    """
+    Options des mesures de débit d'analyze_database_performance
+    (voir THROUGHPUT_OPTIONS), hors débits d'ingestion propres à chaque
+    table (voir _mixed_rates).
+
+    Returns:
+        Dict: Boucle fermée, boucle ouverte et charge mixte issues de la configuration
+    """
+    return {
+        'concurrency_clients': CONCURRENCY['clients'],
+        'concurrency_duration': CONCURRENCY['duration'],
+        'open_loop_rates': OPEN_LOOP['rates'],
+        'open_loop_duration': OPEN_LOOP['duration'],
+        'open_loop_arrival': OPEN_LOOP['arrival'],
+        'open_loop_max_in_flight': OPEN_LOOP['max_in_flight'],
+        'mixed_duration': MIXED_WORKLOAD['duration'],
+        'mixed_readers': MIXED_WORKLOAD['readers'],
+        'mixed_writers': MIXED_WORKLOAD['writers'],
+        'mixed_batch_rows': MIXED_WORKLOAD['batch_rows']
+    }
 
 def main() -> None:
     """
@@ -66,22 +187,31 @@ def main() -> None:
     try:
         logger.info("Démarrage de l'analyse des performances...")
         
+        # Options communes aux deux analyses, tirées de la configuration
+        load_options = _load_options()
+        execution_options = _execution_options()
+        throughput_options = _throughput_options()
+
         # Analyse des données de qualité de l'air
         analyzer_air_quality, loader_air_quality = analyze_database_performance(
-            AIR_QUALITY_QUERIES, 
+            _select_queries('air_quality'),
             csv_paths=CSV_PATHS,
             table_name="air_quality",
-            iterations=50,
-            config=GRAPH_CONFIG['air_quality']
+            config=GRAPH_CONFIG['air_quality'],
+            load=load_options,
+            execution=execution_options,
+            throughput={**throughput_options, 'mixed_ingest_rates': _mixed_rates('air_quality')}
         )
         
         # Analyse des données de crimes
         analyzer_crimes, loader_crimes = analyze_database_performance(
-            CRIMES_QUERIES, 
+            _select_queries('crimes'),
             csv_paths=CSV_PATHS,
             table_name="crimes",
-            iterations=50,
-            config=GRAPH_CONFIG['crimes']
+            config=GRAPH_CONFIG['crimes'],
+            load=load_options,
+            execution=execution_options,
+            throughput={**throughput_options, 'mixed_ingest_rates': _mixed_rates('crimes')}
         )
         
         # Mettre à jour les configurations avec les temps réels
@@ -91,7 +221,11 @@ def main() -> None:
                     'pg_load_time': loader_air_quality[0]['pg_load_time'] * 1000,  # Conversion en ms
                     'monet_load_time': loader_air_quality[0]['monet_load_time'] * 1000
                 },
-                'total_rows': loader_air_quality[0]['rows']
+                'loading_times_by_mode': _load_modes_ms(loader_air_quality[0]),
+                'total_rows': loader_air_quality[0]['rows'],
+                'parse_phases': loader_air_quality[0]['parse_phases'],
+                'load_phases': loader_air_quality[0]['load_phases'],
+                'physical_design': loader_air_quality[0]['physical_design']
             })
 
         if loader_crimes:
@@ -100,7 +234,11 @@ def main() -> None:
                     'pg_load_time': loader_crimes[0]['pg_load_time'] * 1000,
                     'monet_load_time': loader_crimes[0]['monet_load_time'] * 1000
                 },
-                'total_rows': loader_crimes[0]['rows']
+                'loading_times_by_mode': _load_modes_ms(loader_crimes[0]),
+                'total_rows': loader_crimes[0]['rows'],
+                'parse_phases': loader_crimes[0]['parse_phases'],
+                'load_phases': loader_crimes[0]['load_phases'],
+                'physical_design': loader_crimes[0]['physical_design']
             })
         
         # Création des graphiques
@@ -119,11 +257,42 @@ def main() -> None:
         for metrics in loader_air_quality + loader_crimes:
             print(f"\n📊 Table: {metrics['table_name']}")
             print(f"  ├─ Lignes: {metrics['rows']:,}")
+            print(f"  ├─ Lecture {'cache' if metrics['from_cache'] else 'CSV'}: "
+                  f"{metrics['parse_time']:.2f} s")
             print(f"  ├─ PostgreSQL: {metrics['pg_load_time']:.2f} s")
+            for mode, load_time in metrics['load_modes']['pg'].items():
+                print(f"  │  └─ {mode}: {load_time:.2f} s "
+                      f"({metrics['load_per_row_by_mode']['pg'][mode]:.4f} ms/ligne)")
             print(f"  ├─ MonetDB: {metrics['monet_load_time']:.2f} s")
+            for mode, load_time in metrics['load_modes']['monet'].items():
+                print(f"  │  └─ {mode}: {load_time:.2f} s "
+                      f"({metrics['load_per_row_by_mode']['monet'][mode]:.4f} ms/ligne)")
+            print(f"  ├─ Conception physique: PostgreSQL {metrics['pg_design_time']:.2f} s, "
+                  f"MonetDB {metrics['monet_design_time']:.2f} s")
             print(f"  └─ Ratio MonetDB/PostgreSQL: {metrics['ratio']:.2f}")
 
         print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+
+        # Courbes de passage à l'échelle : un chargement et une mesure par taille
+        if SCALING['scale_factors']:
+            logger.info("Mesure du passage à l'échelle...")
+            benchmark = ScalingBenchmark(
+                SCALING['scale_factors'],
+                load={**load_options,
+                      'pg_load_modes': LOAD_MODES['postgres'][:1],
+                      'monet_load_modes': LOAD_MODES['monetdb'][:1],
+                      'load_workers': LOAD_WORKERS[:1]},
+                execution={**execution_options,
+                           'iterations': SCALING['iterations'],
+                           'adaptive': False,
+                           'time_budget': None},
+                superlinear_exponent=SCALING['superlinear_exponent'])
+            for table_name in ('air_quality', 'crimes'):
+                scaling = benchmark.run(_select_queries(table_name), CSV_PATHS, table_name)
+                create_scaling_graph(scaling, {
+                    'title': GRAPH_CONFIG[table_name]['title'],
+                    'output_file': f'{table_name}_scaling.png'
+                })
         
         logger.info("Analyse terminée avec succès")
         
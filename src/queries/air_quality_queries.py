@@ -2,6 +2,9 @@
 Requêtes SQL optimisées par type d'opération pour l'analyse d'un petit dataset sur le thème de la qualité de l'air.
 """
 
+from src.database.query_registry import QueryDefinition
+from src.database.query_template import QueryParameter, QueryTemplate
+
 AIR_QUALITY_QUERIES = [
     # 1. Sélection simple
     """
@@ -11,7 +14,7 @@ AIR_QUALITY_QUERIES = [
         SELECT AVG(Data_Value) FROM air_quality
     )
     AND Measure_Info = 'number'
-    ORDER BY Data_Value DESC
+    ORDER BY Data_Value DESC, Name, Measure, Geo_Place_Name
     LIMIT 1000
     """,
 
@@ -45,4 +48,69 @@ AIR_QUALITY_QUERIES = [
     JOIN location_stats ls ON aq.Geo_Place_Name = ls.Geo_Place_Name
     WHERE aq.Data_Value > ls.location_avg
     """,
-]
\ No newline at end of file
+]
+
+# Modèles paramétrés des mêmes requêtes : les constantes sont tirées à chaque
+# itération dans la distribution réelle des colonnes (voir QueryTemplate)
+AIR_QUALITY_TEMPLATES = [
+    # 1. Sélection simple
+    QueryTemplate('Sélection', """
+    SELECT DISTINCT Name, Measure, Geo_Place_Name, Data_Value
+    FROM air_quality
+    WHERE Data_Value > {min_value}
+    AND Measure_Info = 'number'
+    ORDER BY Data_Value DESC, Name, Measure, Geo_Place_Name
+    LIMIT 1000
+    """, 'air_quality', [
+        QueryParameter('min_value', 'data_value', 'lower', 'float')
+    ]),
+
+    # 2. Agrégation
+    QueryTemplate('Agrégation', """
+    SELECT 
+        Geo_Place_Name,
+        COUNT(*) as total_measures,
+        AVG(Data_Value) as avg_value,
+        MIN(Data_Value) as min_value,
+        MAX(Data_Value) as max_value
+    FROM air_quality
+    WHERE Data_Value BETWEEN {value_low} AND {value_high}
+    GROUP BY Geo_Place_Name
+    HAVING COUNT(*) > 5
+    ORDER BY avg_value DESC, Geo_Place_Name
+    """, 'air_quality', [
+        QueryParameter('value', 'data_value', 'range', 'float', selectivity=(0.01, 0.9))
+    ]),
+
+    # 3. Jointure
+    QueryTemplate('Jointure', """
+    WITH location_stats AS (
+        SELECT Geo_Place_Name, AVG(Data_Value) as location_avg
+        FROM air_quality
+        WHERE Name = {name}
+        GROUP BY Geo_Place_Name
+    )
+    SELECT 
+        aq.Geo_Place_Name,
+        aq.Name,
+        aq.Data_Value,
+        ls.location_avg
+    FROM air_quality aq
+    JOIN location_stats ls ON aq.Geo_Place_Name = ls.Geo_Place_Name
+    WHERE aq.Name = {name}
+    AND aq.Data_Value > ls.location_avg
+    """, 'air_quality', [
+        QueryParameter('name', 'name', 'value', 'text')
+    ]),
+]
+
+# Registre des requêtes de la table air_quality (versions figée et paramétrée)
+AIR_QUALITY_SUITE = [
+    QueryDefinition('air_quality.selection', 'selection', ('air_quality',),
+                    AIR_QUALITY_QUERIES[0], AIR_QUALITY_TEMPLATES[0],
+                    expected={'max_rows': 1000}),
+    QueryDefinition('air_quality.aggregation', 'aggregation', ('air_quality',),
+                    AIR_QUALITY_QUERIES[1], AIR_QUALITY_TEMPLATES[1]),
+    QueryDefinition('air_quality.join', 'join', ('air_quality',),
+                    AIR_QUALITY_QUERIES[2], AIR_QUALITY_TEMPLATES[2]),
+]
@@ -2,6 +2,9 @@
 Requêtes SQL optimisées par type d'opération pour l'analyse d'un grand dataset sur le thème des crimes.
 """
 
+from src.database.query_registry import QueryDefinition
+from src.database.query_template import QueryParameter, QueryTemplate
+
 CRIMES_QUERIES = [
     # 1. Sélection simple
     """
@@ -9,6 +12,7 @@ CRIMES_QUERIES = [
     FROM crimes 
     WHERE vict_age > 18 
     AND time_occ BETWEEN 2000 AND 2359
+    ORDER BY area_name, crm_cd_desc, vict_age, vict_sex
     LIMIT 1000
     """,
 
@@ -44,6 +48,316 @@ CRIMES_QUERIES = [
     """,
 ]
 
+# Modèles paramétrés des mêmes requêtes : les constantes sont tirées à chaque
+# itération dans la distribution réelle des colonnes (voir QueryTemplate)
+CRIMES_TEMPLATES = [
+    # 1. Sélection simple
+    QueryTemplate('Sélection', """
+    SELECT DISTINCT area_name, crm_cd_desc, vict_age, vict_sex
+    FROM crimes 
+    WHERE vict_age > {min_age} 
+    AND time_occ BETWEEN {time_low} AND {time_high}
+    ORDER BY area_name, crm_cd_desc, vict_age, vict_sex
+    LIMIT 1000
+    """, 'crimes', [
+        QueryParameter('min_age', 'vict_age', 'lower', 'int'),
+        QueryParameter('time', 'time_occ', 'range', 'int')
+    ]),
+
+    # 2. Agrégation
+    QueryTemplate('Agrégation', """
+    SELECT 
+        crm_cd_desc,
+        COUNT(*) as total_crimes,
+        AVG(CAST(vict_age AS FLOAT)) as avg_victim_age
+    FROM crimes
+    WHERE area_name = {area}
+    AND vict_age BETWEEN {age_low} AND {age_high}
+    GROUP BY crm_cd_desc
+    ORDER BY total_crimes DESC, crm_cd_desc
+    """, 'crimes', [
+        QueryParameter('area', 'area_name', 'value', 'text'),
+        QueryParameter('age', 'vict_age', 'range', 'int')
+    ]),
+
+    # 3. Jointure
+    QueryTemplate('Jointure', """
+    WITH crime_stats AS (
+        SELECT area_name, COUNT(*) as area_count
+        FROM crimes
+        WHERE time_occ BETWEEN {time_low} AND {time_high}
+        GROUP BY area_name
+    )
+    SELECT 
+        c.area_name,
+        c.crm_cd_desc,
+        cs.area_count,
+        COUNT(*) as specific_crime_count
+    FROM crimes c
+    JOIN crime_stats cs ON c.area_name = cs.area_name
+    WHERE c.time_occ BETWEEN {time_low} AND {time_high}
+    GROUP BY c.area_name, c.crm_cd_desc, cs.area_count
+    HAVING COUNT(*) > 50
+    """, 'crimes', [
+        QueryParameter('time', 'time_occ', 'range', 'int', selectivity=(0.05, 0.8))
+    ]),
+]
+
+# Suite analytique : requêtes qui opposent le stockage en colonnes de MonetDB
+# au stockage en lignes de PostgreSQL (parcours de quelques colonnes contre
+# lignes entières, fenêtrage, tris partiels, jointures en étoile sur des
+# dimensions dérivées, agrégats par période de date_occ)
+CRIMES_ANALYTICAL_QUERIES = {
+    # Projection étroite : deux colonnes des lignes d'une tranche horaire
+    'narrow_projection': """
+    SELECT dr_no, vict_age
+    FROM crimes
+    WHERE time_occ BETWEEN 1200 AND 1259
+    """,
+
+    # Projection large : toutes les colonnes des mêmes lignes
+    'wide_projection': """
+    SELECT *
+    FROM crimes
+    WHERE time_occ BETWEEN 1200 AND 1259
+    """,
+
+    # Parcours complet de deux colonnes, résultat d'une ligne
+    'narrow_scan': """
+    SELECT
+        COUNT(*) as total_crimes,
+        AVG(CAST(vict_age AS FLOAT)) as avg_victim_age,
+        MIN(date_occ) as first_day,
+        MAX(date_occ) as last_day
+    FROM crimes
+    """,
+
+    # Regroupement à forte cardinalité sur trois colonnes texte
+    'wide_group_by': """
+    SELECT
+        crm_cd_desc,
+        vict_sex,
+        vict_descent,
+        COUNT(*) as total_crimes,
+        AVG(CAST(vict_age AS FLOAT)) as avg_victim_age
+    FROM crimes
+    GROUP BY crm_cd_desc, vict_sex, vict_descent
+    """,
+
+    # Agrégat mensuel sur date_occ
+    'monthly_counts': """
+    SELECT
+        EXTRACT(YEAR FROM date_occ) as year_occ,
+        EXTRACT(MONTH FROM date_occ) as month_occ,
+        COUNT(*) as total_crimes,
+        COUNT(DISTINCT crm_cd) as crime_types
+    FROM crimes
+    GROUP BY EXTRACT(YEAR FROM date_occ), EXTRACT(MONTH FROM date_occ)
+    ORDER BY year_occ, month_occ
+    """,
+
+    # Agrégat par heure de la journée (time_occ au format HHMM)
+    'hourly_profile': """
+    SELECT
+        time_occ / 100 as hour_occ,
+        COUNT(*) as total_crimes,
+        AVG(CAST(vict_age AS FLOAT)) as avg_victim_age
+    FROM crimes
+    GROUP BY time_occ / 100
+    ORDER BY hour_occ
+    """,
+
+    # Fenêtrage : cumul et moyenne mobile sur trois mois par zone
+    'monthly_running_total': """
+    WITH monthly AS (
+        SELECT
+            area_name,
+            EXTRACT(YEAR FROM date_occ) as year_occ,
+            EXTRACT(MONTH FROM date_occ) as month_occ,
+            COUNT(*) as total_crimes
+        FROM crimes
+        GROUP BY area_name, EXTRACT(YEAR FROM date_occ), EXTRACT(MONTH FROM date_occ)
+    )
+    SELECT
+        area_name,
+        year_occ,
+        month_occ,
+        total_crimes,
+        SUM(total_crimes) OVER (
+            PARTITION BY area_name ORDER BY year_occ, month_occ
+            ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+        ) as running_crimes,
+        AVG(CAST(total_crimes AS FLOAT)) OVER (
+            PARTITION BY area_name ORDER BY year_occ, month_occ
+            ROWS BETWEEN 2 PRECEDING AND CURRENT ROW
+        ) as moving_avg
+    FROM monthly
+    """,
+
+    # Fenêtrage : variation du nombre de crimes d'un jour au suivant
+    'daily_delta': """
+    WITH daily AS (
+        SELECT date_occ, COUNT(*) as total_crimes
+        FROM crimes
+        GROUP BY date_occ
+    )
+    SELECT
+        date_occ,
+        total_crimes,
+        total_crimes - LAG(total_crimes) OVER (ORDER BY date_occ) as delta
+    FROM daily
+    """,
+
+    # Fenêtrage : les cinq types de crimes les plus fréquents de chaque zone
+    'top_types_per_area': """
+    WITH counts AS (
+        SELECT area_name, crm_cd_desc, COUNT(*) as total_crimes
+        FROM crimes
+        GROUP BY area_name, crm_cd_desc
+    )
+    SELECT area_name, crm_cd_desc, total_crimes, rank_in_area
+    FROM (
+        SELECT
+            area_name,
+            crm_cd_desc,
+            total_crimes,
+            RANK() OVER (PARTITION BY area_name ORDER BY total_crimes DESC) as rank_in_area
+        FROM counts
+    ) ranked
+    WHERE rank_in_area <= 5
+    """,
+
+    # Top-k après agrégation : les dix types de crimes les plus fréquents
+    'top_k_types': """
+    SELECT crm_cd_desc, COUNT(*) as total_crimes
+    FROM crimes
+    GROUP BY crm_cd_desc
+    ORDER BY total_crimes DESC, crm_cd_desc
+    LIMIT 10
+    """,
+
+    # Top-k sur lignes entières : tri partiel de toute la table
+    'top_k_rows': """
+    SELECT dr_no, date_occ, time_occ, area_name, crm_cd_desc, premis_desc, vict_age
+    FROM crimes
+    ORDER BY vict_age DESC, dr_no
+    LIMIT 100
+    """,
+
+    # Jointure en étoile sur trois dimensions dérivées de la table
+    'star_join': """
+    WITH areas AS (
+        SELECT area, MIN(area_name) as area_name
+        FROM crimes
+        GROUP BY area
+    ),
+    crime_types AS (
+        SELECT crm_cd, MIN(crm_cd_desc) as crm_cd_desc
+        FROM crimes
+        GROUP BY crm_cd
+    ),
+    premises AS (
+        SELECT premis_cd, MIN(premis_desc) as premis_desc
+        FROM crimes
+        WHERE premis_cd IS NOT NULL
+        GROUP BY premis_cd
+    )
+    SELECT
+        a.area_name,
+        t.crm_cd_desc,
+        p.premis_desc,
+        COUNT(*) as total_crimes
+    FROM crimes c
+    JOIN areas a ON c.area = a.area
+    JOIN crime_types t ON c.crm_cd = t.crm_cd
+    JOIN premises p ON c.premis_cd = p.premis_cd
+    GROUP BY a.area_name, t.crm_cd_desc, p.premis_desc
+    HAVING COUNT(*) > 100
+    """,
+
+    # Jointure sur une dimension agrégée et filtrée (armes fréquentes)
+    'weapon_dimension_join': """
+    WITH weapons AS (
+        SELECT weapon_used_cd, MIN(weapon_desc) as weapon_desc, COUNT(*) as uses
+        FROM crimes
+        WHERE weapon_used_cd IS NOT NULL
+        GROUP BY weapon_used_cd
+    )
+    SELECT
+        c.area_name,
+        w.weapon_desc,
+        COUNT(*) as total_crimes,
+        AVG(CAST(c.vict_age AS FLOAT)) as avg_victim_age
+    FROM crimes c
+    JOIN weapons w ON c.weapon_used_cd = w.weapon_used_cd
+    WHERE w.uses > 1000
+    GROUP BY c.area_name, w.weapon_desc
+    """,
+}
+
+# Registre des requêtes de la table crimes : suite de base (versions figée et
+# paramétrée) puis suite analytique
+CRIMES_SUITE = [
+    QueryDefinition('crimes.selection', 'selection', ('crimes',), CRIMES_QUERIES[0],
+                    CRIMES_TEMPLATES[0], expected={'max_rows': 1000}),
+    QueryDefinition('crimes.aggregation', 'aggregation', ('crimes',), CRIMES_QUERIES[1],
+                    CRIMES_TEMPLATES[1]),
+    QueryDefinition('crimes.join', 'join', ('crimes',), CRIMES_QUERIES[2],
+                    CRIMES_TEMPLATES[2]),
+    QueryDefinition('crimes.narrow_projection', 'projection', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['narrow_projection'], suite='analytical',
+                    expected={'min_rows': 1},
+                    description="Lignes d'une tranche horaire, 2 colonnes"),
+    QueryDefinition('crimes.wide_projection', 'projection', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['wide_projection'], suite='analytical',
+                    expected={'min_rows': 1},
+                    description="Mêmes lignes, toutes les colonnes"),
+    QueryDefinition('crimes.narrow_scan', 'aggregation', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['narrow_scan'], suite='analytical',
+                    expected={'rows': 1},
+                    description="Parcours complet de deux colonnes"),
+    QueryDefinition('crimes.wide_group_by', 'aggregation', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['wide_group_by'], suite='analytical',
+                    expected={'min_rows': 1},
+                    description="Regroupement à forte cardinalité"),
+    QueryDefinition('crimes.monthly_counts', 'time_bucket', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['monthly_counts'], suite='analytical',
+                    expected={'min_rows': 1},
+                    description="Crimes par mois de date_occ"),
+    QueryDefinition('crimes.hourly_profile', 'time_bucket', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['hourly_profile'], suite='analytical',
+                    expected={'min_rows': 1, 'max_rows': 24},
+                    description="Crimes par heure de time_occ"),
+    QueryDefinition('crimes.monthly_running_total', 'window', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['monthly_running_total'], suite='analytical',
+                    expected={'min_rows': 1},
+                    description="Cumul et moyenne mobile par zone"),
+    QueryDefinition('crimes.daily_delta', 'window', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['daily_delta'], suite='analytical',
+                    expected={'min_rows': 1},
+                    description="LAG sur les comptes journaliers"),
+    QueryDefinition('crimes.top_types_per_area', 'window', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['top_types_per_area'], suite='analytical',
+                    expected={'min_rows': 1},
+                    description="RANK par zone, cinq premiers"),
+    QueryDefinition('crimes.top_k_types', 'top_k', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['top_k_types'], suite='analytical',
+                    expected={'min_rows': 1, 'max_rows': 10},
+                    description="Dix types les plus fréquents"),
+    QueryDefinition('crimes.top_k_rows', 'top_k', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['top_k_rows'], suite='analytical',
+                    expected={'rows': 100},
+                    description="Tri partiel de lignes entières"),
+    QueryDefinition('crimes.star_join', 'join', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['star_join'], suite='analytical',
+                    expected={'min_rows': 1},
+                    description="Jointure sur trois dimensions dérivées"),
+    QueryDefinition('crimes.weapon_dimension_join', 'join', ('crimes',),
+                    CRIMES_ANALYTICAL_QUERIES['weapon_dimension_join'], suite='analytical',
+                    expected={'min_rows': 1},
+                    description="Jointure sur une dimension agrégée et filtrée"),
+]
+
 """
 Description détaillée des requêtes:
 
@@ -63,6 +377,12 @@ Description détaillée des requêtes:
      * Nombre total d'incidents par type
      * Nombre de zones affectées
 
+4. Suite analytique (CRIMES_ANALYTICAL_QUERIES)
+   - Objectif: Comparer stockage en colonnes et stockage en lignes
+   - Projections étroite et large sur les mêmes lignes
+   - Fenêtrage (cumul, moyenne mobile, LAG, RANK), top-k, agrégats par mois
+     et par heure, jointures sur des dimensions dérivées de la table
+
 Notes d'utilisation:
 -------------------
 - Les requêtes sont optimisées pour PostgreSQL et MonetDB
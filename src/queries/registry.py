@@ -0,0 +1,9 @@
+"""
+Registre commun des requêtes de toutes les tables analysées.
+"""
+
+from src.database.query_registry import QueryRegistry
+from src.queries.air_quality_queries import AIR_QUALITY_SUITE
+from src.queries.crimes_queries import CRIMES_SUITE
+
+QUERY_REGISTRY = QueryRegistry(AIR_QUALITY_SUITE + CRIMES_SUITE)
@@ -6,6 +6,10 @@ détaillés des performances entre PostgreSQL et MonetDB. Il génère deux types
 de visualisations :
 1. Temps de chargement moyen par ligne
 2. Temps d'exécution moyen par type de requête
+3. Décomposition du temps de chargement par phase
+4. Débit et latence p95 selon le nombre de clients concurrents
+5. Latence des requêtes et débit obtenu selon le débit d'ingestion (charge mixte)
+6. Courbes de passage à l'échelle (temps selon le nombre de lignes)
 
 Les graphiques utilisent une palette de couleurs cohérente :
 - PostgreSQL : #336699 (bleu)
@@ -26,24 +30,156 @@ import logging
 # Configuration du logger
 logger = logging.getLogger(__name__)
 
+# Couleurs des phases de chargement (voir LoadPhases)
+PHASE_COLORS = {
+    'parse': '#8C8C8C',
+    'clean': '#B3B3B3',
+    'convert': '#E6A23C',
+    'ddl': '#6C5B7B',
+    'insert': '#2A9D8F',
+    'commit': '#264653',
+    'statistics': '#E76F51',
+    'indexes': '#F4A261'
+}
+
+def _plot_load_phases(ax, config):
+    """
+    Trace la décomposition par phase de la lecture commune et de chaque chargement.
+
+    Une barre horizontale empilée est tracée pour la lecture du CSV
+    ('parse_phases'), pour chaque SGBD et mode de chargement ('load_phases')
+    puis pour la conception physique de chaque SGBD ('physical_design').
+
+    Args:
+        ax: Axe matplotlib
+        config (dict): Configuration contenant 'parse_phases', 'load_phases'
+            et 'physical_design'
+    """
+    bars = []
+    if config.get('parse_phases'):
+        bars.append(('Lecture CSV', config['parse_phases']))
+    for engine, name in (('pg', 'PostgreSQL'), ('monet', 'MonetDB')):
+        for mode, phases in config.get('load_phases', {}).get(engine, {}).items():
+            bars.append((f"{name} ({mode})", phases))
+    for engine, name in (('pg', 'PostgreSQL'), ('monet', 'MonetDB')):
+        design = config.get('physical_design', {}).get(engine)
+        if design:
+            bars.append((f"{name} (conception)", {
+                'statistics': {'time': design['analyze_time']},
+                'indexes': {'time': sum(index['build_time'] for index in design['indexes'])}
+            }))
+
+    ax.set_title('Décomposition du Temps de Chargement par Phase')
+    if not bars:
+        ax.text(0.5, 0.5, 'Mesures par phase non disponibles',
+                horizontalalignment='center', verticalalignment='center')
+        return
+
+    labels = [label for label, _ in bars]
+    left = [0.0] * len(bars)
+    for phase, color in PHASE_COLORS.items():
+        widths = [phases.get(phase, {}).get('time', 0.0) for _, phases in bars]
+        if any(widths):
+            ax.barh(labels, widths, left=left, color=color, label=phase)
+            left = [l + w for l, w in zip(left, widths)]
+    ax.invert_yaxis()
+    ax.set_xlabel('Temps (s)')
+    ax.legend(loc='lower right')
+
+def _plot_concurrency(ax, config):
+    """
+    Trace le débit (trait plein) et la latence p95 (pointillés, axe de droite)
+    de chaque SGBD selon le nombre de clients concurrents.
+
+    Args:
+        ax: Axe matplotlib
+        config (dict): Configuration contenant 'concurrency'
+    """
+    ax.set_title('Débit selon le Nombre de Clients Concurrents')
+    concurrency = config.get('concurrency')
+    if not concurrency:
+        ax.text(0.5, 0.5, 'Mesure de débit concurrent non disponible',
+                horizontalalignment='center', verticalalignment='center')
+        return
+
+    latency_ax = ax.twinx()
+    for engine, name, color in (('pg', 'PostgreSQL', '#336699'),
+                                ('monet', 'MonetDB', '#CC3366')):
+        results = concurrency.get(engine, {})
+        clients = sorted(results)
+        ax.plot(clients, [results[count]['qps'] for count in clients],
+                marker='o', color=color, label=f"{name} (débit)")
+        latency_ax.plot(clients, [results[count]['latency']['p95'] for count in clients],
+                        marker='x', linestyle='--', color=color, label=f"{name} (p95)")
+    ax.set_xlabel('Clients concurrents')
+    ax.set_ylabel('Débit (requêtes/s)')
+    latency_ax.set_ylabel('Latence p95 (ms)')
+    lines, labels = ax.get_legend_handles_labels()
+    latency_lines, latency_labels = latency_ax.get_legend_handles_labels()
+    ax.legend(lines + latency_lines, labels + latency_labels, loc='upper left')
+
+def _plot_mixed_workload(ax, config):
+    """
+    Trace la dégradation de la latence p95 des requêtes (trait plein) et le
+    débit d'ingestion obtenu (pointillés, axe de droite) de chaque SGBD selon
+    le débit d'ingestion visé.
+
+    Args:
+        ax: Axe matplotlib
+        config (dict): Configuration contenant 'mixed_workload'
+    """
+    ax.set_title('Charge Mixte : Requêtes pendant les Ajouts')
+    mixed = config.get('mixed_workload')
+    if not mixed:
+        ax.text(0.5, 0.5, 'Mesure de charge mixte non disponible',
+                horizontalalignment='center', verticalalignment='center')
+        return
+
+    ingest_ax = ax.twinx()
+    for engine, name, color in (('pg', 'PostgreSQL', '#336699'),
+                                ('monet', 'MonetDB', '#CC3366')):
+        results = mixed.get(engine, {}).get('rates', {})
+        rates = sorted(results)
+        ax.plot(rates, [results[rate]['degradation'] or 0.0 for rate in rates],
+                marker='o', color=color, label=f"{name} (p95 / sans écriture)")
+        ingest_ax.plot(rates, [results[rate]['achieved_rate'] for rate in rates],
+                       marker='x', linestyle='--', color=color, label=f"{name} (ingestion)")
+    ax.axhline(1.0, color='#8C8C8C', linewidth=0.8)
+    ax.set_xlabel("Débit d'ingestion visé (lignes/s)")
+    ax.set_ylabel('Dégradation de la latence p95')
+    ingest_ax.set_ylabel("Débit d'ingestion obtenu (lignes/s)")
+    lines, labels = ax.get_legend_handles_labels()
+    ingest_lines, ingest_labels = ingest_ax.get_legend_handles_labels()
+    ax.legend(lines + ingest_lines, labels + ingest_labels, loc='upper left')
+
 def create_performance_graph(results_analyzer, config):
     """
     Crée un graphique comparatif des performances entre PostgreSQL et MonetDB.
     
-    Cette fonction génère une figure avec deux sous-graphiques :
+    Cette fonction génère une figure avec cinq sous-graphiques :
     1. Temps de chargement moyen par ligne (ms/ligne)
     2. Temps d'exécution moyen par type de requête (ms)
+    3. Décomposition du temps de chargement par phase (s)
+    4. Débit et latence p95 selon le nombre de clients concurrents
+    5. Dégradation des requêtes et ingestion obtenue sous charge mixte
     
     Args:
         results_analyzer (list): Liste des résultats d'analyse contenant :
             - query_id: Identifiant de la requête
             - pg_execution_time: Métriques PostgreSQL
             - monet_execution_time: Métriques MonetDB
+            - category_label / template: Type de requête affiché (optionnel)
             
         config (dict): Configuration du graphique contenant :
             - title: Titre du graphique
             - output_file: Nom du fichier de sortie
             - loading_times: Temps de chargement {pg_load_time, monet_load_time}
+            - loading_times_by_mode: Temps de chargement par SGBD et par mode (optionnel)
+            - parse_phases: Phases de la lecture commune du CSV (optionnel)
+            - load_phases: Phases de chaque chargement par SGBD et par mode (optionnel)
+            - physical_design: Conception physique par SGBD (optionnel)
+            - concurrency: Débit concurrent par SGBD et nombre de clients (optionnel)
+            - mixed_workload: Charge mixte par SGBD et débit d'ingestion (optionnel)
             - total_rows: Nombre total de lignes
     
     Returns:
@@ -58,18 +194,29 @@ def create_performance_graph(results_analyzer, config):
         logger.warning("Aucun résultat d'analyse à visualiser")
         return
         
-    # Créer une figure avec deux sous-graphiques
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    # Créer une figure avec cinq sous-graphiques
+    fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(5, 1, figsize=(12, 25))
     
     # Premier graphique : Temps de chargement par ligne (en ms/ligne)
     if ('loading_times' in config and 'total_rows' in config 
         and config['total_rows'] > 0):
-        loading_per_row = [
-            (config['loading_times']['pg_load_time']) / config['total_rows'],  # ms/ligne
-            (config['loading_times']['monet_load_time']) / config['total_rows']
-        ]
-        ax1.bar(['PostgreSQL', 'MonetDB'], loading_per_row, 
-                color=['#336699', '#CC3366'])
+        labels = []
+        loading_per_row = []
+        colors = []
+        by_mode = config.get('loading_times_by_mode', {})
+        for engine, key, name, color in (('pg', 'pg_load_time', 'PostgreSQL', '#336699'),
+                                         ('monet', 'monet_load_time', 'MonetDB', '#CC3366')):
+            modes = by_mode.get(engine)
+            if modes:
+                for mode, load_time in modes.items():
+                    labels.append(f"{name}\n({mode})")
+                    loading_per_row.append(load_time / config['total_rows'])  # ms/ligne
+                    colors.append(color)
+            else:
+                labels.append(name)
+                loading_per_row.append(config['loading_times'][key] / config['total_rows'])
+                colors.append(color)
+        ax1.bar(labels, loading_per_row, color=colors)
         ax1.set_title('Temps de Chargement Moyen par Ligne')
         ax1.set_ylabel('Temps (ms/ligne)')
     else:
@@ -80,12 +227,17 @@ def create_performance_graph(results_analyzer, config):
 
     # Deuxième graphique : Temps d'exécution moyen des requêtes
     query_ids = []
+    query_types = []
     pg_times = []
     monet_times = []
     
     for result in results_analyzer:
         if isinstance(result, dict) and 'query_id' in result:
-            query_ids.append(f"Q{result['query_id']}")
+            # Résultats différents entre SGBD : temps non comparables
+            mismatch = ' ≠' if result.get('results_match') is False else ''
+            query_ids.append(f"Q{result['query_id']}{mismatch}")
+            # Catégorie de la requête enregistrée, sinon nom du modèle
+            query_types.append(result.get('category_label') or result.get('template') or '')
             pg_times.append(result['pg_execution_time']['mean'])
             monet_times.append(result['monet_execution_time']['mean'])
 
@@ -97,22 +249,102 @@ def create_performance_graph(results_analyzer, config):
     ax2.bar([i + width/2 for i in x], monet_times, width, 
             label='MonetDB', color='#CC3366')
     
-    # Définition des types de requêtes
-    query_types = ['Sélection', 'Agrégation', 'Jointure']
-    
     # Modification de l'affichage des étiquettes
-    query_labels = [f"Q{i+1}\n({query_types[i]})" for i in range(len(query_ids))]
+    query_labels = [f"{query_id}\n({query_type})" if query_type else query_id
+                    for query_id, query_type in zip(query_ids, query_types)]
+    ax2.set_xticks(x)
     ax2.set_xticklabels(query_labels, rotation=45)
     
     ax2.set_xlabel('Type de Requête')
     ax2.set_ylabel('Temps d\'exécution moyen (ms)')
     ax2.set_title(f'Temps d\'Exécution Moyen des Requêtes - {config["title"]}')
-    ax2.set_xticks(x)
     ax2.legend()
 
+    # Troisième graphique : Décomposition du chargement par phase
+    _plot_load_phases(ax3, config)
+
+    # Quatrième graphique : Débit selon le nombre de clients
+    _plot_concurrency(ax4, config)
+
+    # Cinquième graphique : Charge mixte (ajouts et requêtes simultanés)
+    _plot_mixed_workload(ax5, config)
+
     plt.tight_layout()
     output_path = f'results/{config["output_file"]}'
     plt.savefig(output_path, dpi=300, bbox_inches='tight')
     plt.close()
     
-    logger.info(f"Graphique sauvegardé : {output_path}")
\ No newline at end of file
+    logger.info(f"Graphique sauvegardé : {output_path}")
+
+def create_scaling_graph(scaling, config):
+    """
+    Trace les courbes de passage à l'échelle d'une table en échelle log-log.
+
+    Le premier graphique montre la médiane de chaque requête, le second le
+    temps de chargement, selon le nombre de lignes : points mesurés en trait
+    plein, loi ajustée en pointillés. Les requêtes super-linéaires sont
+    marquées d'un ⚠️ dans la légende.
+
+    Args:
+        scaling (dict): Résultats de ScalingBenchmark.run ('points', 'load', 'queries')
+        config (dict): Configuration du graphique contenant :
+            - title: Titre du graphique
+            - output_file: Nom du fichier de sortie
+
+    Returns:
+        None: Le graphique est sauvegardé dans le dossier 'results/'
+    """
+    points = scaling.get('points')
+    if not points:
+        logger.warning("Aucune mesure de passage à l'échelle à visualiser")
+        return
+
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 12))
+    rows = [point['rows'] for point in points]
+    fitted_rows = [min(rows), max(rows)]
+    engines = (('pg', 'PostgreSQL', '#336699'), ('monet', 'MonetDB', '#CC3366'))
+    markers = ('o', 's', '^', 'D', 'v', 'P')
+
+    for position, (query_id, curve) in enumerate(scaling['queries'].items()):
+        marker = markers[position % len(markers)]
+        for engine, name, color in engines:
+            measured = [(point['rows'], point['queries'][query_id][engine])
+                        for point in points if query_id in point['queries']]
+            flag = ' ⚠️' if engine in curve['superlinear'] else ''
+            ax1.plot([n for n, _ in measured], [value for _, value in measured],
+                     marker=marker, color=color,
+                     label=f"Q{query_id} {curve['label']} - {name}{flag}")
+            fit = curve[engine]
+            if fit:
+                ax1.plot(fitted_rows, [fit['coefficient'] * n ** fit['exponent']
+                                       for n in fitted_rows],
+                         linestyle=':', color=color)
+    ax1.set_xscale('log')
+    ax1.set_yscale('log')
+    ax1.set_xlabel('Lignes')
+    ax1.set_ylabel("Temps d'exécution médian (ms)")
+    ax1.set_title(f"Passage à l'Échelle des Requêtes - {config['title']}")
+    ax1.legend(fontsize='small')
+
+    for engine, name, color in engines:
+        ax2.plot(rows, [point[f'{engine}_load_time'] for point in points],
+                 marker='o', color=color, label=name)
+        fit = scaling['load'][engine]
+        if fit:
+            ax2.plot(fitted_rows, [fit['coefficient'] * n ** fit['exponent']
+                                   for n in fitted_rows],
+                     linestyle=':', color=color,
+                     label=f"{name} (~ lignes^{fit['exponent']:.2f})")
+    ax2.set_xscale('log')
+    ax2.set_yscale('log')
+    ax2.set_xlabel('Lignes')
+    ax2.set_ylabel('Temps de chargement (s)')
+    ax2.set_title("Passage à l'Échelle du Chargement")
+    ax2.legend()
+
+    plt.tight_layout()
+    output_path = f'results/{config["output_file"]}'
+    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+    logger.info(f"Graphique sauvegardé : {output_path}")
@@ -0,0 +1,59 @@
+import pandas as pd
+
+from src.database.dataset_cache import DatasetCache
+
+
+class _Loader:
+    """Chargeur minimal renvoyant des morceaux déjà nettoyés."""
+
+    CHUNK_SIZE = 2
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def read_csv_chunks(self, chemin_csv, separateur=',', chunksize=None, phases=None):
+        return [chunk.copy() for chunk in self.chunks]
+
+
+def test_round_trip_keeps_schema_and_values(tmp_path):
+    # Régression : une colonne vide dans le premier morceau puis numérique
+    # dans les suivants faisait échouer l'écriture Parquet (ArrowTypeError)
+    csv_path = tmp_path / 'data.csv'
+    csv_path.write_text('unused\n')
+    loader = _Loader([
+        pd.DataFrame({'id': [1, 2], 'code': pd.Series([None, None], dtype=object),
+                      'day': ['01/02/2020', '01/03/2020']}),
+        pd.DataFrame({'id': [3, 4], 'code': pd.Series([1.5, 'x'], dtype=object),
+                      'day': ['01/04/2020', None]}),
+    ])
+    cache = DatasetCache(str(tmp_path / 'cache'))
+    built = cache.load(str(csv_path), loader)
+    cached = cache.load(str(csv_path), loader)
+
+    assert not built.from_cache and cached.from_cache
+    assert repr(cached.schema.columns) == repr(built.schema.columns)
+    for expected, actual in zip(built.chunks, cached.chunks):
+        assert _values(expected) == _values(actual)
+
+
+def _values(chunk: pd.DataFrame) -> list:
+    return [[None if pd.isna(value) else value for value in row]
+            for row in chunk.astype(object).itertuples(index=False)]
+
+
+def test_same_name_in_different_directories(tmp_path):
+    # Régression : les entrées n'étaient nommées que par le nom du fichier,
+    # et deux CSV homonymes évinçaient l'entrée l'un de l'autre
+    cache = DatasetCache(str(tmp_path / 'cache'))
+    paths = []
+    for folder, value in (('a', 1), ('b', 2)):
+        (tmp_path / folder).mkdir()
+        csv_path = tmp_path / folder / 'crimes.csv'
+        csv_path.write_text(f'{folder}\n')
+        paths.append(str(csv_path))
+        cache.load(str(csv_path), _Loader([pd.DataFrame({'id': [value]})]))
+
+    for path, value in zip(paths, (1, 2)):
+        dataset = cache.load(path, _Loader([]))
+        assert dataset.from_cache
+        assert dataset.chunks[0]['id'].tolist() == [value]
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+from src.database.load_phases import LoadPhases
+
+
+def test_add_and_to_dict():
+    phases = LoadPhases()
+    phases.add('insert', 2_000_000_000, rows=1000, nbytes=4000)
+    phases.add('insert', 0, rows=1000, nbytes=4000)
+    insert = phases.to_dict()['insert']
+    assert insert['time'] == pytest.approx(2.0)
+    assert insert['rows'] == 2000
+    assert insert['rows_per_second'] == pytest.approx(1000.0)
+    assert insert['bytes_per_second'] == pytest.approx(4000.0)
+    assert phases.to_dict()['parse']['rows_per_second'] == 0.0
+    assert list(phases.to_dict()) == list(LoadPhases.PHASES)
+
+
+def test_span_records_time_even_on_error():
+    phases = LoadPhases()
+    with pytest.raises(RuntimeError):
+        with phases.span('commit', rows=5):
+            raise RuntimeError
+    assert phases.raw()['commit'][1] == 5
+    assert phases.raw()['commit'][0] > 0
+
+
+def test_merge():
+    first, second = LoadPhases(), LoadPhases()
+    first.add('convert', 10, 1, 2)
+    second.add('convert', 5, 3, 4)
+    first.merge(second.raw())
+    assert first.raw()['convert'] == [15, 4, 6]
+
+
+def test_nbytes():
+    df = pd.DataFrame({'a': [1, 2, 3]}, dtype='int64')
+    assert LoadPhases.nbytes(df) == 24
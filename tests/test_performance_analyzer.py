@@ -0,0 +1,44 @@
+from src.base_classes import QueryAnalyzer
+from src.database.engine_scheduler import measure_queries
+from src.database.performance_analyzer import _interleaved_iterations
+from src.database.timing_stats import TimingStats
+
+
+class FailingAnalyzer:
+    """Analyseur factice dont les ``failures`` premières exécutions échouent."""
+
+    prepare_times = {}
+    statement_template = staticmethod(QueryAnalyzer.statement_template)
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def analyze_query(self, query):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError('connexion perdue')
+        return {'execution_time': 1.0}
+
+    def format_metrics(self, metrics):
+        return dict(metrics)
+
+
+def test_warmup_failures_counted():
+    pg, monet = FailingAnalyzer(2), FailingAnalyzer(0)
+    bindings = [{'sql': 'SELECT 1', 'selectivity': None}]
+    pg_times, monet_times, _, _, _, _, errors = _interleaved_iterations(
+        pg, monet, bindings, TimingStats(), 3, 2, 'warm', False, False, 3, 0.05, None)
+    assert errors == {'pg': 2, 'monet': 0}
+    assert len(pg_times) == len(monet_times) == 3
+
+
+def test_scheduled_warmup_failures_counted():
+    plan = {'iterations': 3, 'warmup_iterations': 2, 'cache_mode': 'warm',
+            'drop_os_cache': False, 'adaptive': False, 'min_iterations': 3,
+            'target_ci_width': 0.05, 'time_budget': None, 'confidence': 0.95,
+            'bootstrap_resamples': 100}
+    bindings = [{'sql': 'SELECT 1', 'selectivity': None}]
+    first, second = measure_queries(FailingAnalyzer(3), [bindings, bindings], plan)
+    assert first['errors'] == 3 and len(first['times']) == 2
+    assert second['errors'] == 0 and len(second['times']) == 3
@@ -0,0 +1,164 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.database.engine_scheduler import prepare_time
+from src.database.monetdb_analyzer import MonetDBAnalyzer
+from src.database.postgres_analyzer import PostgresAnalyzer
+from src.database.query_template import (BoundQuery, QueryParameter, QueryTemplate,
+                                         bucket_summary)
+
+
+def _fetch(values_counts):
+    def fetch(sql):
+        if 'GROUP BY' in sql:
+            return list(values_counts)
+        return [(sum(count for _, count in values_counts),)]
+    return fetch
+
+
+def _template(kind, values_counts, type='int', sql="SELECT * FROM t WHERE c > {x}"):
+    template = QueryTemplate('Sélection', sql, 't',
+                             [QueryParameter('x', 'c', kind, type)])
+    template.fit(_fetch(values_counts))
+    return template
+
+
+def test_bindings_reproducible():
+    template = _template('value', [(1, 10), (2, 30), (3, 60)])
+    assert template.bindings(20, seed=7) == template.bindings(20, seed=7)
+    assert template.bindings(20, seed=7) != template.bindings(20, seed=8)
+
+
+def test_bindings_require_fit():
+    template = QueryTemplate('Sélection', "SELECT {x}", 't', [QueryParameter('x', 'c')])
+    with pytest.raises(RuntimeError):
+        template.bindings(1)
+
+
+def test_value_selectivity():
+    template = _template('value', [(1, 25), (2, 75)])
+    for binding in template.bindings(20, seed=0):
+        expected = {1: 0.25, 2: 0.75}[binding['params']['x']]
+        assert binding['selectivity'] == pytest.approx(expected)
+        assert binding['sql'] == f"SELECT * FROM t WHERE c > {binding['params']['x']}"
+
+
+@pytest.mark.parametrize('kind, excluded', [('lower', 3), ('upper', 1)])
+def test_bounds_never_select_empty_tail(kind, excluded):
+    # Régression : la plus grande valeur (borne inférieure) ou la plus petite
+    # (borne supérieure) sélectionnait zéro ligne
+    template = _template(kind, [(1, 1), (2, 1), (3, 1000)])
+    bindings = template.bindings(200, seed=0)
+    assert all(binding['params']['x'] != excluded for binding in bindings)
+    assert all(binding['selectivity'] > 0 for binding in bindings)
+
+
+def test_bounds_single_value():
+    template = _template('lower', [(5, 10)])
+    assert template.bindings(1)[0]['params']['x'] == 5
+
+
+def test_range_selectivity_within_table():
+    template = _template('range', [(value, 10) for value in range(100)],
+                         sql="SELECT * FROM t WHERE c BETWEEN {x_low} AND {x_high}")
+    for binding in template.bindings(50, seed=3):
+        params = binding['params']
+        assert params['x_low'] <= params['x_high']
+        assert 0 < binding['selectivity'] <= 1
+
+
+def test_text_literal_escaped():
+    parameter = QueryParameter('x', 'c', 'value', 'text')
+    assert parameter.literal("O'Brien") == "'O''Brien'"
+
+
+def test_bound_query_placeholders():
+    query = BoundQuery("SELECT * FROM t WHERE a = {x} OR b BETWEEN {x} AND {y} -- {{x}}",
+                       {'x': "'o''k'", 'y': '3'}, {'x': 'text', 'y': 'int'})
+    assert query == "SELECT * FROM t WHERE a = 'o''k' OR b BETWEEN 'o''k' AND 3 -- {x}"
+    assert query.placeholders(numbered=True) == (
+        "SELECT * FROM t WHERE a = $1 OR b BETWEEN $1 AND $2 -- {x}",
+        ["'o''k'", '3'], ['text', 'bigint'])
+    assert query.placeholders(numbered=False) == (
+        "SELECT * FROM t WHERE a = ? OR b BETWEEN ? AND ? -- {x}",
+        ["'o''k'", "'o''k'", '3'], ['text', 'text', 'bigint'])
+
+
+def test_bound_query_pickled():
+    binding = _template('range', [(1, 10), (2, 30), (3, 60)],
+                        sql="SELECT * FROM t WHERE c BETWEEN {x_low} AND {x_high}").bindings(1)[0]
+    query = pickle.loads(pickle.dumps(binding['sql']))
+    assert isinstance(query, BoundQuery) and query == binding['sql']
+    assert query.placeholders() == binding['sql'].placeholders()
+    assert query.placeholders()[0] == "SELECT * FROM t WHERE c BETWEEN $1 AND $2"
+
+
+class _Connection:
+    """Connexion factice qui enregistre les instructions reçues."""
+
+    def __init__(self):
+        self.info = {}
+        self.statements = []
+
+    def exec_driver_sql(self, sql):
+        self.statements.append(sql)
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql):
+        self.statements.append(sql)
+
+    def fetchall(self):
+        return []
+
+    def fetchone(self):
+        return (7,)
+
+    def commit(self):
+        pass
+
+
+def test_postgres_prepares_template_once():
+    analyzer = PostgresAnalyzer(None, prepared=True)
+    conn = _Connection()
+    bindings = _template('value', [(1, 10), (2, 30), (3, 60)]).bindings(10)
+    executed = [analyzer._prepare(conn, binding['sql'])[1] for binding in bindings]
+    name = analyzer.statement_name("SELECT * FROM t WHERE c > $1")
+    assert conn.statements == [f"PREPARE {name} (bigint) AS SELECT * FROM t WHERE c > $1"]
+    assert executed == [f"EXECUTE {name}({binding['params']['x']})" for binding in bindings]
+    assert list(analyzer.prepare_times) == ["SELECT * FROM t WHERE c > {x}"]
+    assert prepare_time(analyzer, bindings) == analyzer.prepare_times[bindings[0]['sql'].template]
+
+
+def test_monetdb_prepares_template_once():
+    analyzer = MonetDBAnalyzer(None, prepared=True)
+    conn = _Connection()
+    bindings = _template('value', [(1, 10), (2, 30), (3, 60)]).bindings(10)
+    executed = [analyzer._prepare(conn, conn, binding['sql']) for binding in bindings]
+    assert conn.statements[0] == "PREPARE SELECT * FROM t WHERE c > ?"
+    assert len(conn.statements) == 2
+    assert executed == [f"EXEC 7({binding['params']['x']})" for binding in bindings]
+    assert analyzer._prepare(conn, conn, "SELECT 1") == "EXEC 7()"
+
+
+def test_selectivity_buckets():
+    assert QueryTemplate.bucket(None) is None
+    assert QueryTemplate.bucket(0.0005) == '0-0.1%'
+    assert QueryTemplate.bucket(0.001) == '0.1-1%'
+    assert QueryTemplate.bucket(0.05) == '1-10%'
+    assert QueryTemplate.bucket(0.5) == '10-100%'
+
+
+def test_bucket_summary():
+    samples = [{'selectivity': 0.5, 'execution_time': 4.0},
+               {'selectivity': 0.0001, 'execution_time': 1.0},
+               {'selectivity': 0.0002, 'execution_time': 3.0},
+               {'selectivity': None, 'execution_time': 9.0}]
+    summary = bucket_summary(samples)
+    assert list(summary) == ['0-0.1%', '10-100%']
+    assert summary['0-0.1%']['count'] == 2
+    assert summary['0-0.1%']['median'] == pytest.approx(2.0)
+    assert np.isclose(summary['10-100%']['mean'], 4.0)
@@ -0,0 +1,48 @@
+import datetime
+import decimal
+
+from src.database.result_fingerprint import ResultFingerprint
+
+
+def _digest(rows) -> str:
+    fingerprint = ResultFingerprint()
+    fingerprint.update(rows)
+    return fingerprint.hexdigest()
+
+
+def test_order_insensitive():
+    rows = [(1, 'a'), (2, 'b'), (3, 'c')]
+    assert _digest(rows) == _digest(list(reversed(rows)))
+
+
+def test_duplicates_counted():
+    assert _digest([(1, 'a')]) != _digest([(1, 'a'), (1, 'a')])
+    assert _digest([(1, 'a'), (1, 'a')]).startswith('2:')
+
+
+def test_numeric_normalization():
+    assert (_digest([(1, 2.5)])
+            == _digest([(1.0, decimal.Decimal('2.500'))])
+            == _digest([(decimal.Decimal(1), 2.5000000001)]))
+    assert _digest([(True,)]) == _digest([(1,)])
+    assert _digest([(1,)]) != _digest([(2,)])
+
+
+def test_text_and_temporal_normalization():
+    assert _digest([('abc  ',)]) == _digest([('abc',)])
+    assert _digest([(datetime.date(2020, 1, 2),)]) == _digest([('2020-01-02',)])
+    assert _digest([(None,)]) != _digest([('',)])
+
+
+def test_combine_matches_single_update():
+    first, second = ResultFingerprint(), ResultFingerprint()
+    first.update([(1,), (2,)])
+    second.update([(3,)])
+    assert first.combine(second).hexdigest() == _digest([(3,), (1,), (2,)])
+
+
+def test_majority():
+    assert ResultFingerprint.majority(['a', 'b', 'b', None, None, None]) == 'b'
+    assert ResultFingerprint.majority(['a', 'b']) == 'a'
+    assert ResultFingerprint.majority([None, None]) is None
+    assert ResultFingerprint.majority([]) is None
@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from src.database.csv_dataset import CsvDataset
+from src.database.synthetic_dataset import ColumnModel, SyntheticDataset
+from src.database.table_schema import ColumnSchema
+
+
+def _dataset(**columns) -> CsvDataset:
+    return CsvDataset('data.csv', [pd.DataFrame(columns)], 0.0)
+
+
+def test_unique_columns_widened():
+    # Régression : les identifiants décalés à chaque réplique dépassaient le
+    # type déduit sur le jeu d'origine
+    source = _dataset(id=[0, 20_000, 30_000], code=['ab1', 'ab2', 'ab3'],
+                      value=[1.5, 2.5, 1.5])
+    synthetic = SyntheticDataset(source, scale_factor=10, seed=0)
+    columns = {column.name: column for column in synthetic.schema.columns}
+    assert source.schema.columns[0].kind == 'smallint'
+    assert columns['id'].kind == 'integer'
+    assert columns['code'].kind == 'varchar'
+    assert columns['code'].length == len('ab1-9')
+    assert columns['value'].kind == 'double'
+
+    generated = pd.concat(synthetic.iter_chunks(), ignore_index=True)
+    assert generated['id'].is_unique and generated['code'].is_unique
+    assert generated['id'].max() < 2 ** 31
+    assert generated['code'].str.len().max() <= columns['code'].length
+
+
+def test_unique_integers_beyond_bigint():
+    model = ColumnModel(ColumnSchema('id', 'bigint'),
+                        pd.Series([0, 2 ** 62], dtype='int64'))
+    with pytest.raises(ValueError):
+        model.widened(10)
@@ -0,0 +1,109 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.database.postgres_loader import PostgresLoader
+from src.database.table_schema import TableSchema
+
+
+def _kinds(schema: TableSchema) -> dict:
+    return {column.name: column.kind for column in schema.columns}
+
+
+def test_exact_inference():
+    chunks = [
+        pd.DataFrame({'small': [1, 2], 'big': [1, 3_000_000_000], 'flag': [True, False],
+                      'ratio': [0.5, 1.0], 'whole': [1.0, np.nan],
+                      'day': ['01/02/2020', '01/03/2020'],
+                      'moment': ['2020-01-02 10:00:00', '2020-01-02 11:30:00'],
+                      'name': ['ab', 'abcd']}),
+        pd.DataFrame({'small': [-3, 4], 'big': [5, 6], 'flag': [True, True],
+                      'ratio': [2.0, 3.0], 'whole': [40000.0, 3.0],
+                      'day': ['12/31/2021', None],
+                      'moment': ['2021-05-06 00:00:00', '2021-05-06 12:00:00'],
+                      'name': ['abcdef', None]}),
+    ]
+    schema = TableSchema.infer(chunks)
+    assert schema.exact
+    assert _kinds(schema) == {'small': 'smallint', 'big': 'bigint', 'flag': 'boolean',
+                              'ratio': 'double', 'whole': 'integer', 'day': 'date',
+                              'moment': 'timestamp', 'name': 'varchar'}
+    assert schema.columns[-1].length == 6
+    assert str(chunks[1]['whole'].dtype) == 'Int64'
+    assert chunks[0]['day'][0] == datetime.date(2020, 1, 2)
+    assert pd.api.types.is_datetime64_any_dtype(chunks[1]['moment'])
+
+
+def test_sample_inference_is_widest():
+    chunk = pd.DataFrame({'i': [1, 2], 'f': [1.0, 2.0], 's': ['a', 'b']})
+    schema = TableSchema.infer([chunk], exact=False)
+    assert not schema.exact
+    assert _kinds(schema) == {'i': 'bigint', 'f': 'double', 's': 'text'}
+
+
+def test_empty_first_chunk_cast_to_text():
+    # Régression : une colonne vide dans le premier morceau (dtype object)
+    # gardait des flottants dans les suivants et cassait l'écriture Parquet
+    chunks = [pd.DataFrame({'code': pd.Series([None, None], dtype=object)}),
+              pd.DataFrame({'code': pd.Series([12.5, None, 'x7'], dtype=object)})]
+    schema = TableSchema.infer(chunks)
+    assert schema.columns[0].kind == 'varchar'
+    assert schema.columns[0].length == 4
+    values = chunks[1]['code']
+    assert values[values.notna()].tolist() == ['12.5', 'x7']
+    assert values.isna().tolist() == [False, True, False]
+
+
+def test_empty_column_is_text():
+    chunks = [pd.DataFrame({'empty': pd.Series([None, None], dtype=object)})]
+    assert TableSchema.infer(chunks).columns[0].kind == 'text'
+
+
+def test_integer_kind():
+    assert TableSchema.integer_kind(-2 ** 15, 2 ** 15 - 1) == 'smallint'
+    assert TableSchema.integer_kind(0, 2 ** 15) == 'integer'
+    assert TableSchema.integer_kind(-2 ** 31 - 1, 0) == 'bigint'
+    assert TableSchema.integer_kind(0, 2 ** 63) is None
+
+
+def test_categorical_columns():
+    chunks = [pd.DataFrame({'area': ['North', 'South'] * 50,
+                            'code': [f'c{i}' for i in range(100)]})]
+    columns = {column.name: column for column in TableSchema.infer(chunks).columns}
+    assert columns['area'].categorical and columns['area'].distinct == 2
+    assert columns['area'].kind == 'varchar' and columns['area'].length == 5
+    assert not columns['code'].categorical
+
+
+def test_date_formats():
+    chunk = pd.DataFrame({'day': ['01/02/2020', None], 'label': ['a', 'b'],
+                          'mixed': ['01/02/2020', 'soon'], 'count': [1, 2]})
+    assert TableSchema.date_formats(chunk) == {'day': '%m/%d/%Y'}
+
+
+def test_converted_dates_narrowed():
+    chunks = [pd.DataFrame({'day': pd.to_datetime(['2020-01-02', None]),
+                            'moment': pd.to_datetime(['2020-01-02 10:30', '2020-01-03 00:00'])})]
+    assert _kinds(TableSchema.infer(chunks)) == {'day': 'date', 'moment': 'timestamp'}
+    assert chunks[0]['day'][0] == datetime.date(2020, 1, 2)
+
+
+def test_streamed_chunks_convert_dates(tmp_path):
+    # Régression : le schéma échantillonné d'un chargement en flux laissait
+    # les colonnes de dates en TEXT
+    csv_path = tmp_path / 'crimes.csv'
+    csv_path.write_text('id,Date OCC\n1,01/02/2020 12:00:00 AM\n2,\n3,03/04/2021 10:15:00 PM\n')
+    chunks = list(PostgresLoader(None).read_csv_chunks(str(csv_path), chunksize=2))
+    assert all(pd.api.types.is_datetime64_any_dtype(chunk['date_occ']) for chunk in chunks)
+    assert chunks[1]['date_occ'][2] == pd.Timestamp(2021, 3, 4, 22, 15)
+    schema = TableSchema.infer(chunks[:1], exact=False)
+    assert _kinds(schema) == {'id': 'bigint', 'date_occ': 'timestamp'}
+
+
+def test_streamed_chunks_reject_other_date_formats(tmp_path):
+    csv_path = tmp_path / 'crimes.csv'
+    csv_path.write_text('id,day\n1,01/02/2020\n2,01/03/2020\n3,2020-01-04\n')
+    with pytest.raises(ValueError, match='day'):
+        list(PostgresLoader(None).read_csv_chunks(str(csv_path), chunksize=2))
@@ -0,0 +1,54 @@
+import pytest
+
+from src.database.timing_stats import TimingStats
+
+
+def test_outliers_rejected():
+    stats = TimingStats()
+    summary = stats.summarize([10.0, 11.0, 10.5, 9.5, 10.2, 1000.0])
+    assert summary['outliers'] == 1
+    assert summary['samples'] == 5
+    assert summary['max'] == pytest.approx(11.0)
+
+
+def test_summary_statistics():
+    summary = TimingStats().summarize([1.0, 2.0, 3.0, 4.0, 5.0])
+    assert summary['mean'] == pytest.approx(3.0)
+    assert summary['median'] == pytest.approx(3.0)
+    assert summary['min'] == 1.0 and summary['max'] == 5.0
+    assert summary['ci_low'] <= summary['mean'] <= summary['ci_high']
+    assert summary['p90'] <= summary['p95'] <= summary['p99']
+
+
+def test_summary_reproducible():
+    samples = [3.0, 1.0, 4.0, 1.5, 5.0, 9.0, 2.6]
+    assert TimingStats().summarize(samples) == TimingStats().summarize(samples)
+
+
+def test_single_sample():
+    summary = TimingStats().summarize([7.0])
+    assert summary['std'] == 0.0
+    assert summary['ci_low'] == summary['ci_high'] == 7.0
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        TimingStats().summarize([])
+    with pytest.raises(ValueError):
+        TimingStats(confidence=1.0)
+
+
+def test_converged():
+    stats = TimingStats()
+    assert not stats.converged([10.0] * 5, target_ci_width=0.05, min_samples=10)
+    assert stats.converged([10.0] * 10, target_ci_width=0.05, min_samples=10)
+    assert not stats.converged([1.0, 20.0] * 5, target_ci_width=0.05, min_samples=10)
+
+
+def test_verdict():
+    fast = {'ci_low': 1.0, 'ci_high': 2.0}
+    slow = {'ci_low': 3.0, 'ci_high': 4.0}
+    overlapping = {'ci_low': 1.5, 'ci_high': 3.5}
+    assert TimingStats.verdict(fast, slow) == 'postgres'
+    assert TimingStats.verdict(slow, fast) == 'monetdb'
+    assert TimingStats.verdict(fast, overlapping) is None